@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 class VideoCreateSchema(BaseModel):
@@ -5,6 +7,7 @@ class VideoCreateSchema(BaseModel):
     title: str
     file_path: str
     status: int
+    content_hash: Optional[str] = None
 
 class VideoUploadSchema(BaseModel):
     user_id: int
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class UploadSessionCreateSchema(BaseModel):
+    user_id: int
+    title: str
+    filename: str
+    content_type: Optional[str] = None
+    length: int = Field(..., gt=0, description="Tamanho total do arquivo em bytes")
+
+
+class PresignedUploadCompleteSchema(BaseModel):
+    upload_id: Optional[str] = None
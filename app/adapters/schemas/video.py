@@ -1,8 +1,21 @@
-from pydantic import BaseModel
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+# Entradas aceitas por chamada do endpoint interno de status em lote.
+MAX_BULK_STATUS_UPDATES = 1000
 
 class VideoResponseSchema(BaseModel):
     id: int
     user_id: int
     title: str
     file_path: str
-    status: int
\ No newline at end of file
+    status: int
+
+class VideoStatusUpdateSchema(BaseModel):
+    id: int
+    status: int = Field(..., ge=0, le=3)
+    file_path: Optional[str] = None
+
+class BulkStatusUpdateSchema(BaseModel):
+    updates: List[VideoStatusUpdateSchema] = Field(..., min_length=1, max_length=MAX_BULK_STATUS_UPDATES)
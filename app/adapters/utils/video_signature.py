@@ -0,0 +1,85 @@
+from pathlib import PurePath
+from typing import Optional
+
+# Bytes do início do arquivo suficientes para identificar o container.
+VIDEO_SIGNATURE_BYTES = 16
+
+# Átomos de topo que abrem arquivos ISO BMFF (MP4) e QuickTime (MOV).
+_ISO_BMFF_ATOMS = {b"ftyp", b"moov", b"mdat", b"wide", b"free", b"skip", b"pnot"}
+_EBML_MAGIC = b"\x1a\x45\xdf\xa3"
+_ASF_HEADER_GUID = bytes.fromhex("3026b2758e66cf11a6d900aa0062ce6c")
+
+
+def sniff_video_container(head: bytes) -> Optional[str]:
+    """Identifica o container pelos primeiros bytes; ``None`` se não for vídeo conhecido."""
+    if len(head) >= 8 and head[4:8] in _ISO_BMFF_ATOMS:
+        return "mp4"
+    if head.startswith(_EBML_MAGIC):
+        return "matroska"
+    if len(head) >= 12 and head.startswith(b"RIFF") and head[8:12] == b"AVI ":
+        return "avi"
+    if head.startswith(b"FLV\x01"):
+        return "flv"
+    if head.startswith(_ASF_HEADER_GUID):
+        return "asf"
+
+    return None
+
+
+# Extensões aceitas para cada container identificado.
+CONTAINER_EXTENSIONS = {
+    "mp4": {".mp4", ".mov"},
+    "matroska": {".mkv", ".webm"},
+    "avi": {".avi"},
+    "flv": {".flv"},
+    "asf": {".wmv"},
+}
+
+
+class VideoSignatureError(ValueError):
+    pass
+
+
+def check_video_signature(head: bytes, filename: str) -> str:
+    container = sniff_video_container(head)
+    if container is None:
+        raise VideoSignatureError("Conteúdo do arquivo não é um vídeo suportado")
+
+    extension = PurePath(filename or "").suffix.lower()
+    if extension not in CONTAINER_EXTENSIONS[container]:
+        raise VideoSignatureError(f"Conteúdo do arquivo ({container}) não corresponde à extensão {extension or '(vazia)'}")
+
+    return container
+
+
+class VideoSignatureValidator:
+    """
+    Validação incremental: acumula só os primeiros ``head_size`` bytes que
+    chegam e confere o container assim que há bytes suficientes, antes de o
+    resto do arquivo ser persistido.
+    """
+
+    def __init__(self, filename: str, head_size: int = VIDEO_SIGNATURE_BYTES):
+        self.filename = filename
+        self.head_size = head_size
+        self.container: Optional[str] = None
+        self._head = bytearray()
+
+    @property
+    def done(self) -> bool:
+        return self.container is not None
+
+    def feed(self, data: bytes) -> bool:
+        if not self.done:
+            self._head.extend(data[:self.head_size - len(self._head)])
+            if len(self._head) >= self.head_size:
+                self.container = check_video_signature(bytes(self._head), self.filename)
+
+        return self.done
+
+    def finish(self) -> str:
+        # Arquivo menor que head_size: valida com o que chegou.
+        if not self.done:
+            self.container = check_video_signature(bytes(self._head), self.filename)
+
+        return self.container
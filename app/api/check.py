@@ -1,6 +1,14 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from app.infrastructure.db.database import get_db
+from app.infrastructure.db.database import engine, get_db
+from app.infrastructure.db.pool_metrics import pool_status
+from app.infrastructure.security.token_cache import get_token_cache
+from app.infrastructure.concurrency.bounded_executor import get_upload_executor
+from app.infrastructure.cache.video_list_cache import get_video_list_cache
+from app.infrastructure.events.status_hub import get_status_hub
+from app.gateways.outbox_relay import get_outbox_relay
+from app.infrastructure.observability.logging_config import log_pipeline_stats
+from app.infrastructure.config.settings import get_settings
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -10,4 +18,34 @@ def health_check():
 
 @router.get("/db")
 def health_db_check(db: Session = Depends(get_db)):
-    return {"status": "connected"}
\ No newline at end of file
+    return {"status": "connected"}
+
+@router.get("/db/pool")
+def health_db_pool():
+    return {"status": "ok", "pool": pool_status(engine)}
+
+@router.get("/auth/token-cache")
+def health_token_cache():
+    return {"status": "ok", "token_cache": get_token_cache().stats()}
+
+@router.get("/executor")
+def health_executor():
+    return {"status": "ok", "upload_executor": get_upload_executor().stats()}
+
+@router.get("/cache")
+def health_cache():
+    return {"status": "ok", "video_list_cache": get_video_list_cache().stats()}
+
+@router.get("/events")
+def health_events():
+    return {"status": "ok", "status_hub": get_status_hub().stats()}
+
+@router.get("/outbox")
+def health_outbox():
+    if not get_settings().queue.outbox_enabled:
+        return {"status": "disabled"}
+    return {"status": "ok", "outbox": get_outbox_relay().stats()}
+
+@router.get("/logging")
+def health_logging():
+    return {"status": "ok", "logging": log_pipeline_stats()}
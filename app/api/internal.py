@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.database import get_db
+from app.dao.video_dao import VideoDAO
+from app.adapters.schemas.video import BulkStatusUpdateSchema
+from app.controllers.video_status_controller import BulkStatusUpdateResponse, VideoStatusController
+from app.controllers.upload_expiry_controller import ExpiredUploadsResponse, UploadExpiryController
+from app.gateways.video_processing_gateway import VideoProcessingGateway
+from app.gateways.sqs_producer import SQSProducer
+from app.api.upload import (
+    get_presigned_controller,
+    get_processing_gateway,
+    get_resumable_controller,
+    get_sqs_producer,
+)
+from app.infrastructure.security.auth import require_internal_token
+
+router = APIRouter(prefix="/internal", tags=["internal"], dependencies=[Depends(require_internal_token)])
+
+
+@router.post("/videos/status", response_model=BulkStatusUpdateResponse, responses={
+    403: {"description": "Header X-Internal-Token ausente ou inválido"},
+})
+def bulk_update_video_status(payload: BulkStatusUpdateSchema, db: Session = Depends(get_db)):
+    # Callback do worker/sweeper: aplica o lote numa transação e responde com os vídeos atualizados.
+    controller = VideoStatusController(VideoDAO(db))
+
+    return controller.bulk_update_status(payload.updates)
+
+
+@router.post("/uploads/expire", response_model=ExpiredUploadsResponse, responses={
+    403: {"description": "Header X-Internal-Token ausente ou inválido"},
+})
+def expire_abandoned_uploads(
+    db: Session = Depends(get_db),
+    processing_gateway: VideoProcessingGateway = Depends(get_processing_gateway),
+    sqs_producer: SQSProducer = Depends(get_sqs_producer),
+):
+    # Chamado periodicamente (cron/sweeper): encerra uploads diretos e sessões resumíveis abandonados.
+    try:
+        presigned_use_case = get_presigned_controller(db, processing_gateway, sqs_producer).use_case
+    except HTTPException:
+        # Sem bucket configurado não há upload pré-assinado para expirar.
+        presigned_use_case = None
+
+    resumable_use_case = get_resumable_controller(db, processing_gateway, sqs_producer).use_case
+
+    return UploadExpiryController(presigned_use_case, resumable_use_case).expire()
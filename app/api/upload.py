@@ -1,17 +1,57 @@
-import os
+import json
+from contextlib import nullcontext
 
-from fastapi import APIRouter, File, UploadFile, Form, Depends, HTTPException, status, Path
+from fastapi import APIRouter, File, UploadFile, Form, Depends, Header, HTTPException, Query, Request, Response, status, Path
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path as PathlibPath
 
 from app.infrastructure.db.database import get_db
+from app.infrastructure.db.async_database import get_async_db
 from app.dao.video_dao import VideoDAO
+from app.dao.async_video_dao import AsyncVideoDAO
 from app.gateways.video_processing_gateway import VideoProcessingGateway
 from app.gateways.sqs_producer import SQSProducer
+from app.gateways.sqs_batch_producer import get_shared_sqs_producer
+from app.dao.upload_session_dao import UploadSessionDAO
+from app.dao.content_object_dao import ContentObjectDAO
 from app.use_cases.upload_use_case import UploadUseCase
+from app.use_cases.batch_upload_use_case import BatchUploadItem, BatchUploadUseCase
+from app.use_cases.resumable_upload_use_case import (
+    ResumableUploadUseCase,
+    UploadOffsetConflictError,
+    UploadSessionNotFoundError,
+    UploadSessionStateError,
+)
 from app.controllers.upload_controller import UploadController
+from app.controllers.batch_upload_controller import BatchUploadController, BatchUploadResponse
+from app.controllers.resumable_upload_controller import ResumableUploadController, UploadSessionResponse
+from app.controllers.presigned_upload_controller import PresignedUploadController, PresignedUploadResponse
+from app.use_cases.presigned_upload_use_case import (
+    PresignedUploadNotFoundError,
+    PresignedUploadStateError,
+    PresignedUploadUseCase,
+    UploadVerificationError,
+)
+from app.gateways.resumable_storage import ResumableChunkError
+from app.adapters.utils.video_signature import (
+    VIDEO_SIGNATURE_BYTES,
+    VideoSignatureError,
+    VideoSignatureValidator,
+    check_video_signature,
+)
+from app.adapters.schemas.upload_session import PresignedUploadCompleteSchema, UploadSessionCreateSchema
 from app.controllers.list_videos_controller import ListVideosController, VideoListResponse
 from app.adapters.presenters.video_presenter import VideoResponse
 from app.infrastructure.security.auth import get_current_user, enforce_same_user, AuthenticatedUser
+from app.infrastructure.api.multipart_stream import MultipartUploadStream
+from app.infrastructure.api.conditional import etag_matches
+from app.infrastructure.api.chunk_body import spool_request_body
+from app.infrastructure.config.settings import DEFAULT_MAX_UPLOAD_SIZE_MB, get_settings
+from app.infrastructure.concurrency.bounded_executor import ExecutorSaturatedError, get_upload_executor
+from app.infrastructure.cache.video_list_cache import get_video_list_cache
+from app.infrastructure.events.status_hub import get_status_hub
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 
@@ -25,7 +65,14 @@ VALID_VIDEO_CONTENT_TYPES = {
     "video/x-flv",
     "video/webm",
 }
-DEFAULT_MAX_UPLOAD_SIZE_MB = 100
+DEFAULT_LIST_PAGE_SIZE = 50
+MAX_LIST_PAGE_SIZE = 200
+MAX_LONG_POLL_WAIT_SECONDS = 60
+SSE_KEEPALIVE_SECONDS = 15
+SSE_RETRY_MILLISECONDS = 3000
+# Folga para boundary e cabeçalhos das partes ao comparar com o Content-Length.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+CHUNK_CONTENT_TYPE = "application/offset+octet-stream"
 
 
 def is_valid_video_file(filename: str) -> bool:
@@ -41,15 +88,24 @@ def is_valid_video_content_type(content_type: str | None) -> bool:
     return normalized_type in VALID_VIDEO_CONTENT_TYPES
 
 
-def get_max_upload_size_bytes() -> int:
-    raw_value = os.getenv("MAX_UPLOAD_SIZE_MB", str(DEFAULT_MAX_UPLOAD_SIZE_MB))
+def read_head_bytes(fileobj, size: int = VIDEO_SIGNATURE_BYTES) -> bytes:
+    position = fileobj.tell()
+    try:
+        return fileobj.read(size)
+    finally:
+        fileobj.seek(position)
+
+
+def validate_video_signature(head: bytes, filename: str) -> None:
+    # Extensão e Content-Type vêm do cliente; o container é conferido pelos primeiros bytes.
     try:
-        max_mb = int(raw_value)
-        if max_mb <= 0:
-            raise ValueError()
-        return max_mb * 1024 * 1024
-    except (ValueError, TypeError):
-        return DEFAULT_MAX_UPLOAD_SIZE_MB * 1024 * 1024
+        check_video_signature(head, filename)
+    except VideoSignatureError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def get_max_upload_size_bytes() -> int:
+    return get_settings().limits.max_upload_size_bytes
 
 
 def is_valid_video_size(upload_file: UploadFile, max_size_bytes: int) -> bool:
@@ -71,8 +127,24 @@ def get_processing_gateway():
 
     return VideoProcessingGateway(base_dir=base_dir)
 
-def get_sqs_producer():
-    return SQSProducer()
+def get_sqs_producer() -> SQSProducer:
+    return get_shared_sqs_producer()
+
+def get_content_dao(db) -> ContentObjectDAO | None:
+    return ContentObjectDAO(db) if get_settings().storage.dedup_enabled else None
+
+
+async def run_upload_job(fn, *args, **kwargs):
+    # Cópia de arquivo, boto3, commit e SQS são bloqueantes: rodam no executor
+    # dedicado para não travar o event loop.
+    try:
+        return await get_upload_executor().run(fn, *args, **kwargs)
+    except ExecutorSaturatedError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Serviço de upload sobrecarregado, tente novamente em instantes",
+            headers={"Retry-After": "5"},
+        )
 
 
 @router.post("/video", response_model=VideoResponse, status_code=status.HTTP_201_CREATED, responses={
@@ -85,7 +157,8 @@ def get_sqs_producer():
                 }
             }
         }
-    }
+    },
+    503: {"description": "Executor de upload saturado"},
 })
 async def upload_and_process_video(
     user_id: int = Form(...),
@@ -109,29 +182,541 @@ async def upload_and_process_video(
             detail=f"Arquivo excede o limite de {max_size_mb}MB",
         )
 
+    validate_video_signature(read_head_bytes(file.file), file.filename)
+
     video_dao = VideoDAO(db)
-    use_case = UploadUseCase(processing_gateway=processing_gateway, video_dao=video_dao, sqs_producer=sqs_producer)
+    use_case = UploadUseCase(
+        processing_gateway=processing_gateway,
+        video_dao=video_dao,
+        sqs_producer=sqs_producer,
+        content_dao=get_content_dao(db),
+    )
     controller = UploadController(use_case)
 
-    response = controller.upload_video(user_id=user_id, title=title, upload_file=file)
+    response = await run_upload_job(controller.upload_video, user_id=user_id, title=title, upload_file=file)
 
     return response
 
-@router.get("/videos/{user_id}", response_model=VideoListResponse, status_code=status.HTTP_200_OK)
+def _batch_item(file: UploadFile, title: str | None, max_size_bytes: int, seen: set) -> BatchUploadItem:
+    filename = PathlibPath(file.filename or "").name
+    item = BatchUploadItem(filename=filename, title=title or PathlibPath(filename).stem, upload_file=file)
+
+    if not is_valid_video_file(filename) or not is_valid_video_content_type(file.content_type):
+        item.error = "Formato de arquivo não suportado"
+    elif filename in seen:
+        # Todos os arquivos do lote usam o mesmo timestamp no nome gravado.
+        item.error = "Arquivo com nome repetido no lote"
+    elif not is_valid_video_size(file, max_size_bytes):
+        item.error = f"Arquivo excede o limite de {max_size_bytes // (1024 * 1024)}MB"
+    else:
+        try:
+            validate_video_signature(read_head_bytes(file.file), filename)
+        except HTTPException as e:
+            item.error = e.detail
+
+    seen.add(filename)
+    return item
+
+
+@router.post("/videos/batch", response_model=BatchUploadResponse, status_code=status.HTTP_201_CREATED, responses={
+    207: {"description": "Parte dos arquivos falhou; veja results[].error"},
+    400: {"description": "Lote vazio ou acima do limite de arquivos"},
+    503: {"description": "Executor de upload saturado"},
+})
+async def upload_video_batch(
+    response: Response,
+    user_id: int = Form(...),
+    files: list[UploadFile] = File(...),
+    titles: list[str] | None = Form(None, description="Título de cada arquivo, na mesma ordem; padrão: nome do arquivo"),
+    db = Depends(get_db),
+    processing_gateway: VideoProcessingGateway = Depends(get_processing_gateway),
+    sqs_producer: SQSProducer = Depends(get_sqs_producer),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    enforce_same_user(user_id, current_user)
+
+    limits = get_settings().limits
+    if len(files) > limits.batch_upload_max_files:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Máximo de {limits.batch_upload_max_files} arquivos por lote",
+        )
+
+    titles = titles or []
+    max_size_bytes = get_max_upload_size_bytes()
+    seen = set()
+    items = [
+        _batch_item(file, titles[index] if index < len(titles) else None, max_size_bytes, seen)
+        for index, file in enumerate(files)
+    ]
+
+    use_case = BatchUploadUseCase(
+        UploadUseCase(
+            processing_gateway=processing_gateway,
+            video_dao=VideoDAO(db),
+            sqs_producer=sqs_producer,
+            content_dao=get_content_dao(db),
+        ),
+        concurrency=limits.batch_upload_concurrency,
+    )
+    controller = BatchUploadController(use_case)
+
+    result = await run_upload_job(controller.upload_batch, user_id, items)
+    if result.failed:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+
+    return result
+
+
+def _parse_stream_fields(fields: dict) -> tuple[int, str]:
+    try:
+        return int(fields["user_id"]), fields["title"]
+    except (KeyError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Campos user_id e title devem ser enviados antes do arquivo",
+        )
+
+
+@router.post("/video/stream", response_model=VideoResponse, status_code=status.HTTP_201_CREATED, responses={
+    400: {"description": "Erro de validação"},
+    413: {"description": "Arquivo excede o limite de tamanho"},
+    503: {"description": "Executor de upload saturado"},
+})
+async def upload_and_process_video_stream(
+    request: Request,
+    db = Depends(get_db),
+    processing_gateway: VideoProcessingGateway = Depends(get_processing_gateway),
+    sqs_producer: SQSProducer = Depends(get_sqs_producer),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    max_size_bytes = get_max_upload_size_bytes()
+    max_size_mb = max_size_bytes // (1024 * 1024)
+
+    if not request.headers.get("content-type", "").lower().startswith("multipart/form-data"):
+        raise HTTPException(status_code=400, detail="Content-Type deve ser multipart/form-data")
+
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_size_bytes + MULTIPART_OVERHEAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Arquivo excede o limite de {max_size_mb}MB",
+        )
+
+    video_dao = VideoDAO(db)
+    use_case = UploadUseCase(
+        processing_gateway=processing_gateway,
+        video_dao=video_dao,
+        sqs_producer=sqs_producer,
+        content_dao=get_content_dao(db),
+    )
+    controller = UploadController(use_case)
+    timestamp = use_case.new_timestamp()
+
+    def validate_file_part(filename: str, content_type: str | None, fields: dict) -> None:
+        user_id, _ = _parse_stream_fields(fields)
+        enforce_same_user(user_id, current_user)
+
+        if not is_valid_video_file(filename) or not is_valid_video_content_type(content_type):
+            raise HTTPException(status_code=400, detail="Formato de arquivo não suportado")
+
+    stream = MultipartUploadStream(
+        headers=request.headers,
+        stream=request.stream(),
+        open_sink=lambda filename: processing_gateway.open_upload_sink(filename, timestamp),
+        max_size_bytes=max_size_bytes,
+        on_file_start=validate_file_part,
+        open_validator=VideoSignatureValidator,
+        discard_saved=processing_gateway.discard_upload,
+    )
+    uploaded = await stream.parse()
+
+    if uploaded.saved_path is None:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Arquivo obrigatório")
+
+    try:
+        user_id, title = _parse_stream_fields(uploaded.fields)
+    except HTTPException:
+        # Campos chegaram depois do arquivo e são inválidos: o arquivo salvo não terá vídeo.
+        await run_in_threadpool(processing_gateway.discard_upload, uploaded.saved_path)
+        raise
+
+    return await run_upload_job(
+        controller.register_streamed_video,
+        user_id=user_id,
+        title=title,
+        saved_path=uploaded.saved_path,
+        timestamp=timestamp,
+        content_hash=uploaded.sha256,
+    )
+
+
+def _validate_declared_upload(payload: UploadSessionCreateSchema, current_user) -> tuple[str, str]:
+    enforce_same_user(payload.user_id, current_user)
+
+    filename = PathlibPath(payload.filename).name
+    content_type = payload.content_type or "video/mp4"
+    if not is_valid_video_file(filename) or not is_valid_video_content_type(content_type):
+        raise HTTPException(status_code=400, detail="Formato de arquivo não suportado")
+
+    max_size_bytes = get_settings().limits.resumable_max_upload_size_bytes
+    if payload.length > max_size_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Arquivo excede o limite de {max_size_bytes // (1024 * 1024)}MB",
+        )
+
+    return filename, content_type
+
+
+def get_resumable_controller(db, processing_gateway: VideoProcessingGateway, sqs_producer: SQSProducer):
+    use_case = ResumableUploadUseCase(
+        session_dao=UploadSessionDAO(db),
+        storage=processing_gateway.resumable_storage(),
+        upload_use_case=UploadUseCase(
+            processing_gateway=processing_gateway,
+            video_dao=VideoDAO(db),
+            sqs_producer=sqs_producer,
+            content_dao=get_content_dao(db),
+        ),
+        session_ttl_hours=get_settings().limits.resumable_session_ttl_hours,
+    )
+
+    return ResumableUploadController(use_case)
+
+
+def _session_headers(upload_session: UploadSessionResponse) -> dict:
+    return {
+        "Upload-Offset": str(upload_session.offset),
+        "Upload-Length": str(upload_session.length),
+        "Upload-Expires": upload_session.expires_at.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+        "Cache-Control": "no-store",
+    }
+
+
+async def run_session_job(fn, *args, **kwargs):
+    return await _session_errors_to_http(run_upload_job(fn, *args, **kwargs))
+
+
+async def run_session_lookup(fn, *args, **kwargs):
+    # Leitura curta (offset para retomar, dono da sessão): threadpool comum, para
+    # não receber 503 quando as escritas pesadas lotam o executor de upload.
+    return await _session_errors_to_http(run_in_threadpool(fn, *args, **kwargs))
+
+
+async def _session_errors_to_http(job):
+    try:
+        return await job
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except UploadOffsetConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+            headers={"Upload-Offset": str(e.current_offset)},
+        )
+    except UploadSessionStateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ResumableChunkError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+async def _get_owned_session(controller: ResumableUploadController, session_id: str, current_user) -> UploadSessionResponse:
+    upload_session = await run_session_lookup(controller.get_session, session_id)
+    enforce_same_user(upload_session.user_id, current_user)
+
+    return upload_session
+
+
+@router.post("/sessions", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED, responses={
+    400: {"description": "Formato de arquivo não suportado"},
+    413: {"description": "Tamanho declarado excede o limite do upload resumível"},
+})
+async def create_upload_session(
+    payload: UploadSessionCreateSchema,
+    response: Response,
+    db = Depends(get_db),
+    processing_gateway: VideoProcessingGateway = Depends(get_processing_gateway),
+    sqs_producer: SQSProducer = Depends(get_sqs_producer),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    filename, content_type = _validate_declared_upload(payload, current_user)
+    controller = get_resumable_controller(db, processing_gateway, sqs_producer)
+    upload_session = await run_session_job(
+        controller.create_session,
+        user_id=payload.user_id,
+        title=payload.title,
+        filename=filename,
+        content_type=content_type,
+        length=payload.length,
+    )
+
+    response.headers.update(_session_headers(upload_session))
+    response.headers["Location"] = f"{router.prefix}/sessions/{upload_session.id}"
+
+    return upload_session
+
+
+@router.head("/sessions/{session_id}", status_code=status.HTTP_200_OK, responses={
+    404: {"description": "Sessão inexistente ou expirada"},
+})
+async def get_upload_session_offset(
+    session_id: str = Path(..., description="ID da sessão de upload"),
+    db = Depends(get_db),
+    processing_gateway: VideoProcessingGateway = Depends(get_processing_gateway),
+    sqs_producer: SQSProducer = Depends(get_sqs_producer),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    controller = get_resumable_controller(db, processing_gateway, sqs_producer)
+    upload_session = await _get_owned_session(controller, session_id, current_user)
+
+    return Response(status_code=status.HTTP_200_OK, headers=_session_headers(upload_session))
+
+
+@router.patch("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT, responses={
+    409: {"description": "Upload-Offset diferente do offset atual da sessão"},
+    413: {"description": "Chunk excede o limite ou o tamanho declarado"},
+    415: {"description": "Content-Type deve ser application/offset+octet-stream"},
+})
+async def append_upload_chunk(
+    request: Request,
+    session_id: str = Path(..., description="ID da sessão de upload"),
+    upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+    db = Depends(get_db),
+    processing_gateway: VideoProcessingGateway = Depends(get_processing_gateway),
+    sqs_producer: SQSProducer = Depends(get_sqs_producer),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    content_type = request.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    if content_type != CHUNK_CONTENT_TYPE:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Content-Type deve ser {CHUNK_CONTENT_TYPE}",
+        )
+
+    controller = get_resumable_controller(db, processing_gateway, sqs_producer)
+    upload_session = await _get_owned_session(controller, session_id, current_user)
+
+    # Rejeita antes de ler o corpo: o cliente deve retomar do offset devolvido.
+    if upload_offset != upload_session.offset:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Offset divergente; offset atual da sessão: {upload_session.offset}",
+            headers={"Upload-Offset": str(upload_session.offset)},
+        )
+
+    max_chunk_bytes = min(
+        get_settings().limits.resumable_max_chunk_size_bytes,
+        upload_session.length - upload_session.offset,
+    )
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_chunk_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Chunk excede o limite de {max_chunk_bytes} bytes",
+        )
+
+    chunk, size = await spool_request_body(request.stream(), max_chunk_bytes)
+    try:
+        if upload_offset == 0:
+            validate_video_signature(read_head_bytes(chunk), upload_session.filename)
+        upload_session = await run_session_job(controller.append_chunk, session_id, upload_offset, chunk, size)
+    finally:
+        chunk.close()
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT, headers=_session_headers(upload_session))
+
+
+@router.post("/sessions/{session_id}/finalize", response_model=VideoResponse, status_code=status.HTTP_201_CREATED, responses={
+    409: {"description": "Upload incompleto ou sessão em uso"},
+    503: {"description": "Executor de upload saturado"},
+})
+async def finalize_upload_session(
+    session_id: str = Path(..., description="ID da sessão de upload"),
+    db = Depends(get_db),
+    processing_gateway: VideoProcessingGateway = Depends(get_processing_gateway),
+    sqs_producer: SQSProducer = Depends(get_sqs_producer),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    controller = get_resumable_controller(db, processing_gateway, sqs_producer)
+    await _get_owned_session(controller, session_id, current_user)
+
+    return await run_session_job(controller.finalize, session_id)
+
+
+@router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_upload_session(
+    session_id: str = Path(..., description="ID da sessão de upload"),
+    db = Depends(get_db),
+    processing_gateway: VideoProcessingGateway = Depends(get_processing_gateway),
+    sqs_producer: SQSProducer = Depends(get_sqs_producer),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    controller = get_resumable_controller(db, processing_gateway, sqs_producer)
+    await _get_owned_session(controller, session_id, current_user)
+    await run_session_job(controller.abort, session_id)
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def get_presigned_controller(db, processing_gateway: VideoProcessingGateway, sqs_producer: SQSProducer):
+    use_case = PresignedUploadUseCase(
+        gateway=processing_gateway.presigned_gateway(),
+        upload_use_case=UploadUseCase(
+            processing_gateway=processing_gateway, video_dao=VideoDAO(db), sqs_producer=sqs_producer
+        ),
+    )
+
+    return PresignedUploadController(use_case)
+
+
+async def run_presigned_job(fn, *args, **kwargs):
+    return await _presigned_errors_to_http(run_upload_job(fn, *args, **kwargs))
+
+
+async def run_presigned_lookup(fn, *args, **kwargs):
+    return await _presigned_errors_to_http(run_in_threadpool(fn, *args, **kwargs))
+
+
+async def _presigned_errors_to_http(job):
+    try:
+        return await job
+    except PresignedUploadNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except PresignedUploadStateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except UploadVerificationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+
+@router.post("/presigned", response_model=PresignedUploadResponse, status_code=status.HTTP_201_CREATED, responses={
+    400: {"description": "Formato de arquivo não suportado"},
+    413: {"description": "Tamanho declarado excede o limite"},
+})
+async def create_presigned_upload(
+    payload: UploadSessionCreateSchema,
+    db = Depends(get_db),
+    processing_gateway: VideoProcessingGateway = Depends(get_processing_gateway),
+    sqs_producer: SQSProducer = Depends(get_sqs_producer),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    filename, content_type = _validate_declared_upload(payload, current_user)
+    controller = get_presigned_controller(db, processing_gateway, sqs_producer)
+
+    return await run_presigned_job(
+        controller.create,
+        user_id=payload.user_id,
+        title=payload.title,
+        filename=filename,
+        content_type=content_type,
+        length=payload.length,
+    )
+
+
+@router.post("/presigned/{video_id}/complete", response_model=VideoResponse, status_code=status.HTTP_200_OK, responses={
+    404: {"description": "Vídeo não encontrado"},
+    409: {"description": "Objeto ainda não enviado ou upload já rejeitado"},
+    422: {"description": "Objeto enviado não confere (tamanho ou conteúdo); vídeo marcado com erro"},
+})
+async def complete_presigned_upload(
+    video_id: int = Path(..., description="ID do vídeo retornado na criação"),
+    payload: PresignedUploadCompleteSchema | None = None,
+    db = Depends(get_db),
+    processing_gateway: VideoProcessingGateway = Depends(get_processing_gateway),
+    sqs_producer: SQSProducer = Depends(get_sqs_producer),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    controller = get_presigned_controller(db, processing_gateway, sqs_producer)
+    enforce_same_user(await run_presigned_lookup(controller.get_video_owner, video_id), current_user)
+
+    return await run_presigned_job(controller.complete, video_id, payload.upload_id if payload else None)
+
+
+@router.get("/videos/{user_id}", response_model=VideoListResponse, status_code=status.HTTP_200_OK, responses={
+    304: {"description": "Listagem não mudou desde o ETag enviado em If-None-Match"},
+})
 async def list_user_videos(
+    response: Response,
     user_id: int = Path(..., description="ID do usuário"),
-    db = Depends(get_db),
+    limit: int = Query(DEFAULT_LIST_PAGE_SIZE, ge=1, le=MAX_LIST_PAGE_SIZE, description="Itens por página"),
+    after_id: int | None = Query(None, ge=1, description="Cursor: next_cursor da página anterior"),
+    if_none_match: str | None = Header(None),
+    wait: int = Query(0, ge=0, le=MAX_LONG_POLL_WAIT_SECONDS, description="Long-poll: segundos para aguardar mudança quando o ETag casa"),
+    db = Depends(get_async_db),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
         enforce_same_user(user_id, current_user)
 
-        video_dao = VideoDAO(db)
+        video_dao = AsyncVideoDAO(db)
         controller = ListVideosController(video_dao)
-        
-        return controller.list_user_videos(user_id)
+        cache = get_video_list_cache()
+
+        async def current_etag():
+            return await cache.get_or_load_async(
+                user_id,
+                ("etag", limit, after_id),
+                lambda: controller.listing_etag_async(user_id, limit=limit, after_id=after_id),
+            )
+
+        # Assina antes de calcular o ETag para não perder uma transição entre os dois passos.
+        subscription = get_status_hub().subscribe(user_id) if wait else None
+        with subscription or nullcontext():
+            etag = await current_etag()
+
+            if subscription is not None and etag_matches(if_none_match, etag):
+                # Devolve a conexão ao pool enquanto o cliente espera.
+                await db.close()
+                if await subscription.get(timeout=wait) is not None:
+                    cache.invalidate(user_id)
+                    etag = await current_etag()
+
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response.headers.update(headers)
+
+        async def load_page():
+            page = await controller.list_user_videos_async(user_id, limit=limit, after_id=after_id)
+            return jsonable_encoder(page)
+
+        return await cache.get_or_load_async(user_id, (limit, after_id), load_page)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
-        )
\ No newline at end of file
+        )
+
+
+def _format_sse(event: dict) -> str:
+    return f"event: status\nid: {event['video_id']}:{event['status']}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/videos/{user_id}/events", responses={
+    200: {"description": "Stream text/event-stream com as transições de status dos vídeos do usuário"},
+})
+async def stream_video_status_events(
+    request: Request,
+    user_id: int = Path(..., description="ID do usuário"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    enforce_same_user(user_id, current_user)
+
+    async def event_stream():
+        with get_status_hub().subscribe(user_id) as subscription:
+            yield f"retry: {SSE_RETRY_MILLISECONDS}\n\n"
+
+            while not await request.is_disconnected():
+                event = await subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _format_sse(event)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
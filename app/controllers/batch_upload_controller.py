@@ -0,0 +1,60 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from app.use_cases.batch_upload_use_case import BatchUploadItem, BatchUploadUseCase
+from app.adapters.schemas.video import VideoResponseSchema
+
+
+class BatchUploadItemResponse(BaseModel):
+    filename: str
+    status: str
+    data: Optional[VideoResponseSchema] = None
+    error: Optional[str] = None
+
+
+class BatchUploadResponse(BaseModel):
+    status: str
+    created: int
+    failed: int
+    results: List[BatchUploadItemResponse]
+
+
+class BatchUploadController:
+    def __init__(self, use_case: BatchUploadUseCase):
+        self.use_case = use_case
+
+    def upload_batch(self, user_id: int, items: List[BatchUploadItem]) -> BatchUploadResponse:
+        items = self.use_case.execute(user_id, items)
+
+        results = [self._present_item(item) for item in items]
+        created = sum(1 for result in results if result.status == "created")
+        failed = len(results) - created
+
+        if failed == 0:
+            status = "success"
+        elif created == 0:
+            status = "error"
+        else:
+            status = "partial"
+
+        return BatchUploadResponse(status=status, created=created, failed=failed, results=results)
+
+    @staticmethod
+    def _present_item(item: BatchUploadItem) -> BatchUploadItemResponse:
+        if item.video is None:
+            return BatchUploadItemResponse(
+                filename=item.filename, status="error", error=item.error or "Falha ao registrar vídeo"
+            )
+
+        return BatchUploadItemResponse(
+            filename=item.filename,
+            status="created",
+            data=VideoResponseSchema(
+                id=item.video.id,
+                user_id=item.video.user_id,
+                title=item.video.title,
+                file_path=item.video.file_path,
+                status=item.video.status,
+            ),
+        )
@@ -1,4 +1,5 @@
-from typing import List
+import hashlib
+from typing import List, Optional
 from app.dao.video_dao import VideoDAO
 from app.adapters.schemas.video import VideoResponseSchema
 from pydantic import BaseModel
@@ -7,14 +8,57 @@ from pydantic import BaseModel
 class VideoListResponse(BaseModel):
     status: str
     data: List[VideoResponseSchema]
+    next_cursor: Optional[int] = None
 
 
 class ListVideosController:
     def __init__(self, video_dao: VideoDAO):
         self.video_dao = video_dao
 
-    def list_user_videos(self, user_id: int) -> VideoListResponse:
-        videos = self.video_dao.list_videos_by_user(user_id)
+    def list_user_videos(self, user_id: int, limit: int = None, after_id: int = None) -> VideoListResponse:
+        videos = self.video_dao.list_videos_by_user(user_id, **self._page_kwargs(limit, after_id))
+
+        return self._present(videos, limit)
+
+    async def list_user_videos_async(self, user_id: int, limit: int = None, after_id: int = None) -> VideoListResponse:
+        videos = await self.video_dao.list_videos_by_user(user_id, **self._page_kwargs(limit, after_id))
+
+        return self._present(videos, limit)
+
+    # O ETag é o hash dos campos que a página devolve: qualquer escrita que mude
+    # o corpo (inclusive título ou file_path com o mesmo status) muda o ETag.
+    def listing_etag(self, user_id: int, limit: int = None, after_id: int = None) -> str:
+        videos = self.video_dao.list_videos_by_user(user_id, **self._page_kwargs(limit, after_id))
+
+        return self.build_etag(user_id, videos, limit, after_id)
+
+    async def listing_etag_async(self, user_id: int, limit: int = None, after_id: int = None) -> str:
+        videos = await self.video_dao.list_videos_by_user(user_id, **self._page_kwargs(limit, after_id))
+
+        return self.build_etag(user_id, videos, limit, after_id)
+
+    @staticmethod
+    def build_etag(user_id: int, videos, limit: Optional[int], after_id: Optional[int]) -> str:
+        digest = hashlib.sha256(f"{user_id}|{limit}|{after_id}".encode())
+        for video in videos:
+            digest.update(repr((video.id, video.title, video.file_path, video.status)).encode())
+        return f'"{digest.hexdigest()[:32]}"'
+
+    @staticmethod
+    def _page_kwargs(limit: Optional[int], after_id: Optional[int]) -> dict:
+        kwargs = {}
+        if limit is not None:
+            # Busca um item a mais só para saber se existe próxima página.
+            kwargs["limit"] = limit + 1
+        if after_id is not None:
+            kwargs["after_id"] = after_id
+        return kwargs
+
+    def _present(self, videos, limit: Optional[int] = None) -> VideoListResponse:
+        next_cursor = None
+        if limit is not None and len(videos) > limit:
+            videos = videos[:limit]
+            next_cursor = videos[-1].id
 
         response_data = [
             VideoResponseSchema(
@@ -27,4 +71,4 @@ class ListVideosController:
             for video in videos
         ]
 
-        return VideoListResponse(status="success", data=response_data)
+        return VideoListResponse(status="success", data=response_data, next_cursor=next_cursor)
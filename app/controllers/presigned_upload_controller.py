@@ -0,0 +1,42 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.use_cases.presigned_upload_use_case import PresignedUploadUseCase
+from app.controllers.upload_controller import UploadController
+from app.adapters.presenters.video_presenter import VideoResponse
+
+
+class PresignedPart(BaseModel):
+    part_number: int
+    size: int
+    url: str
+
+
+class PresignedUploadResponse(BaseModel):
+    video_id: int
+    method: str
+    expires_in: int
+    url: Optional[str] = None
+    headers: Dict[str, str] = {}
+    upload_id: Optional[str] = None
+    part_size: Optional[int] = None
+    parts: List[PresignedPart] = []
+
+
+class PresignedUploadController:
+    def __init__(self, use_case: PresignedUploadUseCase):
+        self.use_case = use_case
+
+    def create(self, user_id: int, title: str, filename: str, content_type: str, length: int) -> PresignedUploadResponse:
+        video, instructions = self.use_case.create(user_id, title, filename, content_type, length)
+
+        return PresignedUploadResponse(video_id=video.id, **instructions)
+
+    def get_video_owner(self, video_id: int) -> int:
+        return self.use_case.get_video(video_id).user_id
+
+    def complete(self, video_id: int, upload_id: Optional[str] = None) -> VideoResponse:
+        video = self.use_case.complete(video_id, upload_id)
+
+        return UploadController(self.use_case.upload_use_case)._present(video)
@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.use_cases.resumable_upload_use_case import ResumableUploadUseCase
+from app.controllers.upload_controller import UploadController
+from app.adapters.presenters.video_presenter import VideoResponse
+
+
+class UploadSessionResponse(BaseModel):
+    id: str
+    user_id: int
+    title: str
+    filename: str
+    length: int
+    offset: int
+    expires_at: datetime
+    video_id: Optional[int] = None
+
+
+class ResumableUploadController:
+    def __init__(self, use_case: ResumableUploadUseCase):
+        self.use_case = use_case
+
+    def create_session(self, user_id: int, title: str, filename: str, content_type: str, length: int) -> UploadSessionResponse:
+        upload_session = self.use_case.create_session(user_id, title, filename, content_type, length)
+
+        return self._present(upload_session)
+
+    def get_session(self, session_id: str) -> UploadSessionResponse:
+        return self._present(self.use_case.get_session(session_id))
+
+    def append_chunk(self, session_id: str, offset: int, chunk, size: int) -> UploadSessionResponse:
+        return self._present(self.use_case.append_chunk(session_id, offset, chunk, size))
+
+    def finalize(self, session_id: str) -> VideoResponse:
+        created_video = self.use_case.finalize(session_id)
+
+        return UploadController(self.use_case.upload_use_case)._present(created_video)
+
+    def abort(self, session_id: str) -> None:
+        self.use_case.abort(session_id)
+
+    @staticmethod
+    def _present(upload_session) -> UploadSessionResponse:
+        return UploadSessionResponse(
+            id=upload_session.id,
+            user_id=upload_session.user_id,
+            title=upload_session.title,
+            filename=upload_session.filename,
+            length=upload_session.upload_length,
+            offset=upload_session.upload_offset,
+            expires_at=upload_session.expires_at,
+            video_id=upload_session.video_id,
+        )
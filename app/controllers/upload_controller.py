@@ -10,6 +10,18 @@ class UploadController:
     def upload_video(self, user_id: int, title: str, upload_file) -> tuple:
         created_video, saved_path, timestamp = self.use_case.execute(user_id, title, upload_file)
 
+        return self._present(created_video)
+
+    def register_streamed_video(
+        self, user_id: int, title: str, saved_path, timestamp: str, content_hash: str = None
+    ) -> VideoResponse:
+        created_video, _, _ = self.use_case.register_upload(
+            user_id, title, saved_path, timestamp, content_hash=content_hash
+        )
+
+        return self._present(created_video)
+
+    def _present(self, created_video) -> VideoResponse:
         response_data = VideoResponseSchema(
             id=created_video.id,
             user_id=created_video.user_id,
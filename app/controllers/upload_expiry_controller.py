@@ -0,0 +1,26 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.use_cases.presigned_upload_use_case import PresignedUploadUseCase
+from app.use_cases.resumable_upload_use_case import ResumableUploadUseCase
+
+
+class ExpiredUploadsResponse(BaseModel):
+    status: str
+    presigned: int
+    resumable: int
+
+
+class UploadExpiryController:
+    def __init__(
+        self, presigned_use_case: Optional[PresignedUploadUseCase], resumable_use_case: ResumableUploadUseCase
+    ):
+        self.presigned_use_case = presigned_use_case
+        self.resumable_use_case = resumable_use_case
+
+    def expire(self) -> ExpiredUploadsResponse:
+        presigned = self.presigned_use_case.expire_abandoned() if self.presigned_use_case else 0
+        resumable = self.resumable_use_case.expire_sessions()
+
+        return ExpiredUploadsResponse(status="success", presigned=presigned, resumable=resumable)
@@ -0,0 +1,41 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from app.dao.video_dao import VideoDAO
+from app.adapters.schemas.video import VideoResponseSchema, VideoStatusUpdateSchema
+
+
+class BulkStatusUpdateResponse(BaseModel):
+    status: str
+    updated: int
+    not_found: List[int]
+    data: List[VideoResponseSchema]
+
+
+class VideoStatusController:
+    def __init__(self, video_dao: VideoDAO):
+        self.video_dao = video_dao
+
+    def bulk_update_status(self, updates: List[VideoStatusUpdateSchema]) -> BulkStatusUpdateResponse:
+        videos = self.video_dao.bulk_update_status(
+            (update.id, update.status, update.file_path) for update in updates
+        )
+
+        found = {video.id for video in videos}
+        not_found = sorted({update.id for update in updates} - found)
+
+        response_data = [
+            VideoResponseSchema(
+                id=video.id,
+                user_id=video.user_id,
+                title=video.title,
+                file_path=video.file_path,
+                status=video.status,
+            )
+            for video in videos
+        ]
+
+        return BulkStatusUpdateResponse(
+            status="success", updated=len(response_data), not_found=not_found, data=response_data
+        )
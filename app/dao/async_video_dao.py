@@ -0,0 +1,30 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.video import Video as VideoModel
+from app.dao.video_dao import VIDEO_LIST_COLUMNS
+
+
+class AsyncVideoDAO:
+    # Só leitura: a listagem roda no engine assíncrono; as escritas seguem no VideoDAO síncrono.
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def list_videos_by_user(self, user_id: int, limit: int = None, after_id: int = None):
+        try:
+            statement = select(*VIDEO_LIST_COLUMNS).where(VideoModel.user_id == user_id)
+
+            if after_id is not None:
+                statement = statement.where(VideoModel.id < after_id)
+
+            statement = statement.order_by(VideoModel.id.desc())
+
+            if limit is not None:
+                statement = statement.limit(limit)
+
+            result = await self.db_session.execute(statement)
+
+            return result.all()
+        except Exception as e:
+            raise Exception(f"Erro ao listar vídeos do usuário: {e}")
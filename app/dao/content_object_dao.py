@@ -0,0 +1,40 @@
+from typing import Dict, Iterable, Optional
+
+from app.models.content_object import ContentObject
+
+
+class ContentObjectDAO:
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    @staticmethod
+    def build(user_id: int, sha256: str, storage_path: str, size: int = None) -> ContentObject:
+        return ContentObject(user_id=user_id, sha256=sha256, storage_path=storage_path, size=size)
+
+    def get(self, user_id: int, sha256: str) -> Optional[ContentObject]:
+        return (
+            self.db_session.query(ContentObject)
+            .filter(ContentObject.user_id == user_id, ContentObject.sha256 == sha256)
+            .first()
+        )
+
+    def get_many(self, user_id: int, hashes: Iterable[str]) -> Dict[str, ContentObject]:
+        hashes = list(set(hashes))
+        if not hashes:
+            return {}
+
+        objects = (
+            self.db_session.query(ContentObject)
+            .filter(ContentObject.user_id == user_id, ContentObject.sha256.in_(hashes))
+            .all()
+        )
+        return {content_object.sha256: content_object for content_object in objects}
+
+    def repoint(self, user_id: int, sha256: str, video_id: int) -> None:
+        (
+            self.db_session.query(ContentObject)
+            .filter(ContentObject.user_id == user_id, ContentObject.sha256 == sha256)
+            .update({"video_id": video_id}, synchronize_session=False)
+        )
+        self.db_session.commit()
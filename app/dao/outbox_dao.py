@@ -0,0 +1,139 @@
+import json
+import uuid
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, func, select, update
+
+from app.infrastructure.config.settings import DEFAULT_OUTBOX_MAX_ATTEMPTS
+from app.models.outbox import OutboxMessage, utcnow
+
+MAX_RETRY_BACKOFF_SECONDS = 300
+# Linhas reivindicadas por um relay que caiu durante o envio voltam à fila após o lease.
+CLAIM_LEASE_SECONDS = 60
+PURGE_BATCH_SIZE = 1000
+
+
+class OutboxDAO:
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    @staticmethod
+    def build_message(aggregate_id: Optional[int], payload: dict, dedup_id: str = None) -> OutboxMessage:
+        return OutboxMessage(
+            aggregate_id=aggregate_id,
+            dedup_id=dedup_id or uuid.uuid4().hex,
+            payload=json.dumps(payload),
+            attempts=0,
+        )
+
+    def claim_batch(self, limit: int) -> List[OutboxMessage]:
+        """
+        Reivindica o lote empurrando ``available_at`` para depois do lease e
+        faz commit antes do envio: os locks do SKIP LOCKED só duram o UPDATE,
+        não a chamada ao SQS.
+        """
+        now = utcnow()
+        messages = (
+            self.db_session.query(OutboxMessage)
+            .filter(
+                OutboxMessage.sent_at.is_(None),
+                OutboxMessage.failed_at.is_(None),
+                OutboxMessage.available_at <= now,
+            )
+            .order_by(OutboxMessage.available_at, OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+        if messages:
+            self.db_session.execute(
+                update(OutboxMessage)
+                .where(OutboxMessage.id.in_([message.id for message in messages]))
+                .values(available_at=now + timedelta(seconds=CLAIM_LEASE_SECONDS))
+                .execution_options(synchronize_session=False)
+            )
+        # Desanexadas, as linhas continuam legíveis durante o envio sem recarregar após o commit.
+        self.db_session.expunge_all()
+        self.db_session.commit()
+
+        return messages
+
+    def complete_batch(
+        self, messages: List[OutboxMessage], errors: Dict[int, str], max_attempts: int = DEFAULT_OUTBOX_MAX_ATTEMPTS
+    ) -> List[OutboxMessage]:
+        """
+        Marca as enviadas e reagenda as que falharam com backoff. A que chega a
+        ``max_attempts`` recebe ``failed_at`` e sai da fila; devolve essas.
+        """
+        now = utcnow()
+
+        sent_ids = [message.id for message in messages if message.id not in errors]
+        if sent_ids:
+            self.db_session.execute(
+                update(OutboxMessage)
+                .where(OutboxMessage.id.in_(sent_ids))
+                .values(sent_at=now, last_error=None)
+                .execution_options(synchronize_session=False)
+            )
+
+        dead_lettered = []
+        for message in messages:
+            error = errors.get(message.id)
+            if error is None:
+                continue
+
+            attempts = message.attempts + 1
+            values = {"attempts": attempts, "last_error": error[:255]}
+            if attempts >= max_attempts:
+                values["failed_at"] = now
+                dead_lettered.append(message)
+            else:
+                values["available_at"] = now + timedelta(seconds=min(2 ** attempts, MAX_RETRY_BACKOFF_SECONDS))
+
+            self.db_session.execute(
+                update(OutboxMessage)
+                .where(OutboxMessage.id == message.id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+
+        self.db_session.commit()
+
+        return dead_lettered
+
+    def purge_sent(self, older_than: timedelta, limit: int = PURGE_BATCH_SIZE) -> int:
+        expired_ids = (
+            select(OutboxMessage.id)
+            .where(OutboxMessage.sent_at.isnot(None), OutboxMessage.sent_at < utcnow() - older_than)
+            .limit(limit)
+        )
+        deleted = self.db_session.execute(
+            delete(OutboxMessage).where(OutboxMessage.id.in_(expired_ids)).execution_options(synchronize_session=False)
+        ).rowcount
+        self.db_session.commit()
+
+        return deleted
+
+    def stats(self) -> dict:
+        pending, oldest, retrying = (
+            self.db_session.query(
+                func.count(OutboxMessage.id),
+                func.min(OutboxMessage.created_at),
+                func.count(OutboxMessage.last_error),
+            )
+            .filter(OutboxMessage.sent_at.is_(None), OutboxMessage.failed_at.is_(None))
+            .one()
+        )
+        dead_lettered = (
+            self.db_session.query(func.count(OutboxMessage.id)).filter(OutboxMessage.failed_at.isnot(None)).scalar()
+        )
+
+        return {
+            "pending": pending,
+            "retrying": retrying,
+            "dead_lettered": dead_lettered,
+            "oldest_pending_age_seconds": round((utcnow() - oldest).total_seconds(), 3) if oldest else 0.0,
+        }
@@ -0,0 +1,107 @@
+import json
+import uuid
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import or_
+
+from app.models.outbox import utcnow
+from app.models.upload_session import UploadSession
+
+# Trava de escrita abandonada (réplica caiu no meio de um PATCH) expira após o lease.
+SESSION_LOCK_LEASE_SECONDS = 300
+
+
+class UploadSessionDAO:
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    def create_session(self, upload_session: UploadSession) -> UploadSession:
+        upload_session.id = upload_session.id or uuid.uuid4().hex
+        self.db_session.add(upload_session)
+        self.db_session.commit()
+        self.db_session.refresh(upload_session)
+
+        return upload_session
+
+    def get_session(self, session_id: str) -> Optional[UploadSession]:
+        return (
+            self.db_session.query(UploadSession)
+            .filter(UploadSession.id == session_id, UploadSession.expires_at > utcnow())
+            .first()
+        )
+
+    def claim(self, session_id: str, expected_offset: int) -> Optional[str]:
+        # Compare-and-set: só uma requisição escreve a partir de um offset por vez, mesmo entre réplicas.
+        token = uuid.uuid4().hex
+        now = utcnow()
+        claimed = (
+            self.db_session.query(UploadSession)
+            .filter(
+                UploadSession.id == session_id,
+                UploadSession.upload_offset == expected_offset,
+                UploadSession.video_id.is_(None),
+                or_(
+                    UploadSession.lock_token.is_(None),
+                    UploadSession.locked_at < now - timedelta(seconds=SESSION_LOCK_LEASE_SECONDS),
+                ),
+            )
+            .update({"lock_token": token, "locked_at": now}, synchronize_session=False)
+        )
+        self.db_session.commit()
+
+        return token if claimed == 1 else None
+
+    def advance(self, session_id: str, token: str, new_offset: int, part: Optional[dict] = None) -> bool:
+        values = {"upload_offset": new_offset, "lock_token": None, "locked_at": None}
+
+        if part is not None:
+            upload_session = self.db_session.query(UploadSession).filter(UploadSession.id == session_id).one()
+            values["parts"] = json.dumps(json.loads(upload_session.parts) + [part])
+
+        updated = (
+            self.db_session.query(UploadSession)
+            .filter(UploadSession.id == session_id, UploadSession.lock_token == token)
+            .update(values, synchronize_session=False)
+        )
+        self.db_session.commit()
+
+        return updated == 1
+
+    def release(self, session_id: str, token: str) -> None:
+        (
+            self.db_session.query(UploadSession)
+            .filter(UploadSession.id == session_id, UploadSession.lock_token == token)
+            .update({"lock_token": None, "locked_at": None}, synchronize_session=False)
+        )
+        self.db_session.commit()
+
+    def mark_completed(self, session_id: str, token: str, video_id: int) -> None:
+        (
+            self.db_session.query(UploadSession)
+            .filter(UploadSession.id == session_id, UploadSession.lock_token == token)
+            .update({"video_id": video_id, "lock_token": None, "locked_at": None}, synchronize_session=False)
+        )
+        self.db_session.commit()
+
+    def list_expired(self, limit: int) -> list:
+        # Sessões com escrita em andamento ficam para a próxima passada.
+        now = utcnow()
+        return (
+            self.db_session.query(UploadSession)
+            .filter(
+                UploadSession.expires_at <= now,
+                or_(
+                    UploadSession.lock_token.is_(None),
+                    UploadSession.locked_at < now - timedelta(seconds=SESSION_LOCK_LEASE_SECONDS),
+                ),
+            )
+            .order_by(UploadSession.expires_at)
+            .limit(limit)
+            .all()
+        )
+
+    def delete_session(self, session_id: str) -> None:
+        self.db_session.query(UploadSession).filter(UploadSession.id == session_id).delete(synchronize_session=False)
+        self.db_session.commit()
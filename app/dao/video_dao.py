@@ -1,61 +1,335 @@
+from collections import defaultdict, deque
+from typing import Optional
+
+from sqlalchemy import case, insert, update
 from sqlalchemy.exc import IntegrityError
 
 from app.models.video import Video
 from app.models.video import Video as VideoModel
+from app.dao.outbox_dao import OutboxDAO
+from app.dao.content_object_dao import ContentObjectDAO
 from app.adapters.utils.debug import var_dump_die
-import logging
-logging.basicConfig()
-logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
+from app.infrastructure.cache.video_list_cache import get_video_list_cache
+from app.infrastructure.events.status_hub import get_status_hub
+
+# Listagem só carrega as colunas do response, sem hidratar o ORM completo.
+VIDEO_LIST_COLUMNS = (
+    VideoModel.id,
+    VideoModel.user_id,
+    VideoModel.title,
+    VideoModel.file_path,
+    VideoModel.status,
+)
+
+VIDEO_TABLE = VideoModel.__table__
+
+# Concluído e erro: o worker não muda mais o status depois deles.
+FINAL_STATUSES = (1, 2)
+
+# Vídeos por UPDATE no bulk_update_status; limita o tamanho do statement.
+BULK_UPDATE_CHUNK_SIZE = 500
+
+
+def video_values(video) -> dict:
+    return {
+        "user_id": video.user_id,
+        "title": video.title,
+        "file_path": video.file_path,
+        "status": video.status,
+        "content_hash": getattr(video, "content_hash", None),
+    }
+
+
+def video_insert_statement(video):
+    return insert(VIDEO_TABLE).values(**video_values(video)).returning(*VIDEO_TABLE.c)
+
+
+def video_status_update_statement(video_id: int, status: int, file_path: str = None, expected_status: int = None):
+    values = {"status": status}
+    if file_path:
+        values["file_path"] = file_path
+
+    statement = update(VIDEO_TABLE).where(VIDEO_TABLE.c.id == video_id)
+    if expected_status is not None:
+        statement = statement.where(VIDEO_TABLE.c.status == expected_status)
+
+    return statement.values(**values).returning(*VIDEO_TABLE.c)
+
+
+def bulk_status_update_statement(updates: dict):
+    # Um UPDATE com CASE por id: aplica o lote num round trip em qualquer dialeto.
+    values = {"status": case({video_id: status for video_id, (status, _) in updates.items()}, value=VIDEO_TABLE.c.id)}
+
+    file_paths = {video_id: file_path for video_id, (_, file_path) in updates.items() if file_path}
+    if file_paths:
+        values["file_path"] = case(file_paths, value=VIDEO_TABLE.c.id, else_=VIDEO_TABLE.c.file_path)
+
+    return update(VIDEO_TABLE).where(VIDEO_TABLE.c.id.in_(list(updates))).values(**values).returning(*VIDEO_TABLE.c)
+
+
+def match_returned_rows(values: list, created: list) -> list:
+    """
+    Realinha o RETURNING de um INSERT multi-linha com as linhas enviadas. O
+    Postgres não garante que a ordem (nem a dos ids) siga a do VALUES, então o
+    casamento é pelos valores inseridos; linhas idênticas são intercambiáveis.
+    """
+    by_values = defaultdict(deque)
+    for video_model in created:
+        by_values[tuple(video_values(video_model).values())].append(video_model)
+
+    return [by_values[tuple(row.values())].popleft() for row in values]
+
+
+def video_from_row(row) -> VideoModel:
+    # Instância montada do RETURNING, fora da sessão: o commit não a expira,
+    # então ler os atributos depois não dispara um SELECT de refresh.
+    return VideoModel(**row._mapping)
+
+
+class DuplicateContentError(Exception):
+    def __init__(self, content_hash: str):
+        super().__init__(f"Conteúdo {content_hash} já registrado")
+        self.content_hash = content_hash
+
+
+def invalidate_user_listing(user_id) -> None:
+    if user_id is not None:
+        get_video_list_cache().invalidate(user_id)
+
+
+def publish_status_change(video) -> None:
+    user_id = getattr(video, "user_id", None)
+    if user_id is None:
+        return
+
+    get_status_hub().publish(user_id, {
+        "video_id": video.id,
+        "user_id": user_id,
+        "status": video.status,
+        "file_path": video.file_path,
+    })
+
 
 class VideoDAO:
     
     def __init__(self, db_session):
         self.db_session = db_session
         
-    def create_video(self, video : Video):
+    def create_video(self, video : Video, outbox_event=None, content_object=None):
         try:
-            video_model = VideoModel(
-                user_id=video.user_id,
-                title=video.title,
-                file_path=video.file_path,
-                status=video.status
-            )
-            self.db_session.add(video_model)
+            video_model = video_from_row(self.db_session.execute(video_insert_statement(video)).one())
+
+            if outbox_event is not None:
+                # Evento gravado na mesma transação do vídeo; o relay publica depois.
+                self.db_session.add(OutboxDAO.build_message(video_model.id, outbox_event(video_model)))
+
+            if content_object is not None:
+                content_object.video_id = video_model.id
+                self.db_session.add(content_object)
+
             self.db_session.commit()
         except IntegrityError as e:
             self.db_session.rollback()
+
+            duplicate = self._existing_content([content_object])
+            if duplicate is not None:
+                raise DuplicateContentError(duplicate) from e
             
             raise Exception(f"Erro de integridade ao criar vídeo: {e}")
         
-        self.db_session.refresh(video_model)
+        invalidate_user_listing(video_model.user_id)
 
         return video_model
     
-    def update_video_status(self, video_id: int, status: int, file_path: str = None):
+    def create_videos(self, videos, outbox_events=None, content_objects=None) -> list:
+        """
+        Insere vários vídeos num único INSERT multi-linha com RETURNING, na
+        ordem recebida. ``outbox_events`` e ``content_objects``, se informados,
+        são listas alinhadas a ``videos`` (``None`` onde não se aplica) e vão
+        no mesmo commit.
+        """
+        if not videos:
+            return []
+
+        outbox_events = outbox_events or [None] * len(videos)
+        content_objects = content_objects or [None] * len(videos)
+
         try:
-            video = self.db_session.query(VideoModel).filter(VideoModel.id == video_id).first()
+            # VALUES multi-linha explícito: executemany com RETURNING ordenado vira
+            # um INSERT por linha no SQLite.
+            values = [video_values(video) for video in videos]
+            rows = self.db_session.execute(insert(VIDEO_TABLE).values(values).returning(*VIDEO_TABLE.c))
+            created = match_returned_rows(values, [video_from_row(row) for row in rows])
 
-            if not video:
-                raise Exception(f"Vídeo com ID {video_id} não encontrado")
-            video.status = status
+            for video_model, outbox_event, content_object in zip(created, outbox_events, content_objects):
+                if outbox_event is not None:
+                    self.db_session.add(OutboxDAO.build_message(video_model.id, outbox_event(video_model)))
+
+                if content_object is not None:
+                    content_object.video_id = video_model.id
+                    self.db_session.add(content_object)
 
-            if file_path:
-                video.file_path = file_path
-            
             self.db_session.commit()
-            self.db_session.refresh(video)
+        except IntegrityError as e:
+            self.db_session.rollback()
+
+            duplicate = self._existing_content(content_objects)
+            if duplicate is not None:
+                raise DuplicateContentError(duplicate) from e
+
+            raise Exception(f"Erro de integridade ao criar vídeos: {e}")
+
+        for user_id in {video_model.user_id for video_model in created}:
+            invalidate_user_listing(user_id)
+
+        return created
+
+    def _existing_content(self, content_objects) -> Optional[str]:
+        """
+        Depois do rollback, confere se a falha foi mesmo a chave (user_id,
+        sha256) de content_object: devolve o hash que já existe, ou ``None``
+        para outra violação (FK, NOT NULL), que segue como erro comum.
+        """
+        by_user = defaultdict(list)
+        for content_object in content_objects:
+            if content_object is not None:
+                by_user[content_object.user_id].append(content_object.sha256)
+
+        content_dao = ContentObjectDAO(self.db_session)
+        for user_id, hashes in by_user.items():
+            existing = content_dao.get_many(user_id, hashes)
+            for sha256 in hashes:
+                if sha256 in existing:
+                    return sha256
+
+        return None
+
+    def get_video(self, video_id: int):
+        return self.db_session.query(VideoModel).filter(VideoModel.id == video_id).first()
+
+    def update_video_status(self, video_id: int, status: int, file_path: str = None, outbox_event=None):
+        video = self._apply_status_update(video_status_update_statement(video_id, status, file_path), outbox_event)
+
+        if video is None:
+            raise Exception(f"Vídeo com ID {video_id} não encontrado")
+
+        return video
+
+    def transition_status(
+        self, video_id: int, from_status: int, to_status: int, file_path: str = None, outbox_event=None
+    ):
+        """
+        ``UPDATE ... WHERE id = :id AND status = :from_status RETURNING``: entre
+        chamadores concorrentes só um faz a transição. Devolve o vídeo
+        atualizado, ou ``None`` se ele não estava mais em ``from_status``.
+        """
+        statement = video_status_update_statement(video_id, to_status, file_path, expected_status=from_status)
+
+        return self._apply_status_update(statement, outbox_event)
+
+    def _apply_status_update(self, statement, outbox_event=None):
+        try:
+            row = self.db_session.execute(statement).first()
+
+            if row is None:
+                self.db_session.rollback()
+                return None
+            video = video_from_row(row)
+
+            if outbox_event is not None:
+                self.db_session.add(OutboxDAO.build_message(video.id, outbox_event(video)))
             
-            return video
+            self.db_session.commit()
         except IntegrityError as e:
             self.db_session.rollback()
             raise Exception(f"Erro ao atualizar vídeo: {e}")
-    
-    def list_videos_by_user(self, user_id: int):
+
+        self._notify_changes([video])
+
+        return video
+
+    def bulk_update_status(self, updates) -> list:
+        """
+        Aplica vários ``(id, status, file_path)`` numa transação, com um
+        ``UPDATE ... RETURNING`` por bloco de ``BULK_UPDATE_CHUNK_SIZE`` ids.
+        ``file_path`` vazio mantém o atual; id repetido vale a última entrada.
+        Devolve só os vídeos encontrados.
+        """
+        pending = {}
+        for video_id, status, file_path in updates:
+            pending[int(video_id)] = (status, file_path)
+
+        if not pending:
+            return []
+
+        items = list(pending.items())
         try:
-            videos = self.db_session.query(VideoModel).filter(
-                VideoModel.user_id == user_id
-            ).order_by(VideoModel.id.desc()).all()
-            
-            return videos
+            videos = []
+            for start in range(0, len(items), BULK_UPDATE_CHUNK_SIZE):
+                chunk = dict(items[start:start + BULK_UPDATE_CHUNK_SIZE])
+                rows = self.db_session.execute(bulk_status_update_statement(chunk))
+                videos.extend(video_from_row(row) for row in rows)
+
+            self.db_session.commit()
+        except IntegrityError as e:
+            self.db_session.rollback()
+            raise Exception(f"Erro ao atualizar vídeos: {e}")
+
+        self._notify_changes(videos)
+
+        return videos
+
+    @staticmethod
+    def _notify_changes(videos) -> None:
+        for video in videos:
+            invalidate_user_listing(video.user_id)
+            publish_status_change(video)
+
+    def list_statuses_by_users(self, user_ids, video_ids=()) -> list:
+        """
+        Status dos vídeos ainda em andamento dos usuários, mais os ``video_ids``
+        em qualquer status (para ver a transição final dos que já estavam em
+        andamento). Vídeos concluídos não são lidos a cada consulta.
+        """
+        columns = (VideoModel.id, VideoModel.user_id, VideoModel.status, VideoModel.file_path)
+        user_ids, video_ids = list(user_ids), list(video_ids)
+        rows = {}
+
+        for start in range(0, len(user_ids), BULK_UPDATE_CHUNK_SIZE):
+            chunk = user_ids[start:start + BULK_UPDATE_CHUNK_SIZE]
+            query = self.db_session.query(*columns).filter(
+                VideoModel.user_id.in_(chunk), VideoModel.status.notin_(FINAL_STATUSES)
+            )
+            rows.update((row.id, tuple(row)) for row in query)
+
+        for start in range(0, len(video_ids), BULK_UPDATE_CHUNK_SIZE):
+            chunk = video_ids[start:start + BULK_UPDATE_CHUNK_SIZE]
+            rows.update((row.id, tuple(row)) for row in self.db_session.query(*columns).filter(VideoModel.id.in_(chunk)))
+
+        return list(rows.values())
+
+    def list_videos_by_status(self, status: int, limit: int, file_path_range: tuple = None) -> list:
+        # file_path_range: (início inclusivo, fim exclusivo) para filtrar por prefixo/ordem no próprio SQL.
+        query = self.db_session.query(VideoModel).filter(VideoModel.status == status)
+
+        if file_path_range is not None:
+            start, end = file_path_range
+            query = query.filter(VideoModel.file_path >= start, VideoModel.file_path < end)
+
+        return query.order_by(VideoModel.id).limit(limit).all()
+
+    def list_videos_by_user(self, user_id: int, limit: int = None, after_id: int = None):
+        try:
+            query = self.db_session.query(*VIDEO_LIST_COLUMNS).filter(VideoModel.user_id == user_id)
+
+            if after_id is not None:
+                query = query.filter(VideoModel.id < after_id)
+
+            query = query.order_by(VideoModel.id.desc())
+
+            if limit is not None:
+                query = query.limit(limit)
+
+            return query.all()
         except Exception as e:
-            raise Exception(f"Erro ao listar vídeos do usuário: {e}")
\ No newline at end of file
+            raise Exception(f"Erro ao listar vídeos do usuário: {e}")
@@ -0,0 +1,136 @@
+import errno
+import hashlib
+import io
+import os
+import shutil
+import stat
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from app.gateways.upload_sinks import COPY_CHUNK_BYTES, temp_path_for
+
+# Erros que indicam que o kernel não suporta a cópia entre esses fds
+# (ex.: copy_file_range entre filesystems em kernels antigos, tmpfs sem suporte).
+_UNSUPPORTED_COPY_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+
+def disk_fileno(fileobj) -> Optional[int]:
+    """
+    Devolve o fd do arquivo em disco por trás de ``fileobj``, ou ``None`` se os
+    bytes ainda estão em memória. ``SpooledTemporaryFile.fileno()`` força o
+    rollover para disco, então o spool só é usado depois que já transbordou.
+    """
+    if isinstance(fileobj, tempfile.SpooledTemporaryFile) and not getattr(fileobj, "_rolled", False):
+        return None
+
+    try:
+        fd = fileobj.fileno()
+        is_regular = stat.S_ISREG(os.fstat(fd).st_mode)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+    return fd if is_regular else None
+
+
+def fd_sha256(fd: int, offset: int) -> str:
+    digest = hashlib.sha256()
+    while True:
+        chunk = os.pread(fd, COPY_CHUNK_BYTES, offset)
+        if not chunk:
+            return digest.hexdigest()
+        digest.update(chunk)
+        offset += len(chunk)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    copied = 0
+    while copied < count:
+        sent = os.copy_file_range(src_fd, dst_fd, count - copied, offset + copied)
+        if sent == 0:
+            break
+        copied += sent
+    return copied
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    copied = 0
+    while copied < count:
+        sent = os.sendfile(dst_fd, src_fd, offset + copied, count - copied)
+        if sent == 0:
+            break
+        copied += sent
+    return copied
+
+
+_KERNEL_COPIES = [
+    copy for name, copy in (("copy_file_range", _copy_file_range), ("sendfile", _sendfile)) if hasattr(os, name)
+]
+
+
+def _reset(fd: int) -> None:
+    os.lseek(fd, 0, os.SEEK_SET)
+    os.ftruncate(fd, 0)
+
+
+def kernel_copy(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    """
+    Copia ``count`` bytes a partir de ``offset`` sem passar pelo userspace:
+    ``copy_file_range`` (reflink/cópia no servidor em alguns filesystems) e,
+    se não suportado, ``sendfile``. Só cai no ``read``/``write`` se nenhum dos
+    dois copiar tudo entre esses fds.
+    """
+    for copy in _KERNEL_COPIES:
+        try:
+            if copy(src_fd, dst_fd, offset, count) == count:
+                return
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_COPY_ERRNOS:
+                raise
+        _reset(dst_fd)
+
+    with os.fdopen(os.dup(src_fd), "rb") as source, os.fdopen(os.dup(dst_fd), "wb") as target:
+        source.seek(offset)
+        shutil.copyfileobj(source, target, COPY_CHUNK_BYTES)
+
+
+def copy_into(fileobj: BinaryIO, dest: Path, with_hash: bool) -> Optional[str]:
+    """
+    Grava o conteúdo de ``fileobj`` (a partir da posição atual) em ``dest`` via
+    nome temporário + ``os.replace``: o worker nunca vê arquivo pela metade.
+    Com fd em disco, a cópia é feita pelo kernel; o hash, quando pedido, é a
+    única leitura em userspace.
+    """
+    tmp = temp_path_for(dest)
+    src_fd = disk_fileno(fileobj)
+
+    try:
+        if src_fd is not None:
+            fileobj.flush()
+            offset = fileobj.tell()
+            count = max(os.fstat(src_fd).st_size - offset, 0)
+            content_hash = fd_sha256(src_fd, offset) if with_hash else None
+
+            dst_fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                kernel_copy(src_fd, dst_fd, offset, count)
+            finally:
+                os.close(dst_fd)
+        else:
+            digest = hashlib.sha256() if with_hash else None
+            with open(tmp, "wb") as buffer:
+                while True:
+                    chunk = fileobj.read(COPY_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    if digest is not None:
+                        digest.update(chunk)
+                    buffer.write(chunk)
+            content_hash = digest.hexdigest() if digest is not None else None
+
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    return content_hash
@@ -0,0 +1,228 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional
+
+from app.dao.outbox_dao import OutboxDAO
+from app.gateways.sqs_batch_producer import SQS_MAX_BATCH_ENTRIES
+from app.infrastructure.aws.clients import get_sqs_client
+from app.infrastructure.config.settings import get_settings
+from app.models.outbox import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL_SECONDS = 60
+
+
+class OutboxRelay:
+    """
+    Drena ``outbox_message`` para o SQS em lotes de ``SendMessageBatch``. Cada
+    mensagem leva seu ``dedup_id`` (MessageDeduplicationId em filas FIFO, ou
+    atributo ``dedup_id`` nas standard) para o consumidor descartar repetições;
+    falhas ficam na tabela e voltam com backoff exponencial, até
+    ``OUTBOX_MAX_ATTEMPTS``; depois disso a linha recebe ``failed_at`` e sai da
+    fila. Mensagens enviadas são apagadas depois de ``OUTBOX_RETENTION_HOURS``
+    (``0`` mantém todas).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable = None,
+        client=None,
+        queue_url: str = None,
+        batch_size: int = None,
+        poll_interval_seconds: float = None,
+        retention_hours: int = None,
+        max_attempts: int = None,
+    ):
+        queue_settings = get_settings().queue
+        if session_factory is None:
+            from app.infrastructure.db.database import SessionLocal
+
+            session_factory = SessionLocal
+
+        self.session_factory = session_factory
+        self.client = client or get_sqs_client()
+        self.queue_url = queue_url or queue_settings.video_processing_queue_url
+        self.batch_size = batch_size or queue_settings.outbox_batch_size
+        self.poll_interval_seconds = (
+            queue_settings.outbox_poll_interval_ms / 1000 if poll_interval_seconds is None else poll_interval_seconds
+        )
+
+        self.retention_hours = queue_settings.outbox_retention_hours if retention_hours is None else retention_hours
+        self.max_attempts = max_attempts or queue_settings.outbox_max_attempts
+
+        self.sent = 0
+        self.failed = 0
+        self.dead_lettered = 0
+        self.purged = 0
+        self.last_run_at: Optional[float] = None
+        self._last_purge_at = 0.0
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_fifo(self) -> bool:
+        return bool(self.queue_url) and self.queue_url.endswith(".fifo")
+
+    def _entry(self, index: int, message: OutboxMessage) -> dict:
+        entry = {"Id": str(index), "MessageBody": message.payload}
+
+        if self.is_fifo:
+            entry["MessageDeduplicationId"] = message.dedup_id
+            entry["MessageGroupId"] = str(message.aggregate_id or "video")
+        else:
+            entry["MessageAttributes"] = {"dedup_id": {"DataType": "String", "StringValue": message.dedup_id}}
+
+        return entry
+
+    def _send(self, messages: List[OutboxMessage]) -> Dict[int, str]:
+        errors = {}
+
+        for start in range(0, len(messages), SQS_MAX_BATCH_ENTRIES):
+            chunk = messages[start:start + SQS_MAX_BATCH_ENTRIES]
+            try:
+                response = self.client.send_message_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=[self._entry(index, message) for index, message in enumerate(chunk)],
+                )
+            except Exception as e:
+                errors.update({message.id: str(e) for message in chunk})
+                continue
+
+            for failed in response.get("Failed", []):
+                message = chunk[int(failed["Id"])]
+                errors[message.id] = f"{failed.get('Code')}: {failed.get('Message')}"
+
+            confirmed = {int(successful["Id"]) for successful in response.get("Successful", [])}
+            for index, message in enumerate(chunk):
+                if index not in confirmed and message.id not in errors:
+                    errors[message.id] = "entrada não confirmada pelo SQS"
+
+        return errors
+
+    def run_once(self) -> int:
+        with self.session_factory() as session:
+            dao = OutboxDAO(session)
+            messages = dao.claim_batch(self.batch_size)
+            if not messages:
+                return 0
+
+            errors = self._send(messages)
+            dead_lettered = dao.complete_batch(messages, errors, self.max_attempts)
+
+        self.sent += len(messages) - len(errors)
+        self.failed += len(errors)
+        self.dead_lettered += len(dead_lettered)
+        self.last_run_at = time.time()
+
+        for message in dead_lettered:
+            logger.error(
+                "Outbox: mensagem %s (vídeo %s) descartada após %d tentativas: %s",
+                message.id, message.aggregate_id, self.max_attempts, errors[message.id],
+            )
+
+        if errors:
+            logger.warning(
+                "Outbox: %d de %d mensagens falharam; novas tentativas agendadas", len(errors), len(messages)
+            )
+
+        return len(messages) - len(errors)
+
+    def purge_sent(self) -> int:
+        if not self.retention_hours:
+            return 0
+
+        with self.session_factory() as session:
+            purged = OutboxDAO(session).purge_sent(timedelta(hours=self.retention_hours))
+
+        self.purged += purged
+        self._last_purge_at = time.monotonic()
+
+        return purged
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                drained = self.run_once()
+                if time.monotonic() - self._last_purge_at >= PURGE_INTERVAL_SECONDS:
+                    self.purge_sent()
+            except Exception:
+                logger.exception("Falha no relay do outbox")
+                drained = 0
+
+            # Lote cheio: provavelmente há mais pendências, continua sem esperar.
+            if drained >= self.batch_size:
+                continue
+
+            self._wake.wait(self.poll_interval_seconds)
+            self._wake.clear()
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="outbox-relay", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict:
+        with self.session_factory() as session:
+            table_stats = OutboxDAO(session).stats()
+
+        return {
+            **table_stats,
+            "running": self._thread is not None,
+            "sent": self.sent,
+            "failed_attempts": self.failed,
+            "dead_lettered_by_relay": self.dead_lettered,
+            "purged": self.purged,
+            "last_run_at": self.last_run_at,
+        }
+
+
+_relay: Optional[OutboxRelay] = None
+_relay_lock = threading.Lock()
+
+
+def get_outbox_relay() -> OutboxRelay:
+    global _relay
+    if _relay is None:
+        with _relay_lock:
+            if _relay is None:
+                _relay = OutboxRelay()
+
+    return _relay
+
+
+def start_outbox_relay() -> None:
+    if get_settings().queue.outbox_enabled:
+        get_outbox_relay().start()
+
+
+def stop_outbox_relay() -> None:
+    global _relay
+    with _relay_lock:
+        relay = _relay
+        _relay = None
+
+    if relay is not None:
+        relay.stop()
+
+
+def notify_outbox() -> None:
+    # Acorda o relay sem esperar o próximo poll; no-op se ele não está rodando.
+    relay = _relay
+    if relay is not None:
+        relay.wake()
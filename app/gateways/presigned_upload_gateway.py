@@ -0,0 +1,162 @@
+import math
+import uuid
+from datetime import datetime
+from pathlib import PurePosixPath
+from typing import List, Optional
+
+from app.adapters.utils.video_signature import VIDEO_SIGNATURE_BYTES
+from app.gateways.s3_multipart_uploader import S3_MIN_PART_SIZE_BYTES
+
+S3_MAX_PARTS = 10000
+# Metadados gravados no objeto (assinados na URL) e conferidos na conclusão.
+EXPECTED_LENGTH_METADATA = "expected-length"
+VIDEO_ID_METADATA = "video-id"
+TIMESTAMP_METADATA = "upload-timestamp"
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+class PresignedUploadGateway:
+    """
+    Emite URLs pré-assinadas para o cliente enviar o vídeo direto ao S3 e
+    inspeciona o objeto depois (HEAD + leitura dos primeiros bytes). Acima de
+    ``part_size`` o envio é multipart, com uma URL por parte.
+    """
+
+    def __init__(self, s3_client, bucket: str, expires_seconds: int, part_size: int):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.expires_seconds = expires_seconds
+        self.part_size = max(part_size, S3_MIN_PART_SIZE_BYTES)
+
+    @staticmethod
+    def build_key(timestamp: str, filename: str) -> str:
+        # Segmento aleatório por upload: dois envios do mesmo arquivo no mesmo segundo não
+        # disputam a mesma key. O nome original fica no fim, para a checagem de extensão.
+        return f"uploads/{timestamp}/{uuid.uuid4().hex}/{filename}"
+
+    @staticmethod
+    def created_at_from_key(key: str) -> Optional[datetime]:
+        parts = PurePosixPath(key).parts
+        if len(parts) < 2:
+            return None
+        try:
+            return datetime.strptime(parts[1], TIMESTAMP_FORMAT)
+        except ValueError:
+            return None
+
+    def url_range_created_before(self, cutoff: datetime) -> tuple:
+        # O timestamp no início da key ordena lexicograficamente: [uploads/, uploads/<cutoff>) são as anteriores.
+        return self.object_url("uploads/"), self.object_url(f"uploads/{cutoff.strftime(TIMESTAMP_FORMAT)}")
+
+    def object_url(self, key: str) -> str:
+        return f"s3://{self.bucket}/{key}"
+
+    def key_from_url(self, url: str) -> str:
+        prefix = f"s3://{self.bucket}/"
+        if not url.startswith(prefix):
+            raise ValueError(f"Objeto fora do bucket configurado: {url}")
+        return url[len(prefix):]
+
+    def part_size_for(self, length: int) -> int:
+        return max(self.part_size, math.ceil(length / S3_MAX_PARTS))
+
+    @staticmethod
+    def _metadata(video_id: int, length: int, timestamp: str) -> dict:
+        return {
+            EXPECTED_LENGTH_METADATA: str(length),
+            VIDEO_ID_METADATA: str(video_id),
+            TIMESTAMP_METADATA: timestamp,
+        }
+
+    def presign_put(self, key: str, content_type: str, length: int, video_id: int, timestamp: str) -> dict:
+        metadata = self._metadata(video_id, length, timestamp)
+        url = self.s3_client.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": key,
+                "ContentType": content_type,
+                "ContentLength": length,
+                "Metadata": metadata,
+            },
+            ExpiresIn=self.expires_seconds,
+        )
+        headers = {"Content-Type": content_type}
+        headers.update({f"x-amz-meta-{name}": value for name, value in metadata.items()})
+
+        return {"url": url, "headers": headers}
+
+    def presign_multipart(self, key: str, content_type: str, length: int, video_id: int, timestamp: str) -> dict:
+        part_size = self.part_size_for(length)
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket,
+            Key=key,
+            ContentType=content_type,
+            Metadata=self._metadata(video_id, length, timestamp),
+        )["UploadId"]
+
+        parts = []
+        for part_number in range(1, math.ceil(length / part_size) + 1):
+            size = min(part_size, length - (part_number - 1) * part_size)
+            parts.append({
+                "part_number": part_number,
+                "size": size,
+                "url": self.s3_client.generate_presigned_url(
+                    "upload_part",
+                    Params={
+                        "Bucket": self.bucket,
+                        "Key": key,
+                        "UploadId": upload_id,
+                        "PartNumber": part_number,
+                        "ContentLength": size,
+                    },
+                    ExpiresIn=self.expires_seconds,
+                ),
+            })
+
+        return {"upload_id": upload_id, "part_size": part_size, "parts": parts}
+
+    def complete_multipart(self, key: str, upload_id: str) -> None:
+        parts: List[dict] = []
+        kwargs = {"Bucket": self.bucket, "Key": key, "UploadId": upload_id}
+
+        while True:
+            response = self.s3_client.list_parts(**kwargs)
+            parts.extend({"PartNumber": part["PartNumber"], "ETag": part["ETag"]} for part in response.get("Parts", []))
+            if not response.get("IsTruncated"):
+                break
+            kwargs["PartNumberMarker"] = response["NextPartNumberMarker"]
+
+        self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+
+    def abort_multipart_uploads(self, key: str) -> int:
+        aborted = 0
+        kwargs = {"Bucket": self.bucket, "Prefix": key}
+
+        while True:
+            response = self.s3_client.list_multipart_uploads(**kwargs)
+            for upload in response.get("Uploads", []):
+                if upload["Key"] == key:
+                    self.s3_client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload["UploadId"])
+                    aborted += 1
+            if not response.get("IsTruncated"):
+                return aborted
+            kwargs["KeyMarker"] = response["NextKeyMarker"]
+            kwargs["UploadIdMarker"] = response["NextUploadIdMarker"]
+
+    def head(self, key: str) -> Optional[dict]:
+        try:
+            return self.s3_client.head_object(Bucket=self.bucket, Key=key)
+        except self.s3_client.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+                return None
+            raise
+
+    def read_head_bytes(self, key: str, size: int = VIDEO_SIGNATURE_BYTES) -> bytes:
+        response = self.s3_client.get_object(Bucket=self.bucket, Key=key, Range=f"bytes=0-{size - 1}")
+        return response["Body"].read()
+
+    def delete(self, key: str) -> None:
+        self.s3_client.delete_object(Bucket=self.bucket, Key=key)
@@ -0,0 +1,137 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from app.gateways.s3_multipart_uploader import S3_MIN_PART_SIZE_BYTES
+from app.gateways.upload_sinks import file_sha256
+
+
+class ResumableChunkError(Exception):
+    pass
+
+
+class LocalResumableStorage:
+    """
+    Sessão em disco: os chunks vão para ``<destino>.part`` na posição do
+    offset e o arquivo só ganha o nome final no ``complete``. O destino leva o
+    id da sessão, então dois uploads do mesmo arquivo no mesmo segundo não
+    dividem o staging.
+    """
+
+    def __init__(self, uploads_dir: Path):
+        self.uploads_dir = uploads_dir
+
+    @staticmethod
+    def _staging_path(upload_session) -> Path:
+        destination = Path(upload_session.storage_path)
+        return destination.with_name(destination.name + ".part")
+
+    def begin(self, upload_session) -> None:
+        name = f"{upload_session.timestamp}_{upload_session.id}_{upload_session.filename}"
+        upload_session.storage_path = str(self.uploads_dir / name)
+        self._staging_path(upload_session).touch()
+
+    def write_chunk(self, upload_session, chunk: BinaryIO, size: int) -> Optional[dict]:
+        with open(self._staging_path(upload_session), "r+b") as staging:
+            staging.seek(upload_session.upload_offset)
+            shutil.copyfileobj(chunk, staging)
+            # Descarta bytes de uma tentativa anterior que não chegou a avançar o offset.
+            staging.truncate()
+
+        return None
+
+    def complete(self, upload_session) -> Path:
+        destination = Path(upload_session.storage_path)
+        staging = self._staging_path(upload_session)
+        if not staging.exists() and destination.exists():
+            # Finalização anterior moveu o arquivo, mas não chegou a registrar o vídeo.
+            return destination
+        os.replace(staging, destination)
+        return destination
+
+    @staticmethod
+    def content_hash(saved_path) -> Optional[str]:
+        # Os chunks chegam fora de uma única passada, então o hash é do arquivo final.
+        return file_sha256(Path(saved_path))
+
+    def abort(self, upload_session) -> None:
+        self._staging_path(upload_session).unlink(missing_ok=True)
+
+
+class S3ResumableStorage:
+    """
+    Sessão sobre um multipart upload do S3: cada PATCH vira uma parte. O S3
+    exige 5 MB por parte, exceto a última, então chunks menores só são aceitos
+    quando fecham o arquivo.
+    """
+
+    def __init__(self, s3_client, bucket: str, min_part_size: int = S3_MIN_PART_SIZE_BYTES):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.min_part_size = min_part_size
+
+    def begin(self, upload_session) -> None:
+        key = f"uploads/{upload_session.timestamp}/{upload_session.id}/{upload_session.filename}"
+        response = self.s3_client.create_multipart_upload(Bucket=self.bucket, Key=key)
+        upload_session.storage_path = key
+        upload_session.s3_upload_id = response["UploadId"]
+
+    def write_chunk(self, upload_session, chunk: BinaryIO, size: int) -> Optional[dict]:
+        is_last = upload_session.upload_offset + size >= upload_session.upload_length
+        if size < self.min_part_size and not is_last:
+            raise ResumableChunkError(
+                f"Chunk de {size} bytes abaixo do mínimo de {self.min_part_size} bytes para partes do S3"
+            )
+
+        part_number = len(json.loads(upload_session.parts)) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket,
+            Key=upload_session.storage_path,
+            UploadId=upload_session.s3_upload_id,
+            PartNumber=part_number,
+            Body=chunk,
+            ContentLength=size,
+        )
+
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def complete(self, upload_session) -> str:
+        try:
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=upload_session.storage_path,
+                UploadId=upload_session.s3_upload_id,
+                MultipartUpload={"Parts": json.loads(upload_session.parts)},
+            )
+        except self.s3_client.exceptions.ClientError as e:
+            # Upload já concluído por uma finalização que falhou depois, no registro do vídeo.
+            if e.response.get("Error", {}).get("Code") != "NoSuchUpload" or not self._exists(upload_session):
+                raise
+        return f"s3://{self.bucket}/{upload_session.storage_path}"
+
+    def _exists(self, upload_session) -> bool:
+        try:
+            self.s3_client.head_object(Bucket=self.bucket, Key=upload_session.storage_path)
+        except self.s3_client.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+                return False
+            raise
+        return True
+
+    @staticmethod
+    def content_hash(saved_path) -> Optional[str]:
+        # Ler o objeto de volta só para o hash custaria um download inteiro.
+        return None
+
+    def abort(self, upload_session) -> None:
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket,
+                Key=upload_session.storage_path,
+                UploadId=upload_session.s3_upload_id,
+            )
+        except self.s3_client.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                raise
@@ -0,0 +1,188 @@
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from app.infrastructure.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+S3_MIN_PART_SIZE_BYTES = 5 * 1024 * 1024
+
+
+@dataclass
+class PartTiming:
+    part_number: int
+    size: int
+    seconds: float
+
+
+@dataclass
+class MultipartUploadResult:
+    bucket: str
+    key: str
+    size: int = 0
+    seconds: float = 0.0
+    multipart: bool = False
+    parts: List[PartTiming] = field(default_factory=list)
+    sha256: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return f"s3://{self.bucket}/{self.key}"
+
+
+class S3MultipartUpload:
+    def __init__(self, s3_client, bucket: str, key: str, part_size: int, max_concurrency: int):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.result = MultipartUploadResult(bucket=bucket, key=key)
+
+        self._buffer = bytearray()
+        self._digest = hashlib.sha256()
+        self._upload_id: Optional[str] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures = []
+        # Limita partes em voo para manter a memória em ~(concorrência + 1) * part_size.
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._started_at = time.perf_counter()
+        self._next_part_number = 1
+
+    def _upload_part(self, part_number: int, data: bytes) -> dict:
+        started = time.perf_counter()
+        try:
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=data,
+            )
+        finally:
+            self._slots.release()
+
+        self.result.parts.append(PartTiming(part_number, len(data), time.perf_counter() - started))
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def _submit_part(self, data: bytes) -> None:
+        if self._upload_id is None:
+            response = self.s3_client.create_multipart_upload(Bucket=self.bucket, Key=self.key)
+            self._upload_id = response["UploadId"]
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="s3-part")
+            self.result.multipart = True
+
+        # Falha rápido: não continua enviando partes se alguma já falhou.
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+
+        self._slots.acquire()
+        part_number = self._next_part_number
+        self._next_part_number += 1
+        self._futures.append(self._executor.submit(self._upload_part, part_number, data))
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    def write(self, data: bytes) -> None:
+        self._buffer.extend(data)
+        self._digest.update(data)
+        self.result.size += len(data)
+
+        while len(self._buffer) >= self.part_size:
+            self._submit_part(bytes(self._buffer[:self.part_size]))
+            del self._buffer[:self.part_size]
+
+    def close(self) -> str:
+        try:
+            if self._upload_id is None:
+                # Arquivos menores que uma parte vão num único PUT.
+                self.s3_client.put_object(Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer))
+            else:
+                if self._buffer:
+                    self._submit_part(bytes(self._buffer))
+
+                parts = sorted((future.result() for future in self._futures), key=lambda part: part["PartNumber"])
+                self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+                self._upload_id = None
+        finally:
+            self._buffer = bytearray()
+            self._shutdown()
+
+        self.result.seconds = time.perf_counter() - self._started_at
+        self.result.sha256 = self.sha256
+        self.result.parts.sort(key=lambda part: part.part_number)
+
+        logger.info(
+            "Upload S3 concluído - key=%s bytes=%s partes=%s tempo=%.3fs tempos_partes=%s",
+            self.key,
+            self.result.size,
+            len(self.result.parts),
+            self.result.seconds,
+            [round(part.seconds, 3) for part in self.result.parts],
+        )
+
+        return self.result.url
+
+    def abort(self) -> None:
+        self._buffer = bytearray()
+        for future in self._futures:
+            future.cancel()
+        self._shutdown()
+
+        if self._upload_id is None:
+            return
+
+        upload_id = self._upload_id
+        self._upload_id = None
+        self.s3_client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=upload_id)
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class S3MultipartUploader:
+    def __init__(self, s3_client, bucket: str, part_size: int = None, max_concurrency: int = None):
+        storage_settings = get_settings().storage
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.part_size = max(part_size or storage_settings.s3_multipart_part_size_bytes, S3_MIN_PART_SIZE_BYTES)
+        self.max_concurrency = max_concurrency or storage_settings.s3_multipart_concurrency
+
+    def start(self, key: str) -> S3MultipartUpload:
+        return S3MultipartUpload(self.s3_client, self.bucket, key, self.part_size, self.max_concurrency)
+
+    def upload_fileobj(self, fileobj, key: str) -> MultipartUploadResult:
+        upload = self.start(key)
+
+        try:
+            while True:
+                chunk = fileobj.read(self.part_size)
+                if not chunk:
+                    break
+                upload.write(chunk)
+
+            upload.close()
+        except Exception:
+            try:
+                upload.abort()
+            except Exception:
+                logger.exception("Falha ao abortar multipart upload de %s", key)
+            raise
+
+        return upload.result
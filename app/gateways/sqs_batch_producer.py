@@ -0,0 +1,294 @@
+import json
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.gateways.sqs_producer import SQS_MAX_BATCH_ENTRIES, SQSProducer
+from app.infrastructure.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+SQS_MAX_BATCH_BYTES = 256 * 1024
+
+
+class SQSBatchEntryError(Exception):
+    def __init__(self, code: Optional[str], message: Optional[str], sender_fault: bool = False):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.sender_fault = sender_fault
+
+
+@dataclass
+class _Entry:
+    body: str
+    size: int
+    future: Future = field(default_factory=Future)
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.monotonic)
+    retry_at: float = 0.0
+
+
+class BatchingSQSProducer(SQSProducer):
+    """
+    Acumula mensagens e envia com ``SendMessageBatch`` (até 10 entradas ou
+    256 KB), a partir de uma thread de flush. O envio acontece quando o lote
+    enche ou quando a mensagem mais antiga espera ``linger_seconds``. Entradas
+    que falham sem culpa do remetente voltam para a fila até ``max_attempts``,
+    com backoff exponencial a partir de ``retry_backoff_seconds``.
+
+    ``send_message`` espera a confirmação do lote, então a latência de quem
+    chama inclui o linger. No upload isso só vale com o outbox desligado; com
+    ``OUTBOX_ENABLED`` o SQS fica fora do caminho da requisição.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        linger_seconds: float = None,
+        max_attempts: int = None,
+        ack_timeout_seconds: float = None,
+        retry_backoff_seconds: float = None,
+        max_batch_size: int = SQS_MAX_BATCH_ENTRIES,
+        max_batch_bytes: int = SQS_MAX_BATCH_BYTES,
+    ):
+        super().__init__(client)
+        queue_settings = get_settings().queue
+        self.linger_seconds = queue_settings.batch_linger_ms / 1000 if linger_seconds is None else linger_seconds
+        self.max_attempts = max_attempts or queue_settings.batch_max_attempts
+        self.ack_timeout_seconds = ack_timeout_seconds or queue_settings.ack_timeout_seconds
+        self.retry_backoff_seconds = (
+            queue_settings.batch_retry_backoff_ms / 1000 if retry_backoff_seconds is None else retry_backoff_seconds
+        )
+        self.max_batch_size = min(max_batch_size, SQS_MAX_BATCH_ENTRIES)
+        self.max_batch_bytes = min(max_batch_bytes, SQS_MAX_BATCH_BYTES)
+
+        self.batches_sent = 0
+        self.messages_sent = 0
+        self.messages_failed = 0
+        self.retries = 0
+
+        self._pending: deque = deque()
+        self._pending_bytes = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, message: Dict[str, Any]) -> Future:
+        body = json.dumps(message)
+        entry = _Entry(body=body, size=len(body.encode("utf-8")))
+
+        if entry.size > self.max_batch_bytes:
+            entry.future.set_exception(ValueError(f"Mensagem SQS excede {self.max_batch_bytes} bytes"))
+            return entry.future
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Producer SQS já foi encerrado")
+
+            self._pending.append(entry)
+            self._pending_bytes += entry.size
+            self._ensure_thread()
+            self._condition.notify()
+
+        return entry.future
+
+    def send_message(self, message: Dict[str, Any]) -> bool:
+        try:
+            message_id = self.submit(message).result(timeout=self.ack_timeout_seconds)
+        except Exception as e:
+            logger.error("Erro ao enviar mensagem ao SQS: %s", e)
+            return False
+
+        logger.info("Mensagem enviada ao SQS: %s", message_id)
+        return True
+
+    def send_messages(self, messages: List[Dict[str, Any]]) -> List[bool]:
+        # Enfileira tudo antes de esperar: a thread de flush agrupa em SendMessageBatch.
+        futures = []
+        for message in messages:
+            try:
+                futures.append(self.submit(message))
+            except Exception as e:
+                futures.append(None)
+                logger.error("Erro ao enviar mensagem ao SQS: %s", e)
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future is not None and bool(future.result(timeout=self.ack_timeout_seconds)))
+            except Exception as e:
+                logger.error("Erro ao enviar mensagem ao SQS: %s", e)
+                results.append(False)
+
+        return results
+
+    def _ensure_thread(self) -> None:
+        # Recria a thread se ela morreu: sem isso todo envio esperaria o ack_timeout.
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="sqs-batch-flush", daemon=True)
+            self._thread.start()
+
+    def _batch_ready(self) -> bool:
+        return len(self._pending) >= self.max_batch_size or self._pending_bytes >= self.max_batch_bytes
+
+    def _next_batch(self) -> Optional[List[_Entry]]:
+        with self._condition:
+            while True:
+                if self._pending:
+                    now = time.monotonic()
+                    if not self._closed and self._pending[0].retry_at > now:
+                        # Reenvio em backoff na frente da fila: segura o lote até lá.
+                        self._condition.wait(self._pending[0].retry_at - now)
+                        continue
+                    if self._closed or self._batch_ready():
+                        break
+                    remaining = self._pending[0].enqueued_at + self.linger_seconds - now
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                elif self._closed:
+                    return None
+                else:
+                    self._condition.wait()
+
+            batch = []
+            batch_bytes = 0
+            while self._pending and len(batch) < self.max_batch_size:
+                if batch and batch_bytes + self._pending[0].size > self.max_batch_bytes:
+                    break
+                entry = self._pending.popleft()
+                self._pending_bytes -= entry.size
+                batch_bytes += entry.size
+                batch.append(entry)
+
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            try:
+                self._send_batch(batch)
+            except Exception as e:
+                logger.exception("Erro inesperado no envio em lote ao SQS")
+                for entry in batch:
+                    if not entry.future.done():
+                        self._fail(entry, e)
+
+    def _send_batch(self, batch: List[_Entry]) -> None:
+        entries = {str(index): entry for index, entry in enumerate(batch)}
+
+        try:
+            response = self.client.send_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=[{"Id": entry_id, "MessageBody": entry.body} for entry_id, entry in entries.items()],
+            )
+        except Exception as e:
+            logger.warning("Falha no SendMessageBatch (%d mensagens): %s", len(batch), e)
+            self._retry_or_fail(batch, e)
+            return
+
+        self.batches_sent += 1
+
+        for successful in response.get("Successful", []):
+            entry = entries.pop(successful.get("Id"), None)
+            if entry is None:
+                continue
+            self.messages_sent += 1
+            entry.future.set_result(successful["MessageId"])
+
+        retry = []
+        for failed in response.get("Failed", []):
+            entry = entries.pop(failed.get("Id"), None)
+            if entry is None:
+                continue
+            error = SQSBatchEntryError(failed.get("Code"), failed.get("Message"), bool(failed.get("SenderFault")))
+            if error.sender_fault:
+                self._fail(entry, error)
+            else:
+                retry.append(entry)
+
+        # Entradas que o SQS não citou na resposta também são reenviadas.
+        retry.extend(entries.values())
+        if retry:
+            self._retry_or_fail(retry, SQSBatchEntryError("Unknown", "entrada não confirmada pelo SQS"))
+
+    def _fail(self, entry: _Entry, error: Exception) -> None:
+        self.messages_failed += 1
+        entry.future.set_exception(error)
+
+    def _retry_or_fail(self, entries: List[_Entry], error: Exception) -> None:
+        requeue = []
+        for entry in entries:
+            entry.attempts += 1
+            if entry.attempts >= self.max_attempts:
+                self._fail(entry, error)
+            else:
+                entry.enqueued_at = time.monotonic()
+                entry.retry_at = entry.enqueued_at + self.retry_backoff_seconds * 2 ** (entry.attempts - 1)
+                requeue.append(entry)
+
+        if not requeue:
+            return
+
+        with self._condition:
+            self.retries += len(requeue)
+            for entry in reversed(requeue):
+                self._pending.appendleft(entry)
+                self._pending_bytes += entry.size
+            self._condition.notify()
+
+    def close(self, timeout: float = None) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join(timeout)
+
+    def stats(self) -> dict:
+        with self._condition:
+            pending = len(self._pending)
+
+        return {
+            "pending": pending,
+            "batches_sent": self.batches_sent,
+            "messages_sent": self.messages_sent,
+            "messages_failed": self.messages_failed,
+            "retries": self.retries,
+        }
+
+
+_producer: Optional[SQSProducer] = None
+_producer_lock = threading.Lock()
+
+
+def get_shared_sqs_producer() -> SQSProducer:
+    global _producer
+    if _producer is None:
+        with _producer_lock:
+            if _producer is None:
+                if get_settings().queue.batching_enabled:
+                    _producer = BatchingSQSProducer()
+                else:
+                    _producer = SQSProducer()
+
+    return _producer
+
+
+def shutdown_sqs_producer() -> None:
+    global _producer
+    with _producer_lock:
+        producer = _producer
+        _producer = None
+
+    if isinstance(producer, BatchingSQSProducer):
+        producer.close()
@@ -1,26 +1,25 @@
 import json
 import logging
-import os
-from typing import Dict, Any
-import boto3
+from typing import Any, Dict, List
+
+from app.infrastructure.aws.clients import get_sqs_client
+from app.infrastructure.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
+SQS_MAX_BATCH_ENTRIES = 10
+
+
 class SQSProducer:
-    def __init__(self):
-        self.queue_url = os.getenv("SQS_VIDEO_PROCESSING_QUEUE")
-        self.region = os.getenv("AWS_REGION", "us-east-1")
+    def __init__(self, client=None):
+        settings = get_settings()
+        self.queue_url = settings.queue.video_processing_queue_url
+        self.region = settings.aws.region
         
-        self.client = boto3.client(
-            'sqs',
-            region_name=self.region,
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            endpoint_url=os.getenv("AWS_ENDPOINT_URL")
-        )
+        self.client = client or get_sqs_client()
         
-        logger.info(f"SQS Producer inicializado - Queue: {self.queue_url}")
+        logger.info("SQS Producer inicializado - Queue: %s", self.queue_url)
 
     def send_message(self, message: Dict[str, Any]) -> bool:
         try:
@@ -29,9 +28,33 @@ class SQSProducer:
                 MessageBody=json.dumps(message)
             )
             
-            logger.info(f"Mensagem enviada ao SQS: {response['MessageId']}")
+            logger.info("Mensagem enviada ao SQS: %s", response["MessageId"])
             return True
             
         except Exception as e:
-            logger.error(f"Erro ao enviar mensagem ao SQS: {str(e)}")
+            logger.error("Erro ao enviar mensagem ao SQS: %s", e)
             return False
+
+    def send_messages(self, messages: List[Dict[str, Any]]) -> List[bool]:
+        # SendMessageBatch em blocos de 10; devolve o resultado de cada mensagem, na ordem recebida.
+        results = [False] * len(messages)
+
+        for start in range(0, len(messages), SQS_MAX_BATCH_ENTRIES):
+            chunk = messages[start:start + SQS_MAX_BATCH_ENTRIES]
+            try:
+                response = self.client.send_message_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=[
+                        {"Id": str(index), "MessageBody": json.dumps(message)} for index, message in enumerate(chunk)
+                    ],
+                )
+            except Exception as e:
+                logger.error("Erro ao enviar lote ao SQS: %s", e)
+                continue
+
+            for successful in response.get("Successful", []):
+                results[start + int(successful["Id"])] = True
+            for failed in response.get("Failed", []):
+                logger.error("Erro ao enviar mensagem ao SQS: %s: %s", failed.get("Code"), failed.get("Message"))
+
+        return results
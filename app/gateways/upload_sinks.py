@@ -0,0 +1,50 @@
+import hashlib
+import os
+import uuid
+from pathlib import Path
+
+
+COPY_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(COPY_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def temp_path_for(dest: Path) -> Path:
+    # Mesmo diretório do destino: o os.replace final é atômico no mesmo filesystem.
+    return dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+
+
+class LocalUploadSink:
+    # Grava num nome temporário e só renomeia no close: o worker nunca vê arquivo pela metade.
+    def __init__(self, dest: Path):
+        self.dest = dest
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._tmp = temp_path_for(dest)
+        self._buffer = open(self._tmp, "wb")
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    def write(self, data: bytes) -> None:
+        self._buffer.write(data)
+        self._digest.update(data)
+        self.size += len(data)
+
+    def close(self) -> Path:
+        self._buffer.close()
+        os.replace(self._tmp, self.dest)
+        return self.dest
+
+    def abort(self) -> None:
+        try:
+            self._buffer.close()
+        finally:
+            self._tmp.unlink(missing_ok=True)
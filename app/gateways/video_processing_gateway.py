@@ -1,16 +1,24 @@
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import os
 import shutil
 import subprocess
 import zipfile
-import boto3
 from fastapi import UploadFile, HTTPException
 
+from app.gateways.upload_sinks import LocalUploadSink
+from app.gateways.local_file_copy import copy_into
+from app.gateways.s3_multipart_uploader import S3MultipartUploader
+from app.gateways.resumable_storage import LocalResumableStorage, S3ResumableStorage
+from app.gateways.presigned_upload_gateway import PresignedUploadGateway
+from app.infrastructure.aws.clients import get_s3_client
+from app.infrastructure.config.settings import get_settings
+
 
 class VideoProcessingGateway:
-    def __init__(self, base_dir: Path):
+    def __init__(self, base_dir: Path, s3_client=None):
         self.base_dir = base_dir
+        self.s3_client = s3_client
         self.uploads_dir = base_dir / "uploads"
         self.outputs_dir = base_dir / "outputs"
         self.temp_dir = base_dir / "temp"
@@ -19,22 +27,31 @@ class VideoProcessingGateway:
         self.outputs_dir.mkdir(parents=True, exist_ok=True)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
+    def _build_s3_client(self):
+        return self.s3_client or get_s3_client()
+
     def save_upload(self, upload_file: UploadFile, timestamp: str) -> Path:
+        saved_path, _, _ = self.store_upload(upload_file, timestamp)
+
+        return saved_path
+
+    def store_upload(self, upload_file: UploadFile, timestamp: str) -> Tuple[object, Optional[str], object]:
+        # Devolve (caminho, sha256, resultado do multipart) em vez de guardar na instância:
+        # o gateway é compartilhado entre threads e uploads simultâneos.
         filename = f"{timestamp}_{upload_file.filename}"
         dest = self.uploads_dir / filename
 
-        env = os.getenv("APP_ENV", "development")
+        storage_settings = get_settings().storage
 
-        if env != "production":
+        if not storage_settings.is_production:
             try:
-                with open(dest, "wb") as buffer:
-                    shutil.copyfileobj(upload_file.file, buffer)
+                content_hash = copy_into(upload_file.file, dest, with_hash=storage_settings.dedup_enabled)
             finally:
                 upload_file.file.close()
 
-            return dest
+            return dest, content_hash, None
 
-        bucket = os.getenv("AWS_S3_BUCKET")
+        bucket = storage_settings.s3_bucket
         if not bucket:
             try:
                 upload_file.file.close()
@@ -45,20 +62,15 @@ class VideoProcessingGateway:
         s3_key = f"uploads/{filename}"
 
         try:
-            s3_client = boto3.client(
-                "s3",
-                region_name=os.getenv("AWS_REGION"),
-                aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-                aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-                endpoint_url=os.getenv("AWS_ENDPOINT_URL"),
-            )
+            s3_client = self._build_s3_client()
 
             try:
                 upload_file.file.seek(0)
             except Exception:
                 pass
 
-            s3_client.upload_fileobj(upload_file.file, bucket, s3_key)
+            uploader = S3MultipartUploader(s3_client, bucket)
+            upload_result = uploader.upload_fileobj(upload_file.file, s3_key)
         except Exception as e:
             try:
                 upload_file.file.close()
@@ -71,4 +83,99 @@ class VideoProcessingGateway:
         except Exception:
             pass
 
-        return f"s3://{bucket}/{s3_key}"
+        return f"s3://{bucket}/{s3_key}", upload_result.sha256, upload_result
+
+    def content_path(self, user_id: int, content_hash: str, suffix: str) -> Path:
+        return self.uploads_dir / "objects" / str(user_id) / content_hash[:2] / f"{content_hash}{suffix.lower()}"
+
+    def store_by_hash(self, saved_path, user_id: int, content_hash: str) -> str:
+        # Local: o arquivo passa a morar no caminho derivado do hash. No S3 o
+        # objeto fica na chave original; o índice content_object aponta para ela.
+        if str(saved_path).startswith("s3://"):
+            return str(saved_path)
+
+        source = Path(saved_path)
+        target = self.content_path(user_id, content_hash, source.suffix)
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        if source == target:
+            return str(target)
+
+        if target.exists():
+            source.unlink(missing_ok=True)
+        else:
+            os.replace(source, target)
+
+        return str(target)
+
+    @staticmethod
+    def stored_size(stored_path) -> Optional[int]:
+        if str(stored_path).startswith("s3://"):
+            return None
+        return Path(stored_path).stat().st_size
+
+    def discard_upload(self, saved_path) -> None:
+        saved_path = str(saved_path)
+
+        if not saved_path.startswith("s3://"):
+            Path(saved_path).unlink(missing_ok=True)
+            return
+
+        bucket, _, key = saved_path[len("s3://"):].partition("/")
+        self._build_s3_client().delete_object(Bucket=bucket, Key=key)
+
+    def open_upload_sink(self, original_filename: str, timestamp: str):
+        filename = f"{timestamp}_{Path(original_filename).name}"
+
+        storage_settings = get_settings().storage
+
+        if not storage_settings.is_production:
+            return LocalUploadSink(self.uploads_dir / filename)
+
+        bucket = storage_settings.s3_bucket
+        if not bucket:
+            raise HTTPException(status_code=500, detail="S3 bucket not configured")
+
+        try:
+            s3_client = self._build_s3_client()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Erro ao enviar arquivo para S3: {e}")
+
+        return S3MultipartUploader(s3_client, bucket).start(f"uploads/{filename}")
+
+    def resumable_storage(self):
+        storage_settings = get_settings().storage
+
+        if not storage_settings.is_production:
+            return LocalResumableStorage(self.uploads_dir)
+
+        bucket = storage_settings.s3_bucket
+        if not bucket:
+            raise HTTPException(status_code=500, detail="S3 bucket not configured")
+
+        try:
+            s3_client = self._build_s3_client()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Erro ao enviar arquivo para S3: {e}")
+
+        return S3ResumableStorage(s3_client, bucket)
+
+    def presigned_gateway(self) -> PresignedUploadGateway:
+        # Não depende de APP_ENV: basta um bucket (S3 ou um stand-in via AWS_ENDPOINT_URL).
+        storage_settings = get_settings().storage
+
+        bucket = storage_settings.s3_bucket
+        if not bucket:
+            raise HTTPException(status_code=500, detail="S3 bucket not configured")
+
+        try:
+            s3_client = self._build_s3_client()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Erro ao enviar arquivo para S3: {e}")
+
+        return PresignedUploadGateway(
+            s3_client,
+            bucket,
+            expires_seconds=storage_settings.presigned_url_expires_seconds,
+            part_size=storage_settings.s3_multipart_part_size_bytes,
+        )
@@ -0,0 +1,51 @@
+import tempfile
+from typing import AsyncIterator, Tuple
+
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from app.infrastructure.api.multipart_stream import DEFAULT_WRITE_CHUNK_BYTES
+
+# Chunks até esse tamanho ficam em memória; acima disso o spool vai para disco.
+DEFAULT_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
+
+async def spool_request_body(
+    stream: AsyncIterator[bytes],
+    max_bytes: int,
+    spool_memory_bytes: int = DEFAULT_SPOOL_MEMORY_BYTES,
+    write_chunk_bytes: int = DEFAULT_WRITE_CHUNK_BYTES,
+) -> Tuple[tempfile.SpooledTemporaryFile, int]:
+    """
+    Lê o corpo cru da requisição para um ``SpooledTemporaryFile`` sem passar
+    de ``max_bytes``. Escritas são agrupadas e feitas fora do event loop.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=spool_memory_bytes)
+    pending = []
+    pending_size = 0
+    size = 0
+
+    try:
+        async for data in stream:
+            size += len(data)
+            if size > max_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Chunk excede o limite de {max_bytes} bytes",
+                )
+
+            pending.append(data)
+            pending_size += len(data)
+            if pending_size >= write_chunk_bytes:
+                await run_in_threadpool(spool.write, b"".join(pending))
+                pending = []
+                pending_size = 0
+
+        if pending:
+            await run_in_threadpool(spool.write, b"".join(pending))
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+
+    return spool, size
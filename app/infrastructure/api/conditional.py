@@ -0,0 +1,17 @@
+from typing import Optional
+
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+
+    # If-None-Match usa comparação fraca (RFC 9110, 13.1.2).
+    return _strip_weak(etag) in {_strip_weak(candidate) for candidate in candidates}
@@ -1,5 +1,13 @@
 from fastapi import FastAPI, Depends
+from app.infrastructure.config.settings import install_reload_signal_handler
+from app.infrastructure.concurrency.bounded_executor import shutdown_upload_executor
 from app.infrastructure.db.database import init_schema
+from app.infrastructure.db.async_database import dispose_async_engine
+from app.infrastructure.events.status_hub import reset_status_hub
+from app.infrastructure.events.status_poller import start_status_poller, stop_status_poller
+from app.infrastructure.observability.logging_config import configure_logging, shutdown_logging
+from app.gateways.sqs_batch_producer import shutdown_sqs_producer
+from app.gateways.outbox_relay import start_outbox_relay, stop_outbox_relay
 
 app = FastAPI(
     title="Sistema de upload de videos",
@@ -8,6 +16,60 @@ app = FastAPI(
 )
 
 
+@app.on_event("startup")
+def startup_logging() -> None:
+    configure_logging()
+
+
 @app.on_event("startup")
 def startup_init_schema() -> None:
-    init_schema()
\ No newline at end of file
+    init_schema()
+
+
+@app.on_event("startup")
+def startup_install_settings_reload() -> None:
+    install_reload_signal_handler()
+
+
+@app.on_event("startup")
+def startup_outbox_relay() -> None:
+    start_outbox_relay()
+
+
+@app.on_event("startup")
+def startup_status_poller() -> None:
+    start_status_poller()
+
+
+@app.on_event("shutdown")
+def shutdown_upload_jobs() -> None:
+    shutdown_upload_executor()
+
+
+@app.on_event("shutdown")
+async def shutdown_async_engine() -> None:
+    await dispose_async_engine()
+
+
+@app.on_event("shutdown")
+def shutdown_status_hub() -> None:
+    # O poller entrega no hub atual; para antes de descartá-lo.
+    stop_status_poller()
+    reset_status_hub()
+
+
+@app.on_event("shutdown")
+def shutdown_outbox_relay() -> None:
+    stop_outbox_relay()
+
+
+@app.on_event("shutdown")
+def shutdown_sqs_batching() -> None:
+    # Drena o lote pendente antes de sair.
+    shutdown_sqs_producer()
+
+
+@app.on_event("shutdown")
+def shutdown_log_listener() -> None:
+    # Por último, para não perder o que os outros handlers de shutdown registrarem.
+    shutdown_logging()
@@ -0,0 +1,256 @@
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+try:
+    import python_multipart as multipart
+    from python_multipart.multipart import parse_options_header
+except ModuleNotFoundError:  # pragma: no cover
+    import multipart
+    from multipart.multipart import parse_options_header
+
+
+DEFAULT_WRITE_CHUNK_BYTES = 1024 * 1024
+MAX_FIELD_SIZE_BYTES = 64 * 1024
+
+
+@dataclass
+class StreamedUpload:
+    fields: Dict[str, str] = field(default_factory=dict)
+    filename: Optional[str] = None
+    content_type: Optional[str] = None
+    size: int = 0
+    saved_path: object = None
+    sha256: Optional[str] = None
+
+
+@dataclass
+class _Part:
+    headers: Dict[bytes, bytes] = field(default_factory=dict)
+    name: str = ""
+    filename: Optional[str] = None
+    data: bytearray = field(default_factory=bytearray)
+
+
+class MultipartUploadStream:
+    """
+    Lê um corpo multipart/form-data direto de ``request.stream()`` e envia os
+    bytes do arquivo para um sink à medida que chegam, sem SpooledTemporaryFile.
+
+    ``open_sink(filename)`` deve devolver um objeto com ``write(bytes)``,
+    ``close()`` (retorna o caminho salvo) e ``abort()``. ``on_file_start`` é
+    chamado com ``(filename, content_type, fields)`` antes do primeiro byte ser
+    persistido e pode levantar ``HTTPException`` para rejeitar o upload.
+
+    ``open_validator(filename)``, se informado, devolve um validador com
+    ``feed(bytes) -> bool`` e ``finish()``; o sink só é aberto depois que o
+    validador aceita o início do arquivo, e ``ValueError`` vira 400.
+
+    ``discard_saved(saved_path)``, se informado, apaga um arquivo já fechado
+    quando o corpo falha depois dele (segundo arquivo, campo inválido, corpo
+    truncado), para não sobrar arquivo sem vídeo no banco.
+    """
+
+    def __init__(
+        self,
+        headers,
+        stream: AsyncIterator[bytes],
+        open_sink: Callable[[str], object],
+        max_size_bytes: int,
+        file_field: str = "file",
+        on_file_start: Optional[Callable[[str, Optional[str], Dict[str, str]], None]] = None,
+        write_chunk_bytes: int = DEFAULT_WRITE_CHUNK_BYTES,
+        open_validator: Optional[Callable[[str], object]] = None,
+        discard_saved: Optional[Callable[[object], None]] = None,
+    ):
+        self.headers = headers
+        self.stream = stream
+        self.open_sink = open_sink
+        self.max_size_bytes = max_size_bytes
+        self.file_field = file_field
+        self.on_file_start = on_file_start
+        self.write_chunk_bytes = write_chunk_bytes
+        self.open_validator = open_validator
+        self.discard_saved = discard_saved
+
+        self._result = StreamedUpload()
+        self._events: List[Tuple[str, object]] = []
+        self._part = _Part()
+        self._header_name = b""
+        self._header_value = b""
+        self._sink = None
+        self._in_file = False
+        self._validator = None
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+
+    def _on_part_begin(self) -> None:
+        self._part = _Part()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._part.headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._part.headers.get(b"content-disposition", b""))
+        self._part.name = options.get(b"name", b"").decode("utf-8", errors="replace")
+
+        if b"filename" in options:
+            self._part.filename = options[b"filename"].decode("utf-8", errors="replace")
+            self._events.append(("file_start", self._part))
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._part.filename is not None:
+            self._events.append(("file_data", data[start:end]))
+            return
+
+        if len(self._part.data) + (end - start) > MAX_FIELD_SIZE_BYTES:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Campo do formulário excede o tamanho permitido")
+        self._part.data.extend(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._part.filename is not None:
+            self._events.append(("file_end", self._part))
+            return
+
+        self._result.fields[self._part.name] = self._part.data.decode("utf-8", errors="replace")
+
+    def _build_parser(self):
+        _, params = parse_options_header(self.headers.get("content-type", ""))
+        boundary = params.get(b"boundary")
+        if not boundary:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Requisição multipart sem boundary")
+
+        callbacks = {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        }
+
+        return multipart.MultipartParser(boundary, callbacks)
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+
+        data = b"".join(self._pending)
+        self._pending = []
+        self._pending_size = 0
+        await run_in_threadpool(self._sink.write, data)
+
+    async def _handle_file_start(self, part: _Part) -> None:
+        if part.name != self.file_field:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Campo de arquivo inesperado: {part.name}")
+        if self._result.filename is not None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Apenas um arquivo é permitido por requisição")
+
+        content_type = part.headers.get(b"content-type")
+        self._result.filename = part.filename
+        self._result.content_type = content_type.decode("latin-1") if content_type else None
+
+        if self.on_file_start is not None:
+            self.on_file_start(self._result.filename, self._result.content_type, dict(self._result.fields))
+
+        self._in_file = True
+        if self.open_validator is not None:
+            self._validator = self.open_validator(self._result.filename)
+        else:
+            self._sink = await run_in_threadpool(self.open_sink, self._result.filename)
+
+    async def _validate_head(self, data: Optional[bytes]) -> None:
+        try:
+            accepted = self._validator.finish() if data is None else self._validator.feed(data)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        if accepted:
+            self._validator = None
+            self._sink = await run_in_threadpool(self.open_sink, self._result.filename)
+
+    async def _handle_file_data(self, data: bytes) -> None:
+        self._result.size += len(data)
+        if self._result.size > self.max_size_bytes:
+            max_size_mb = self.max_size_bytes // (1024 * 1024)
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Arquivo excede o limite de {max_size_mb}MB",
+            )
+
+        self._pending.append(data)
+        self._pending_size += len(data)
+
+        if self._validator is not None:
+            await self._validate_head(data)
+
+        if self._sink is not None and self._pending_size >= self.write_chunk_bytes:
+            await self._flush()
+
+    async def _handle_file_end(self) -> None:
+        if self._validator is not None:
+            await self._validate_head(None)
+
+        await self._flush()
+        self._result.sha256 = getattr(self._sink, "sha256", None)
+        self._result.saved_path = await run_in_threadpool(self._sink.close)
+        self._sink = None
+        self._in_file = False
+
+    async def _process_events(self) -> None:
+        events = self._events
+        self._events = []
+
+        for kind, payload in events:
+            if kind == "file_start":
+                await self._handle_file_start(payload)
+            elif kind == "file_data":
+                await self._handle_file_data(payload)
+            else:
+                await self._handle_file_end()
+
+    def _feed(self, parser, chunk: Optional[bytes]) -> None:
+        try:
+            if chunk is None:
+                parser.finalize()
+            else:
+                parser.write(chunk)
+        except multipart.exceptions.ParseError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Corpo multipart inválido: {e}")
+
+    async def parse(self) -> StreamedUpload:
+        parser = self._build_parser()
+
+        try:
+            async for chunk in self.stream:
+                self._feed(parser, chunk)
+                await self._process_events()
+
+            self._feed(parser, None)
+            await self._process_events()
+
+            if self._in_file:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Corpo multipart incompleto")
+        except BaseException:
+            if self._sink is not None:
+                sink = self._sink
+                self._sink = None
+                await run_in_threadpool(sink.abort)
+            if self._result.saved_path is not None and self.discard_saved is not None:
+                saved_path = self._result.saved_path
+                self._result.saved_path = None
+                await run_in_threadpool(self.discard_saved, saved_path)
+            raise
+
+        return self._result
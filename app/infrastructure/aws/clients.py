@@ -0,0 +1,63 @@
+import threading
+
+import boto3
+from botocore.config import Config
+
+from app.infrastructure.config.settings import AwsSettings, get_settings
+
+
+_clients = {}
+_lock = threading.Lock()
+
+
+def build_client_config(aws_settings: AwsSettings) -> Config:
+    return Config(
+        max_pool_connections=aws_settings.max_pool_connections,
+        retries={"max_attempts": aws_settings.max_attempts, "mode": "standard"},
+        connect_timeout=aws_settings.connect_timeout_seconds,
+        read_timeout=aws_settings.read_timeout_seconds,
+        tcp_keepalive=True,
+    )
+
+
+def _create_client(service_name: str):
+    # Sessões boto3 não são thread-safe; clientes são. Cada cliente nasce de
+    # uma sessão própria, sob o lock, e depois é compartilhado pelo processo.
+    session = boto3.session.Session()
+    aws_settings = get_settings().aws
+
+    return session.client(
+        service_name,
+        region_name=aws_settings.region,
+        aws_access_key_id=aws_settings.access_key_id,
+        aws_secret_access_key=aws_settings.secret_access_key,
+        endpoint_url=aws_settings.endpoint_url,
+        config=build_client_config(aws_settings),
+    )
+
+
+def get_client(service_name: str):
+    client = _clients.get(service_name)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(service_name)
+        if client is None:
+            client = _create_client(service_name)
+            _clients[service_name] = client
+
+    return client
+
+
+def get_s3_client():
+    return get_client("s3")
+
+
+def get_sqs_client():
+    return get_client("sqs")
+
+
+def reset_clients() -> None:
+    with _lock:
+        _clients.clear()
@@ -0,0 +1,70 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple
+
+
+class CacheBackend(ABC):
+    """Backend compartilhado entre réplicas (ex.: Redis). Valores são strings JSON."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        pass
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    # Substituto local do backend compartilhado, usado em testes e desenvolvimento.
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._data: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self.clock():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        with self._lock:
+            self._data[key] = (value, self.clock() + ttl_seconds if ttl_seconds else None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value, expires_at = self._data.get(key, ("0", None))
+            value = str(int(value) + 1)
+            self._data[key] = (value, expires_at)
+            return int(value)
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ModuleNotFoundError as e:
+            raise RuntimeError("CACHE_REDIS_URL configurado, mas o pacote redis não está instalado") from e
+
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._client.set(key, value, ex=ttl_seconds or None)
+
+    def incr(self, key: str) -> int:
+        return self._client.incr(key)
@@ -0,0 +1,213 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable, Optional
+
+from app.infrastructure.cache.backends import CacheBackend, RedisCacheBackend
+from app.infrastructure.config.settings import (
+    DEFAULT_VIDEO_LIST_CACHE_MAX_ENTRIES as DEFAULT_MAX_ENTRIES,
+    DEFAULT_VIDEO_LIST_CACHE_TTL_SECONDS as DEFAULT_TTL_SECONDS,
+    get_settings,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class VideoListCache:
+    """
+    Cache read-through da listagem de vídeos por usuário: LRU local com TTL e,
+    opcionalmente, um backend compartilhado. A invalidação incrementa a versão
+    do usuário, que faz parte da chave, então páginas antigas deixam de casar
+    em todas as réplicas que leem a versão do backend.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        backend: Optional[CacheBackend] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.backend = backend
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.backend_hits = 0
+        self.backend_errors = 0
+
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @staticmethod
+    def _version_key(user_id: int) -> str:
+        return f"videos:{user_id}:version"
+
+    def _version(self, user_id: int) -> int:
+        if self.backend is not None:
+            try:
+                return int(self.backend.get(self._version_key(user_id)) or 0)
+            except Exception:
+                self._backend_failed("ler versão")
+
+        with self._lock:
+            return self._versions.get(user_id, 0)
+
+    def _key(self, user_id: int, page: Hashable) -> str:
+        return f"videos:{user_id}:v{self._version(user_id)}:{page}"
+
+    def _backend_failed(self, action: str) -> None:
+        with self._lock:
+            self.backend_errors += 1
+        logger.warning("Falha no backend de cache ao %s", action, exc_info=True)
+
+    def get(self, user_id: int, page: Hashable = None):
+        if not self.enabled:
+            return None
+
+        return self._lookup(self._key(user_id, page))
+
+    def _lookup(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        if self.backend is not None:
+            try:
+                raw = self.backend.get(key)
+            except Exception:
+                raw = None
+                self._backend_failed("ler listagem")
+
+            if raw is not None:
+                value = json.loads(raw)
+                self._store_local(key, value)
+                with self._lock:
+                    self.hits += 1
+                    self.backend_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _store_local(self, key: str, value) -> None:
+        with self._lock:
+            self._entries[key] = (value, self.clock() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def set(self, user_id: int, page: Hashable, value) -> None:
+        if not self.enabled:
+            return
+
+        self._store(self._key(user_id, page), value)
+
+    def _store(self, key: str, value) -> None:
+        self._store_local(key, value)
+
+        if self.backend is not None:
+            try:
+                self.backend.set(key, json.dumps(value), self.ttl_seconds)
+            except Exception:
+                self._backend_failed("gravar listagem")
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+        if self.backend is not None:
+            try:
+                self.backend.incr(self._version_key(user_id))
+            except Exception:
+                self._backend_failed("invalidar usuário")
+
+    # A chave (com a versão) é lida uma vez, antes do loader: se uma invalidação
+    # ocorrer durante a consulta, o valor vai para a versão antiga, que ninguém
+    # mais lê, em vez de ser servido como atual até o TTL.
+    def get_or_load(self, user_id: int, page: Hashable, loader: Callable[[], object]):
+        if not self.enabled:
+            return loader()
+
+        key = self._key(user_id, page)
+        value = self._lookup(key)
+        if value is None:
+            value = loader()
+            self._store(key, value)
+        return value
+
+    async def get_or_load_async(self, user_id: int, page: Hashable, loader: Callable[[], Awaitable[object]]):
+        if not self.enabled:
+            return await loader()
+
+        key = self._key(user_id, page)
+        value = self._lookup(key)
+        if value is None:
+            value = await loader()
+            self._store(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self.hits = 0
+            self.misses = 0
+            self.backend_hits = 0
+            self.backend_errors = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "backend": type(self.backend).__name__ if self.backend is not None else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "backend_hits": self.backend_hits,
+                "backend_errors": self.backend_errors,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_video_list_cache: Optional[VideoListCache] = None
+_video_list_cache_lock = threading.Lock()
+
+
+def get_video_list_cache() -> VideoListCache:
+    global _video_list_cache
+    if _video_list_cache is None:
+        with _video_list_cache_lock:
+            if _video_list_cache is None:
+                cache_settings = get_settings().cache
+                backend = RedisCacheBackend(cache_settings.redis_url) if cache_settings.redis_url else None
+                _video_list_cache = VideoListCache(
+                    ttl_seconds=cache_settings.video_list_ttl_seconds,
+                    max_entries=cache_settings.video_list_max_entries,
+                    backend=backend,
+                )
+
+    return _video_list_cache
+
+
+def reset_video_list_cache() -> None:
+    global _video_list_cache
+    with _video_list_cache_lock:
+        _video_list_cache = None
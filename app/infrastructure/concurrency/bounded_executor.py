@@ -0,0 +1,116 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from app.infrastructure.config.settings import get_settings
+
+
+class ExecutorSaturatedError(RuntimeError):
+    pass
+
+
+class BoundedExecutor:
+    """
+    ThreadPoolExecutor com fila limitada: aceita até ``max_workers`` jobs em
+    execução mais ``max_queue`` aguardando; acima disso ``submit`` levanta
+    ``ExecutorSaturatedError`` em vez de enfileirar sem limite.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, name: str = "bounded"):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.name = name
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    def _run(self, fn: Callable, *args, **kwargs):
+        with self._lock:
+            self._active += 1
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        else:
+            with self._lock:
+                self._completed += 1
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._pending -= 1
+
+        return result
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturatedError(f"Executor {self.name} saturado")
+            self._pending += 1
+
+        try:
+            return self._executor.submit(self._run, fn, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queued": self._pending - self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+_upload_executor: Optional[BoundedExecutor] = None
+_upload_executor_lock = threading.Lock()
+
+
+def get_upload_executor() -> BoundedExecutor:
+    global _upload_executor
+
+    executor = _upload_executor
+    if executor is not None:
+        return executor
+
+    with _upload_executor_lock:
+        if _upload_executor is None:
+            executor_settings = get_settings().executor
+            _upload_executor = BoundedExecutor(
+                max_workers=executor_settings.upload_workers,
+                max_queue=executor_settings.upload_queue_size,
+                name="upload",
+            )
+        return _upload_executor
+
+
+def shutdown_upload_executor(wait: bool = True) -> None:
+    global _upload_executor
+
+    with _upload_executor_lock:
+        executor = _upload_executor
+        _upload_executor = None
+
+    if executor is not None:
+        executor.shutdown(wait=wait)
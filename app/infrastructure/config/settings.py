@@ -0,0 +1,367 @@
+import logging
+import os
+import signal
+import threading
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_UPLOAD_SIZE_MB = 100
+DEFAULT_RESUMABLE_MAX_UPLOAD_SIZE_MB = 2048
+DEFAULT_RESUMABLE_MAX_CHUNK_SIZE_MB = 64
+DEFAULT_RESUMABLE_SESSION_TTL_HOURS = 24
+DEFAULT_BATCH_UPLOAD_MAX_FILES = 20
+DEFAULT_BATCH_UPLOAD_CONCURRENCY = 4
+DEFAULT_S3_MULTIPART_PART_SIZE_MB = 8
+DEFAULT_S3_MULTIPART_CONCURRENCY = 4
+DEFAULT_PRESIGNED_URL_EXPIRES_SECONDS = 3600
+DEFAULT_AWS_MAX_POOL_CONNECTIONS = 50
+DEFAULT_AWS_MAX_ATTEMPTS = 3
+DEFAULT_AWS_CONNECT_TIMEOUT_SECONDS = 5
+DEFAULT_AWS_READ_TIMEOUT_SECONDS = 60
+DEFAULT_JWKS_CACHE_TTL_SECONDS = 3600
+DEFAULT_JWKS_CACHE_STALE_SECONDS = 86400
+DEFAULT_JWKS_MIN_REFETCH_INTERVAL_SECONDS = 30
+DEFAULT_AUTH_TOKEN_CACHE_SIZE = 1024
+DEFAULT_UPLOAD_EXECUTOR_WORKERS = 4
+DEFAULT_VIDEO_LIST_CACHE_TTL_SECONDS = 10
+DEFAULT_VIDEO_LIST_CACHE_MAX_ENTRIES = 4096
+DEFAULT_STATUS_POLL_INTERVAL_SECONDS = 5
+DEFAULT_SQS_BATCH_LINGER_MS = 50
+DEFAULT_SQS_BATCH_MAX_ATTEMPTS = 3
+DEFAULT_SQS_BATCH_RETRY_BACKOFF_MS = 100
+DEFAULT_SQS_ACK_TIMEOUT_SECONDS = 10
+DEFAULT_OUTBOX_BATCH_SIZE = 50
+DEFAULT_OUTBOX_POLL_INTERVAL_MS = 500
+DEFAULT_OUTBOX_RETENTION_HOURS = 24
+DEFAULT_OUTBOX_MAX_ATTEMPTS = 10
+DEFAULT_DB_POOL_SIZE = 5
+DEFAULT_DB_MAX_OVERFLOW = 10
+DEFAULT_DB_POOL_TIMEOUT_SECONDS = 30
+DEFAULT_DB_POOL_RECYCLE_SECONDS = 1800
+DEFAULT_UPLOAD_EXECUTOR_QUEUE_SIZE = 16
+DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_LOG_FORMAT = "json"
+DEFAULT_LOG_QUEUE_SIZE = 10000
+
+
+def _as_bool(value: Optional[str], default: bool) -> bool:
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _as_int(value: Optional[str], default: int, minimum: int = 1) -> int:
+    try:
+        parsed = int(value) if value is not None else default
+        if parsed < minimum:
+            raise ValueError()
+        return parsed
+    except (ValueError, TypeError):
+        return default
+
+
+@dataclass(frozen=True)
+class AuthSettings:
+    required: bool
+    cognito_issuer: Optional[str]
+    cognito_client_id: Optional[str]
+    jwks_cache_ttl_seconds: int
+    jwks_cache_stale_seconds: int
+    jwks_min_refetch_interval_seconds: int
+    token_cache_size: int
+    internal_token: Optional[str]
+
+
+@dataclass(frozen=True)
+class AwsSettings:
+    region: str
+    endpoint_url: Optional[str]
+    access_key_id: Optional[str] = field(repr=False)
+    secret_access_key: Optional[str] = field(repr=False)
+    max_pool_connections: int
+    max_attempts: int
+    connect_timeout_seconds: int
+    read_timeout_seconds: int
+
+
+@dataclass(frozen=True)
+class StorageSettings:
+    app_env: str
+    s3_bucket: Optional[str]
+    s3_multipart_part_size_bytes: int
+    s3_multipart_concurrency: int
+    presigned_url_expires_seconds: int
+    dedup_enabled: bool
+
+    @property
+    def is_production(self) -> bool:
+        return self.app_env == "production"
+
+
+@dataclass(frozen=True)
+class QueueSettings:
+    video_processing_queue_url: Optional[str]
+    batching_enabled: bool
+    batch_linger_ms: int
+    batch_max_attempts: int
+    batch_retry_backoff_ms: int
+    ack_timeout_seconds: int
+    outbox_enabled: bool
+    outbox_batch_size: int
+    outbox_poll_interval_ms: int
+    outbox_retention_hours: int
+    outbox_max_attempts: int
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    url: Optional[str] = field(repr=False)
+    secret: Optional[str] = field(repr=False)
+    secret_name: Optional[str]
+    pool_size: int
+    max_overflow: int
+    pool_timeout_seconds: int
+    pool_recycle_seconds: int
+    pool_pre_ping: bool
+
+
+@dataclass(frozen=True)
+class LimitsSettings:
+    max_upload_size_mb: int
+    resumable_max_upload_size_mb: int
+    resumable_max_chunk_size_mb: int
+    resumable_session_ttl_hours: int
+    batch_upload_max_files: int
+    batch_upload_concurrency: int
+
+    @property
+    def max_upload_size_bytes(self) -> int:
+        return self.max_upload_size_mb * 1024 * 1024
+
+    @property
+    def resumable_max_upload_size_bytes(self) -> int:
+        return self.resumable_max_upload_size_mb * 1024 * 1024
+
+    @property
+    def resumable_max_chunk_size_bytes(self) -> int:
+        return self.resumable_max_chunk_size_mb * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ExecutorSettings:
+    upload_workers: int
+    upload_queue_size: int
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    video_list_ttl_seconds: int
+    video_list_max_entries: int
+    status_poll_interval_seconds: int
+    redis_url: Optional[str] = field(repr=False)
+
+
+@dataclass(frozen=True)
+class LoggingSettings:
+    level: str
+    format: str
+    logger_levels: Mapping[str, str]
+    sql_echo: bool
+    async_handlers: bool
+    queue_size: int
+
+
+@dataclass(frozen=True)
+class Settings:
+    auth: AuthSettings
+    aws: AwsSettings
+    storage: StorageSettings
+    queue: QueueSettings
+    database: DatabaseSettings
+    limits: LimitsSettings
+    executor: ExecutorSettings
+    cache: CacheSettings
+    logging: LoggingSettings
+
+
+def _as_level(value: Optional[str], default: str) -> str:
+    level = (value or "").strip().upper()
+    return level if level in logging.getLevelNamesMapping() else default
+
+
+def _as_logger_levels(value: Optional[str]) -> Mapping[str, str]:
+    # Formato: "botocore=WARNING,app.gateways=DEBUG"; entradas inválidas são ignoradas.
+    levels = {}
+    for entry in (value or "").split(","):
+        name, _, level = entry.partition("=")
+        name, level = name.strip(), _as_level(level, "")
+        if name and level:
+            levels[name] = level
+    return levels
+
+
+def load_settings(environ: Optional[Mapping[str, str]] = None) -> Settings:
+    env = os.environ if environ is None else environ
+
+    app_env = env.get("APP_ENV", "development")
+    issuer = env.get("COGNITO_ISSUER")
+    client_id = env.get("COGNITO_CLIENT_ID")
+    default_auth_required = app_env.lower() == "production" or bool(issuer and client_id)
+
+    return Settings(
+        auth=AuthSettings(
+            required=_as_bool(env.get("AUTH_REQUIRED"), default_auth_required),
+            cognito_issuer=issuer,
+            cognito_client_id=client_id,
+            jwks_cache_ttl_seconds=_as_int(env.get("JWKS_CACHE_TTL_SECONDS"), DEFAULT_JWKS_CACHE_TTL_SECONDS, 0),
+            jwks_cache_stale_seconds=_as_int(env.get("JWKS_CACHE_STALE_SECONDS"), DEFAULT_JWKS_CACHE_STALE_SECONDS, 0),
+            jwks_min_refetch_interval_seconds=_as_int(
+                env.get("JWKS_MIN_REFETCH_INTERVAL_SECONDS"), DEFAULT_JWKS_MIN_REFETCH_INTERVAL_SECONDS, 0
+            ),
+            token_cache_size=_as_int(env.get("AUTH_TOKEN_CACHE_SIZE"), DEFAULT_AUTH_TOKEN_CACHE_SIZE, 0),
+            internal_token=env.get("INTERNAL_API_TOKEN") or None,
+        ),
+        aws=AwsSettings(
+            region=env.get("AWS_REGION") or env.get("AWS_DEFAULT_REGION") or "us-east-1",
+            endpoint_url=env.get("AWS_ENDPOINT_URL"),
+            access_key_id=env.get("AWS_ACCESS_KEY_ID"),
+            secret_access_key=env.get("AWS_SECRET_ACCESS_KEY"),
+            max_pool_connections=_as_int(env.get("AWS_MAX_POOL_CONNECTIONS"), DEFAULT_AWS_MAX_POOL_CONNECTIONS),
+            max_attempts=_as_int(env.get("AWS_MAX_ATTEMPTS"), DEFAULT_AWS_MAX_ATTEMPTS),
+            connect_timeout_seconds=_as_int(env.get("AWS_CONNECT_TIMEOUT_SECONDS"), DEFAULT_AWS_CONNECT_TIMEOUT_SECONDS),
+            read_timeout_seconds=_as_int(env.get("AWS_READ_TIMEOUT_SECONDS"), DEFAULT_AWS_READ_TIMEOUT_SECONDS),
+        ),
+        storage=StorageSettings(
+            app_env=app_env,
+            s3_bucket=env.get("AWS_S3_BUCKET"),
+            s3_multipart_part_size_bytes=_as_int(
+                env.get("S3_MULTIPART_PART_SIZE_MB"), DEFAULT_S3_MULTIPART_PART_SIZE_MB
+            ) * 1024 * 1024,
+            s3_multipart_concurrency=_as_int(env.get("S3_MULTIPART_CONCURRENCY"), DEFAULT_S3_MULTIPART_CONCURRENCY),
+            presigned_url_expires_seconds=_as_int(
+                env.get("PRESIGNED_URL_EXPIRES_SECONDS"), DEFAULT_PRESIGNED_URL_EXPIRES_SECONDS
+            ),
+            dedup_enabled=_as_bool(env.get("UPLOAD_DEDUP_ENABLED"), False),
+        ),
+        queue=QueueSettings(
+            video_processing_queue_url=env.get("SQS_VIDEO_PROCESSING_QUEUE"),
+            batching_enabled=_as_bool(env.get("SQS_BATCHING_ENABLED"), False),
+            batch_linger_ms=_as_int(env.get("SQS_BATCH_LINGER_MS"), DEFAULT_SQS_BATCH_LINGER_MS, 0),
+            batch_max_attempts=_as_int(env.get("SQS_BATCH_MAX_ATTEMPTS"), DEFAULT_SQS_BATCH_MAX_ATTEMPTS),
+            batch_retry_backoff_ms=_as_int(
+                env.get("SQS_BATCH_RETRY_BACKOFF_MS"), DEFAULT_SQS_BATCH_RETRY_BACKOFF_MS, 0
+            ),
+            ack_timeout_seconds=_as_int(env.get("SQS_ACK_TIMEOUT_SECONDS"), DEFAULT_SQS_ACK_TIMEOUT_SECONDS),
+            outbox_enabled=_as_bool(env.get("OUTBOX_ENABLED"), False),
+            outbox_batch_size=_as_int(env.get("OUTBOX_BATCH_SIZE"), DEFAULT_OUTBOX_BATCH_SIZE),
+            outbox_poll_interval_ms=_as_int(env.get("OUTBOX_POLL_INTERVAL_MS"), DEFAULT_OUTBOX_POLL_INTERVAL_MS),
+            outbox_retention_hours=_as_int(env.get("OUTBOX_RETENTION_HOURS"), DEFAULT_OUTBOX_RETENTION_HOURS, 0),
+            outbox_max_attempts=_as_int(env.get("OUTBOX_MAX_ATTEMPTS"), DEFAULT_OUTBOX_MAX_ATTEMPTS),
+        ),
+        database=DatabaseSettings(
+            url=env.get("DATABASE_URL") or env.get("SQLALCHEMY_DATABASE_URL"),
+            secret=env.get("DB_SECRET"),
+            secret_name=env.get("DB_SECRET_NAME"),
+            pool_size=_as_int(env.get("DB_POOL_SIZE"), DEFAULT_DB_POOL_SIZE),
+            max_overflow=_as_int(env.get("DB_MAX_OVERFLOW"), DEFAULT_DB_MAX_OVERFLOW, 0),
+            pool_timeout_seconds=_as_int(env.get("DB_POOL_TIMEOUT_SECONDS"), DEFAULT_DB_POOL_TIMEOUT_SECONDS),
+            pool_recycle_seconds=_as_int(env.get("DB_POOL_RECYCLE_SECONDS"), DEFAULT_DB_POOL_RECYCLE_SECONDS, -1),
+            pool_pre_ping=_as_bool(env.get("DB_POOL_PRE_PING"), True),
+        ),
+        limits=LimitsSettings(
+            max_upload_size_mb=_as_int(env.get("MAX_UPLOAD_SIZE_MB"), DEFAULT_MAX_UPLOAD_SIZE_MB),
+            resumable_max_upload_size_mb=_as_int(
+                env.get("RESUMABLE_MAX_UPLOAD_SIZE_MB"), DEFAULT_RESUMABLE_MAX_UPLOAD_SIZE_MB
+            ),
+            resumable_max_chunk_size_mb=_as_int(
+                env.get("RESUMABLE_MAX_CHUNK_SIZE_MB"), DEFAULT_RESUMABLE_MAX_CHUNK_SIZE_MB
+            ),
+            resumable_session_ttl_hours=_as_int(
+                env.get("RESUMABLE_SESSION_TTL_HOURS"), DEFAULT_RESUMABLE_SESSION_TTL_HOURS
+            ),
+            batch_upload_max_files=_as_int(env.get("BATCH_UPLOAD_MAX_FILES"), DEFAULT_BATCH_UPLOAD_MAX_FILES),
+            batch_upload_concurrency=_as_int(env.get("BATCH_UPLOAD_CONCURRENCY"), DEFAULT_BATCH_UPLOAD_CONCURRENCY),
+        ),
+        executor=ExecutorSettings(
+            upload_workers=_as_int(env.get("UPLOAD_EXECUTOR_WORKERS"), DEFAULT_UPLOAD_EXECUTOR_WORKERS),
+            upload_queue_size=_as_int(env.get("UPLOAD_EXECUTOR_QUEUE_SIZE"), DEFAULT_UPLOAD_EXECUTOR_QUEUE_SIZE, 0),
+        ),
+        cache=CacheSettings(
+            video_list_ttl_seconds=_as_int(
+                env.get("VIDEO_LIST_CACHE_TTL_SECONDS"), DEFAULT_VIDEO_LIST_CACHE_TTL_SECONDS, 0
+            ),
+            video_list_max_entries=_as_int(
+                env.get("VIDEO_LIST_CACHE_MAX_ENTRIES"), DEFAULT_VIDEO_LIST_CACHE_MAX_ENTRIES
+            ),
+            status_poll_interval_seconds=_as_int(
+                env.get("STATUS_POLL_INTERVAL_SECONDS"), DEFAULT_STATUS_POLL_INTERVAL_SECONDS, 0
+            ),
+            redis_url=env.get("CACHE_REDIS_URL"),
+        ),
+        logging=LoggingSettings(
+            level=_as_level(env.get("LOG_LEVEL"), DEFAULT_LOG_LEVEL),
+            format="text" if (env.get("LOG_FORMAT") or "").strip().lower() == "text" else DEFAULT_LOG_FORMAT,
+            logger_levels=_as_logger_levels(env.get("LOG_LEVELS")),
+            sql_echo=_as_bool(env.get("LOG_SQL_ECHO"), False),
+            async_handlers=_as_bool(env.get("LOG_ASYNC"), True),
+            queue_size=_as_int(env.get("LOG_QUEUE_SIZE"), DEFAULT_LOG_QUEUE_SIZE),
+        ),
+    )
+
+
+_settings: Optional[Settings] = None
+_lock = threading.Lock()
+# Marcado pelo handler de SIGHUP; a recarga acontece no próximo get_settings, fora do contexto do sinal.
+_reload_requested = False
+
+
+def get_settings() -> Settings:
+    settings = _settings
+    if settings is not None and not _reload_requested:
+        return settings
+
+    with _lock:
+        if _settings is None or _reload_requested:
+            reloaded = _reload_locked()
+            if settings is not None:
+                logger.info("Configuração recarregada via SIGHUP")
+            return reloaded
+        return _settings
+
+
+def _reload_locked() -> Settings:
+    global _settings, _reload_requested
+    _reload_requested = False
+    _settings = load_settings()
+    return _settings
+
+
+def reload_settings() -> Settings:
+    with _lock:
+        return _reload_locked()
+
+
+def request_reload() -> None:
+    global _reload_requested
+    _reload_requested = True
+
+
+def install_reload_signal_handler() -> bool:
+    if not hasattr(signal, "SIGHUP"):
+        return False
+
+    def _handle_sighup(_signum, _frame):
+        # Handlers rodam na thread principal entre bytecodes: se ela estiver dentro de
+        # get_settings segurando _lock, tomar o lock aqui travaria o processo.
+        request_reload()
+
+    try:
+        signal.signal(signal.SIGHUP, _handle_sighup)
+    except ValueError:
+        # signal.signal só pode ser chamado na thread principal.
+        return False
+
+    return True
@@ -0,0 +1,90 @@
+import threading
+from typing import Optional
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.infrastructure.db import database
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url) -> URL:
+    url = make_url(url)
+    backend = url.get_backend_name()
+
+    if backend not in ASYNC_DRIVERS or url.get_driver_name() in {"asyncpg", "aiosqlite"}:
+        return url
+
+    url = url.set(drivername=ASYNC_DRIVERS[backend])
+
+    # asyncpg não entende o sslmode do libpq; usa o parâmetro ssl equivalente.
+    if backend == "postgresql" and "sslmode" in url.query:
+        query = dict(url.query)
+        query["ssl"] = query.pop("sslmode")
+        url = url.set(query=query)
+
+    return url
+
+
+def is_memory_sqlite(url) -> bool:
+    url = make_url(url)
+    if url.get_backend_name() != "sqlite":
+        return False
+
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_lock = threading.Lock()
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine, _async_session_factory
+
+    if _async_engine is not None:
+        return _async_engine
+
+    with _lock:
+        if _async_engine is None:
+            # Mesmo banco do engine síncrono, só troca o driver.
+            if is_memory_sqlite(database.engine.url):
+                # Cada engine abriria o seu próprio banco vazio: a listagem não veria as escritas.
+                raise RuntimeError(
+                    "Database configuration error: in-memory SQLite cannot be shared with the async engine. "
+                    "Use a file-based SQLite URL or PostgreSQL."
+                )
+            url = to_async_url(database.engine.url)
+            _async_engine = create_async_engine(url, **database._pool_kwargs(url))
+            _async_session_factory = async_sessionmaker(
+                bind=_async_engine,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+        return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    get_async_engine()
+    return _async_session_factory
+
+
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_session_factory
+
+    with _lock:
+        engine = _async_engine
+        _async_engine = None
+        _async_session_factory = None
+
+    if engine is not None:
+        await engine.dispose()
@@ -1,16 +1,20 @@
-import os
 import json
 from urllib.parse import quote_plus
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-def _build_db_url() -> str:
-    direct = os.getenv("DATABASE_URL") or os.getenv("SQLALCHEMY_DATABASE_URL")
+from app.infrastructure.config.settings import Settings, load_settings
+
+def _build_db_url(settings: Settings = None) -> str:
+    # O engine é montado uma vez no import, então lê o ambiente atual em vez do snapshot em cache.
+    settings = settings or load_settings()
+    direct = settings.database.url
 
     if direct:
         return direct
 
-    injected_secret = os.getenv("DB_SECRET")
+    injected_secret = settings.database.secret
     if injected_secret:
         try:
             # Permite também passar a URL direta via DB_SECRET.
@@ -36,12 +40,12 @@ def _build_db_url() -> str:
                 "or set DB_SECRET_NAME to fetch from Secrets Manager."
             ) from e
     
-    secret_name = os.getenv("DB_SECRET_NAME")
+    secret_name = settings.database.secret_name
     if secret_name:
         try:
             import boto3
 
-            region = os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
+            region = settings.aws.region
             sm = boto3.client("secretsmanager", region_name=region)
             sec = sm.get_secret_value(SecretId=secret_name)["SecretString"]
             data = json.loads(sec)
@@ -67,7 +71,32 @@ def _build_db_url() -> str:
         "Database configuration error: DATABASE_URL/SQLALCHEMY_DATABASE_URL not set and neither DB_SECRET nor DB_SECRET_NAME were provided."
     )
 
-engine = create_engine(_build_db_url())
+def _pool_kwargs(url, settings: Settings = None) -> dict:
+    # SQLite usa pools próprios (Singleton/Null) que não aceitam tamanho/overflow.
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+
+    db_settings = (settings or load_settings()).database
+    return {
+        "pool_size": db_settings.pool_size,
+        "max_overflow": db_settings.max_overflow,
+        "pool_timeout": db_settings.pool_timeout_seconds,
+        "pool_recycle": db_settings.pool_recycle_seconds,
+        "pool_pre_ping": db_settings.pool_pre_ping,
+    }
+
+
+def _create_engine(url: str):
+    from app.infrastructure.db.pool_metrics import InstrumentedQueuePool
+
+    pool_kwargs = _pool_kwargs(url)
+    if pool_kwargs:
+        pool_kwargs["poolclass"] = InstrumentedQueuePool
+
+    return create_engine(url, **pool_kwargs)
+
+
+engine = _create_engine(_build_db_url())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -85,14 +114,95 @@ def init_schema() -> None:
             PRIMARY KEY(id)
         );
         """
+        create_video_user_index_sql = """
+        CREATE INDEX IF NOT EXISTS ix_video_user_id_id ON video (user_id, id DESC);
+        """
+        add_video_content_hash_sql = """
+        ALTER TABLE video ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+        """
+        create_video_active_index_sql = """
+        CREATE INDEX IF NOT EXISTS ix_video_user_id_active ON video (user_id) WHERE status NOT IN (1, 2);
+        """
+        create_video_content_hash_index_sql = """
+        CREATE INDEX IF NOT EXISTS ix_video_content_hash ON video (content_hash);
+        """
+        create_content_object_table_sql = """
+        CREATE TABLE IF NOT EXISTS content_object(
+            user_id INT NOT NULL,
+            sha256 VARCHAR(64) NOT NULL,
+            storage_path VARCHAR(512) NOT NULL,
+            size BIGINT NULL,
+            video_id INT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+            PRIMARY KEY(user_id, sha256)
+        );
+        """
+        create_outbox_table_sql = """
+        CREATE TABLE IF NOT EXISTS outbox_message(
+            id INT GENERATED ALWAYS AS IDENTITY,
+            aggregate_id INT NULL,
+            dedup_id VARCHAR(64) NOT NULL UNIQUE,
+            payload TEXT NOT NULL,
+            attempts INT NOT NULL DEFAULT 0,
+            last_error VARCHAR(255) NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+            available_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+            sent_at TIMESTAMP NULL,
+            failed_at TIMESTAMP NULL,
+            PRIMARY KEY(id)
+        );
+        """
+        create_outbox_pending_index_sql = """
+        CREATE INDEX IF NOT EXISTS ix_outbox_message_pending ON outbox_message (available_at, id)
+        WHERE sent_at IS NULL AND failed_at IS NULL;
+        """
+        create_outbox_sent_index_sql = """
+        CREATE INDEX IF NOT EXISTS ix_outbox_message_sent ON outbox_message (sent_at) WHERE sent_at IS NOT NULL;
+        """
+        create_upload_session_table_sql = """
+        CREATE TABLE IF NOT EXISTS upload_session(
+            id VARCHAR(32) NOT NULL,
+            user_id INT NOT NULL,
+            title VARCHAR(255) NOT NULL,
+            filename VARCHAR(255) NOT NULL,
+            content_type VARCHAR(100) NULL,
+            upload_length BIGINT NOT NULL,
+            upload_offset BIGINT NOT NULL DEFAULT 0,
+            timestamp VARCHAR(15) NOT NULL,
+            storage_path VARCHAR(512) NOT NULL,
+            s3_upload_id VARCHAR(255) NULL,
+            parts TEXT NOT NULL DEFAULT '[]',
+            lock_token VARCHAR(32) NULL,
+            locked_at TIMESTAMP NULL,
+            video_id INT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+            expires_at TIMESTAMP NOT NULL,
+            PRIMARY KEY(id)
+        );
+        """
 
         with engine.begin() as connection:
             connection.execute(text(create_video_table_sql))
+            connection.execute(text(create_video_user_index_sql))
+            connection.execute(text(create_video_active_index_sql))
+            connection.execute(text(add_video_content_hash_sql))
+            connection.execute(text(create_video_content_hash_index_sql))
+            connection.execute(text(create_content_object_table_sql))
+            connection.execute(text(create_outbox_table_sql))
+            connection.execute(text(create_outbox_pending_index_sql))
+            connection.execute(text(create_outbox_sent_index_sql))
+            connection.execute(text(create_upload_session_table_sql))
         return
 
     from app.models.video import Video
+    from app.models.outbox import OutboxMessage
+    from app.models.upload_session import UploadSession
+    from app.models.content_object import ContentObject
 
-    Base.metadata.create_all(bind=engine, tables=[Video.__table__])
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[Video.__table__, OutboxMessage.__table__, UploadSession.__table__, ContentObject.__table__],
+    )
 
 def get_db():
     db = SessionLocal()
@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import deque
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+RECENT_SAMPLES = 1024
+
+
+class PoolCheckoutMetrics:
+    def __init__(self, max_samples: int = RECENT_SAMPLES):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=max_samples)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.max_wait_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            self._samples.append(seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self.checkouts = 0
+            self.timeouts = 0
+            self.max_wait_seconds = 0.0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            samples = sorted(self._samples)
+            checkouts = self.checkouts
+            timeouts = self.timeouts
+            max_wait = self.max_wait_seconds
+
+        def _percentile(ratio: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(len(samples) * ratio))]
+
+        return {
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_ms_avg": round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0,
+            "wait_ms_p95": round(_percentile(0.95) * 1000, 3),
+            "wait_ms_max": round(max_wait * 1000, 3),
+        }
+
+
+checkout_metrics = PoolCheckoutMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    # Mede o tempo de espera por uma conexão (fila do pool + connect quando abre uma nova).
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            checkout_metrics.record_timeout()
+            raise
+
+        checkout_metrics.record(time.perf_counter() - started)
+        return connection
+
+
+def pool_status(engine) -> dict:
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            timeout_seconds=pool.timeout(),
+        )
+
+    status["checkout"] = checkout_metrics.snapshot()
+    return status
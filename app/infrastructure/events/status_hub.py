@@ -0,0 +1,237 @@
+import asyncio
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Set
+
+from app.infrastructure.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 100
+REDIS_CHANNEL = "video-status"
+
+
+class HubBackend(ABC):
+    """
+    Transporte entre réplicas. ``publish`` envia a mensagem (string JSON) para
+    todos os nós; ``start`` registra o callback chamado para cada mensagem
+    recebida, inclusive as publicadas pelo próprio nó.
+    """
+
+    @abstractmethod
+    def publish(self, message: str) -> None:
+        pass
+
+    @abstractmethod
+    def start(self, on_message: Callable[[str], None]) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class InMemoryHubBackend(HubBackend):
+    # Substituto local do backend compartilhado, usado em testes.
+    def __init__(self):
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def publish(self, message: str) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(message)
+
+    def start(self, on_message: Callable[[str], None]) -> None:
+        with self._lock:
+            self._listeners.append(on_message)
+
+    def stop(self) -> None:
+        with self._lock:
+            self._listeners.clear()
+
+
+class RedisHubBackend(HubBackend):
+    def __init__(self, url: str, channel: str = REDIS_CHANNEL):
+        try:
+            import redis
+        except ModuleNotFoundError as e:
+            raise RuntimeError("CACHE_REDIS_URL configurado, mas o pacote redis não está instalado") from e
+
+        self.channel = channel
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._pubsub = None
+        self._thread = None
+
+    def publish(self, message: str) -> None:
+        self._client.publish(self.channel, message)
+
+    def start(self, on_message: Callable[[str], None]) -> None:
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: lambda item: on_message(item["data"])})
+        self._thread = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+
+class Subscription:
+    def __init__(self, hub: "StatusHub", user_id: int, max_size: int):
+        self.hub = hub
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self.dropped = 0
+
+    def _deliver(self, event: dict) -> None:
+        # Roda no loop do assinante; cliente lento perde o evento mais antigo.
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.hub._unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+class StatusHub:
+    """
+    Pub/sub em processo das transições de status por usuário. ``publish`` pode
+    ser chamado de qualquer thread (DAO síncrono no executor, worker); cada
+    assinante recebe o evento no seu próprio event loop.
+    """
+
+    def __init__(self, backend: Optional[HubBackend] = None, queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE):
+        self.backend = backend
+        self.queue_size = queue_size
+        self.published = 0
+        self.delivered = 0
+
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._dispatch_listeners: List[Callable[[int, dict], None]] = []
+        self._lock = threading.Lock()
+
+        if backend is not None:
+            backend.start(self._on_backend_message)
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(self, user_id, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def subscribed_users(self) -> List[int]:
+        with self._lock:
+            return list(self._subscribers)
+
+    def add_dispatch_listener(self, listener: Callable[[int, dict], None]) -> None:
+        # Chamado a cada evento entregue neste nó, tenha ou não assinante.
+        with self._lock:
+            self._dispatch_listeners.append(listener)
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.user_id]
+
+    def publish(self, user_id: int, event: dict) -> None:
+        with self._lock:
+            self.published += 1
+
+        if self.backend is None:
+            self.dispatch_local(user_id, event)
+            return
+
+        try:
+            self.backend.publish(json.dumps({"user_id": user_id, "event": event}))
+        except Exception:
+            logger.warning("Falha ao publicar evento de status no backend; entregando só localmente", exc_info=True)
+            self.dispatch_local(user_id, event)
+
+    def _on_backend_message(self, message: str) -> None:
+        try:
+            payload = json.loads(message)
+            self.dispatch_local(int(payload["user_id"]), payload["event"])
+        except Exception:
+            logger.warning("Mensagem de status inválida recebida do backend: %r", message, exc_info=True)
+
+    def dispatch_local(self, user_id: int, event: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+            listeners = list(self._dispatch_listeners)
+
+        for listener in listeners:
+            listener(user_id, event)
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # Loop já fechado: assinante morreu sem fazer unsubscribe.
+                self._unsubscribe(subscription)
+                continue
+            with self._lock:
+                self.delivered += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "users": len(self._subscribers),
+                "subscribers": sum(len(subscribers) for subscribers in self._subscribers.values()),
+                "published": self.published,
+                "delivered": self.delivered,
+                "backend": type(self.backend).__name__ if self.backend is not None else None,
+            }
+
+    def close(self) -> None:
+        if self.backend is not None:
+            self.backend.stop()
+
+
+_status_hub: Optional[StatusHub] = None
+_status_hub_lock = threading.Lock()
+
+
+def get_status_hub() -> StatusHub:
+    global _status_hub
+    if _status_hub is None:
+        with _status_hub_lock:
+            if _status_hub is None:
+                redis_url = get_settings().cache.redis_url
+                _status_hub = StatusHub(backend=RedisHubBackend(redis_url) if redis_url else None)
+
+    return _status_hub
+
+
+def reset_status_hub() -> None:
+    global _status_hub
+    with _status_hub_lock:
+        hub = _status_hub
+        _status_hub = None
+
+    if hub is not None:
+        hub.close()
@@ -0,0 +1,138 @@
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.dao.video_dao import FINAL_STATUSES
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.events.status_hub import StatusHub, get_status_hub
+
+logger = logging.getLogger(__name__)
+
+# (video_id, user_id, status, file_path)
+StatusRow = Tuple[int, int, int, Optional[str]]
+
+
+class StatusPoller:
+    """
+    Fonte de eventos a partir do banco, para transições gravadas fora da API
+    (worker que atualiza a tabela direto em vez de chamar
+    ``/internal/videos/status``). A cada intervalo lê os vídeos em andamento
+    dos usuários com assinantes neste nó, mais os acompanhados na leitura
+    anterior, e entrega localmente o que mudou; o que já chegou pelo hub não é
+    repetido. Vídeos em status final saem do acompanhamento.
+    """
+
+    def __init__(
+        self,
+        hub: StatusHub,
+        load_statuses: Callable[[Iterable[int], Iterable[int]], List[StatusRow]],
+        interval_seconds: float,
+    ):
+        self.hub = hub
+        self.load_statuses = load_statuses
+        self.interval_seconds = interval_seconds
+        self.emitted = 0
+
+        self._snapshot: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        hub.add_dispatch_listener(self._on_dispatch)
+
+    def _on_dispatch(self, _user_id: int, event: dict) -> None:
+        video_id = event.get("video_id")
+        with self._lock:
+            if video_id in self._snapshot:
+                self._snapshot[video_id] = (event.get("status"), event.get("file_path"))
+
+    def poll_once(self) -> int:
+        user_ids = self.hub.subscribed_users()
+        if not user_ids:
+            with self._lock:
+                self._snapshot.clear()
+            return 0
+
+        with self._lock:
+            before = dict(self._snapshot)
+
+        rows = self.load_statuses(user_ids, list(before))
+
+        changed = []
+        with self._lock:
+            snapshot = {}
+            for video_id, user_id, status, file_path in rows:
+                current = self._snapshot.get(video_id)
+                if current != before.get(video_id):
+                    # Evento do hub chegou durante a leitura: é tão novo quanto a linha, ou mais.
+                    snapshot[video_id] = current
+                    continue
+
+                snapshot[video_id] = (status, file_path)
+                # Vídeo visto pela primeira vez só entra na linha de base.
+                if current is not None and current != (status, file_path):
+                    changed.append(
+                        (user_id, {"video_id": video_id, "user_id": user_id, "status": status, "file_path": file_path})
+                    )
+            self._snapshot = {
+                video_id: state for video_id, state in snapshot.items() if state[0] not in FINAL_STATUSES
+            }
+
+        for user_id, event in changed:
+            self.hub.dispatch_local(user_id, event)
+        self.emitted += len(changed)
+
+        return len(changed)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.poll_once()
+            except Exception:
+                logger.exception("Falha ao consultar status dos vídeos no banco")
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="status-poller", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def _load_statuses(user_ids: Iterable[int], video_ids: Iterable[int]) -> List[StatusRow]:
+    from app.dao.video_dao import VideoDAO
+    from app.infrastructure.db.database import SessionLocal
+
+    with SessionLocal() as session:
+        return VideoDAO(session).list_statuses_by_users(user_ids, video_ids)
+
+
+_poller: Optional[StatusPoller] = None
+_poller_lock = threading.Lock()
+
+
+def start_status_poller() -> None:
+    global _poller
+    interval = get_settings().cache.status_poll_interval_seconds
+    if not interval:
+        return
+
+    with _poller_lock:
+        if _poller is None:
+            _poller = StatusPoller(get_status_hub(), _load_statuses, interval)
+            _poller.start()
+
+
+def stop_status_poller() -> None:
+    global _poller
+    with _poller_lock:
+        poller = _poller
+        _poller = None
+
+    if poller is not None:
+        poller.stop()
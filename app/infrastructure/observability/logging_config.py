@@ -0,0 +1,176 @@
+import json
+import logging
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
+
+from app.infrastructure.config.settings import Settings, get_settings
+
+SQL_LOGGERS = ("sqlalchemy.engine", "sqlalchemy.pool")
+
+# Atributos que todo LogRecord já tem; o resto veio de ``extra=`` e vai para o JSON.
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Na thread da requisição só resolve ``msg % args`` e o traceback (que podem
+    referenciar objetos mutáveis) e enfileira sem bloquear; a serialização JSON
+    e a escrita ficam com o ``QueueListener``. Com a fila cheia o registro é
+    descartado e contado, em vez de segurar a requisição esperando o stdout.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+
+class DrainingQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Com a fila limitada cheia, put_nowait falharia; espera a thread abrir espaço.
+        self.queue.put(self._sentinel)
+
+
+def build_formatter(fmt: str) -> logging.Formatter:
+    return logging.Formatter(TEXT_FORMAT) if fmt == "text" else JsonFormatter()
+
+
+_listener: Optional[DrainingQueueListener] = None
+_queue_handler: Optional[BoundedQueueHandler] = None
+_installed: list = []
+_lock = threading.Lock()
+
+
+def configure_logging(settings: Optional[Settings] = None, stream: Optional[TextIO] = None) -> None:
+    """
+    Configura o logging do processo uma vez na subida: um handler no root
+    (JSON ou texto), nível global e por logger e, por padrão, escrita em uma
+    thread própria via fila limitada (``LOG_QUEUE_SIZE``). O eco de SQL do SQLAlchemy só é ligado com
+    ``LOG_SQL_ECHO``.
+    """
+    log_settings = (settings or get_settings()).logging
+
+    with _lock:
+        _shutdown_locked()
+
+        stream_handler = logging.StreamHandler(stream or sys.stdout)
+        stream_handler.setFormatter(build_formatter(log_settings.format))
+
+        global _listener, _queue_handler
+        if log_settings.async_handlers:
+            handler = _queue_handler = BoundedQueueHandler(queue.Queue(maxsize=log_settings.queue_size))
+            _listener = DrainingQueueListener(handler.queue, stream_handler, respect_handler_level=True)
+            _listener.start()
+        else:
+            handler = stream_handler
+
+        root = logging.getLogger()
+        root.addHandler(handler)
+        root.setLevel(log_settings.level)
+        _installed.append(handler)
+
+        sql_level = logging.INFO if log_settings.sql_echo else logging.WARNING
+        for name in SQL_LOGGERS:
+            logging.getLogger(name).setLevel(sql_level)
+
+        for name, level in log_settings.logger_levels.items():
+            logging.getLogger(name).setLevel(level)
+
+
+def _shutdown_locked() -> None:
+    global _listener, _queue_handler
+
+    root = logging.getLogger()
+    while _installed:
+        handler = _installed.pop()
+        root.removeHandler(handler)
+        handler.close()
+
+    if _listener is not None:
+        # stop() drena o que ainda está na fila antes de retornar.
+        _listener.stop()
+        if _queue_handler.dropped:
+            _report_dropped(_listener.handlers, _queue_handler.dropped)
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        _queue_handler = None
+
+
+def _report_dropped(handlers, dropped: int) -> None:
+    # Escrito direto nos handlers: a fila já foi parada.
+    record = logging.makeLogRecord({
+        "name": __name__,
+        "levelno": logging.WARNING,
+        "levelname": "WARNING",
+        "msg": "%d registros de log descartados com a fila cheia",
+        "args": (dropped,),
+    })
+    for handler in handlers:
+        handler.handle(record)
+
+
+def shutdown_logging() -> None:
+    with _lock:
+        _shutdown_locked()
+
+
+def log_pipeline_stats() -> dict:
+    with _lock:
+        if _queue_handler is None:
+            return {"async": False, "queued": 0, "queue_size": 0, "dropped": 0}
+        return {
+            "async": True,
+            "queued": _queue_handler.queue.qsize(),
+            "queue_size": _queue_handler.queue.maxsize,
+            "dropped": _queue_handler.dropped,
+        }
@@ -21,7 +21,7 @@ class SQSProducer:
             endpoint_url=os.getenv("AWS_ENDPOINT_URL")  # For LocalStack in development
         )
         
-        logger.info(f"SQS Producer inicializado - Queue: {self.queue_url}")
+        logger.info("SQS Producer inicializado - Queue: %s", self.queue_url)
 
     def send_message(self, message: Dict[str, Any]) -> bool:
         """
@@ -39,9 +39,9 @@ class SQSProducer:
                 MessageBody=json.dumps(message)
             )
             
-            logger.info(f"Mensagem enviada ao SQS: {response['MessageId']}")
+            logger.info("Mensagem enviada ao SQS: %s", response["MessageId"])
             return True
             
         except Exception as e:
-            logger.error(f"Erro ao enviar mensagem ao SQS: {str(e)}")
+            logger.error("Erro ao enviar mensagem ao SQS: %s", e)
             return False
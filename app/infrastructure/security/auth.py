@@ -1,11 +1,15 @@
-import os
+import hmac
 from dataclasses import dataclass
+from typing import Optional
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jwt import InvalidTokenError
-from jwt import PyJWKClient
+
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.security.jwks import get_jwks_cache
+from app.infrastructure.security.token_cache import get_token_cache
 
 
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -17,22 +21,13 @@ class AuthenticatedUser:
     claims: dict
 
 
-def _as_bool(value: str | None, default: bool) -> bool:
-    if value is None:
-        return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
-
-
 def _is_auth_required() -> bool:
-    has_cognito_config = bool(os.getenv("COGNITO_ISSUER") and os.getenv("COGNITO_CLIENT_ID"))
-    default_required = os.getenv("APP_ENV", "development").lower() == "production" or has_cognito_config
-    return _as_bool(os.getenv("AUTH_REQUIRED"), default_required)
+    return get_settings().auth.required
 
 
 def _resolve_signing_key(token: str, issuer: str):
-    jwks_url = f"{issuer.rstrip('/')}/.well-known/jwks.json"
-    jwk_client = PyJWKClient(jwks_url)
-    signing_key = jwk_client.get_signing_key_from_jwt(token)
+    kid = jwt.get_unverified_header(token).get("kid")
+    signing_key = get_jwks_cache(issuer).get_signing_key(kid)
     return signing_key.key, "RS256"
 
 
@@ -55,11 +50,12 @@ def _validate_audience(claims: dict, client_id: str) -> None:
 def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
 ) -> AuthenticatedUser:
-    if not _is_auth_required():
+    auth_settings = get_settings().auth
+    if not auth_settings.required:
         return AuthenticatedUser(sub="anonymous", claims={"auth_required": False})
 
-    issuer = os.getenv("COGNITO_ISSUER")
-    client_id = os.getenv("COGNITO_CLIENT_ID")
+    issuer = auth_settings.cognito_issuer
+    client_id = auth_settings.cognito_client_id
     if not issuer or not client_id:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -73,6 +69,11 @@ def get_current_user(
         )
 
     token = credentials.credentials
+    token_cache = get_token_cache()
+    cached_user = token_cache.get(token, issuer, client_id)
+    if cached_user is not None:
+        return cached_user
+
     try:
         public_key, algorithm = _resolve_signing_key(token, issuer)
         claims = jwt.decode(
@@ -94,7 +95,10 @@ def get_current_user(
     if not sub:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token sem sub")
 
-    return AuthenticatedUser(sub=str(sub), claims=claims)
+    user = AuthenticatedUser(sub=str(sub), claims=claims)
+    token_cache.put(token, issuer, client_id, user, claims.get("exp"))
+
+    return user
 
 
 def enforce_same_user(requested_user_id: int, current_user: AuthenticatedUser) -> None:
@@ -117,3 +121,13 @@ def enforce_same_user(requested_user_id: int, current_user: AuthenticatedUser) -
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Acesso negado para este usuário",
         )
+
+
+def require_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    # Rotas /internal são chamadas por workers/sweepers, não por usuários: sem token configurado ficam fechadas.
+    expected = get_settings().auth.internal_token
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Endpoint interno desabilitado")
+
+    if not x_internal_token or not hmac.compare_digest(x_internal_token.encode(), expected.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Token interno inválido")
@@ -0,0 +1,164 @@
+import json
+import logging
+import threading
+import time
+import urllib.request
+from typing import Callable, Dict, Optional
+
+from jwt import InvalidTokenError, PyJWK
+from jwt.exceptions import PyJWKError
+
+from app.infrastructure.config.settings import (
+    DEFAULT_JWKS_CACHE_STALE_SECONDS as DEFAULT_STALE_SECONDS,
+    DEFAULT_JWKS_CACHE_TTL_SECONDS as DEFAULT_TTL_SECONDS,
+    DEFAULT_JWKS_MIN_REFETCH_INTERVAL_SECONDS as DEFAULT_MIN_REFETCH_INTERVAL_SECONDS,
+    get_settings,
+)
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_FETCH_TIMEOUT_SECONDS = 5
+
+
+def fetch_jwks(url: str, timeout: float = DEFAULT_FETCH_TIMEOUT_SECONDS) -> dict:
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+class JWKSCache:
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        stale_seconds: int = DEFAULT_STALE_SECONDS,
+        min_refetch_interval_seconds: int = DEFAULT_MIN_REFETCH_INTERVAL_SECONDS,
+        fetcher: Optional[Callable[[str], dict]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.jwks_url = jwks_url
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.min_refetch_interval_seconds = min_refetch_interval_seconds
+        self.fetcher = fetcher or fetch_jwks
+        self.clock = clock
+
+        self._keys: Dict[str, PyJWK] = {}
+        self._fetched_at: Optional[float] = None
+        self._last_fetch_attempt: Optional[float] = None
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._refreshing = False
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._last_fetch_attempt = self.clock()
+
+        data = self.fetcher(self.jwks_url)
+
+        keys = {}
+        for jwk_data in data.get("keys", []):
+            kid = jwk_data.get("kid")
+            if not kid or jwk_data.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[kid] = PyJWK(jwk_data)
+            except PyJWKError:
+                logger.warning("Chave JWKS ignorada (kid=%s): formato não suportado", kid)
+
+        with self._lock:
+            self._keys = keys
+            self._fetched_at = self.clock()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.warning("Falha ao atualizar JWKS em background: %s", self.jwks_url, exc_info=True)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _schedule_background_refresh(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        threading.Thread(target=self._refresh_in_background, name="jwks-refresh", daemon=True).start()
+
+    def _can_force_refetch(self) -> bool:
+        with self._lock:
+            last_attempt = self._last_fetch_attempt
+
+        return last_attempt is None or self.clock() - last_attempt >= self.min_refetch_interval_seconds
+
+    def _age(self) -> Optional[float]:
+        fetched_at = self._fetched_at
+        return None if fetched_at is None else self.clock() - fetched_at
+
+    def _is_expired(self, age: Optional[float]) -> bool:
+        return age is None or age >= self.ttl_seconds + self.stale_seconds
+
+    def get_signing_key(self, kid: Optional[str]) -> PyJWK:
+        if not kid:
+            raise InvalidTokenError("Token sem kid")
+
+        age = self._age()
+        if self._is_expired(age):
+            # Só uma thread busca; as demais esperam e reaproveitam o resultado.
+            with self._fetch_lock:
+                if self._is_expired(self._age()):
+                    self.refresh()
+        elif age >= self.ttl_seconds:
+            # Stale-while-revalidate: responde com a chave atual e atualiza em paralelo.
+            self._schedule_background_refresh()
+
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        # kid desconhecido: provável rotação de chaves, busca de novo (com rate limit).
+        # Sob o lock, uma rajada de kids desconhecidos gera no máximo um fetch por intervalo.
+        with self._fetch_lock:
+            key = self._keys.get(kid)
+            if key is not None:
+                return key
+
+            if self._can_force_refetch():
+                self.refresh()
+                key = self._keys.get(kid)
+                if key is not None:
+                    return key
+
+        raise InvalidTokenError(f"kid desconhecido: {kid}")
+
+
+_caches: Dict[str, JWKSCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_jwks_cache(issuer: str) -> JWKSCache:
+    issuer = issuer.rstrip("/")
+    cache = _caches.get(issuer)
+    if cache is not None:
+        return cache
+
+    with _caches_lock:
+        cache = _caches.get(issuer)
+        if cache is None:
+            auth_settings = get_settings().auth
+            cache = JWKSCache(
+                f"{issuer}/.well-known/jwks.json",
+                ttl_seconds=auth_settings.jwks_cache_ttl_seconds,
+                stale_seconds=auth_settings.jwks_cache_stale_seconds,
+                min_refetch_interval_seconds=auth_settings.jwks_min_refetch_interval_seconds,
+            )
+            _caches[issuer] = cache
+
+    return cache
+
+
+def reset_jwks_caches() -> None:
+    with _caches_lock:
+        _caches.clear()
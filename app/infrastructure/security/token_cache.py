@@ -0,0 +1,82 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from app.infrastructure.config.settings import DEFAULT_AUTH_TOKEN_CACHE_SIZE as DEFAULT_MAX_SIZE, get_settings
+
+
+class VerifiedTokenCache:
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, clock: Callable[[], float] = time.time):
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str, issuer: str, client_id: str) -> str:
+        # Guarda só o hash: o token em si nunca fica em memória no cache.
+        return hashlib.sha256(f"{issuer}|{client_id}|{token}".encode()).hexdigest()
+
+    def get(self, token: str, issuer: str, client_id: str):
+        key = self._key(token, issuer, client_id)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                user, expires_at = entry
+                if expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return user
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+    def put(self, token: str, issuer: str, client_id: str, user, expires_at: Optional[float]) -> None:
+        if not isinstance(expires_at, (int, float)) or expires_at <= self.clock() or self.max_size <= 0:
+            return
+
+        key = self._key(token, issuer, client_id)
+
+        with self._lock:
+            self._entries[key] = (user, float(expires_at))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_token_cache: Optional[VerifiedTokenCache] = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> VerifiedTokenCache:
+    global _token_cache
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                _token_cache = VerifiedTokenCache(max_size=get_settings().auth.token_cache_size)
+
+    return _token_cache
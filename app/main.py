@@ -1,7 +1,9 @@
 from app.infrastructure.api.fastapi import app
 from app.api import check
 from app.api import upload
+from app.api import internal
 
 # declare
 app.include_router(check.router)
-app.include_router(upload.router)
\ No newline at end of file
+app.include_router(upload.router)
+app.include_router(internal.router)
\ No newline at end of file
@@ -1,4 +1,7 @@
 from .video import Video
+from .outbox import OutboxMessage
+from .upload_session import UploadSession
+from .content_object import ContentObject
 
 
-__all__ = ["Video"]
\ No newline at end of file
+__all__ = ["Video", "OutboxMessage", "UploadSession", "ContentObject"]
\ No newline at end of file
@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+
+from app.infrastructure.db.database import Base
+from app.models.outbox import utcnow
+
+
+class ContentObject(Base):
+    __tablename__ = "content_object"
+
+    # Deduplicação só dentro da conta: nunca expõe caminho ou status de outro usuário.
+    user_id = Column(Integer, primary_key=True, autoincrement=False)
+    sha256 = Column(String(64), primary_key=True)
+    storage_path = Column(String(512), nullable=False)
+    size = Column(BigInteger, nullable=True)
+    # Vídeo cujo processamento é reaproveitado pelos uploads com o mesmo conteúdo.
+    video_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
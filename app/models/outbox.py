@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from app.infrastructure.db.database import Base
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class OutboxMessage(Base):
+    __tablename__ = "outbox_message"
+
+    id = Column(Integer, primary_key=True)
+    aggregate_id = Column(Integer, nullable=True)
+    dedup_id = Column(String(64), nullable=False, unique=True)
+    payload = Column(Text, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String(255), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    available_at = Column(DateTime, nullable=False, default=utcnow)
+    sent_at = Column(DateTime, nullable=True)
+    # Esgotou OUTBOX_MAX_ATTEMPTS: sai da fila do relay e fica para inspeção.
+    failed_at = Column(DateTime, nullable=True)
+
+
+# Só as mensagens pendentes entram no índice que o relay varre.
+Index(
+    "ix_outbox_message_pending",
+    OutboxMessage.available_at,
+    OutboxMessage.id,
+    postgresql_where=OutboxMessage.sent_at.is_(None) & OutboxMessage.failed_at.is_(None),
+    sqlite_where=OutboxMessage.sent_at.is_(None) & OutboxMessage.failed_at.is_(None),
+)
+
+# Limpeza por retenção varre só as já enviadas.
+Index(
+    "ix_outbox_message_sent",
+    OutboxMessage.sent_at,
+    postgresql_where=OutboxMessage.sent_at.isnot(None),
+    sqlite_where=OutboxMessage.sent_at.isnot(None),
+)
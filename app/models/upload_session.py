@@ -0,0 +1,25 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Text
+
+from app.infrastructure.db.database import Base
+from app.models.outbox import utcnow
+
+
+class UploadSession(Base):
+    __tablename__ = "upload_session"
+
+    id = Column(String(32), primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    title = Column(String(255), nullable=False)
+    filename = Column(String(255), nullable=False)
+    content_type = Column(String(100), nullable=True)
+    upload_length = Column(BigInteger, nullable=False)
+    upload_offset = Column(BigInteger, nullable=False, default=0)
+    timestamp = Column(String(15), nullable=False)
+    storage_path = Column(String(512), nullable=False)
+    s3_upload_id = Column(String(255), nullable=True)
+    parts = Column(Text, nullable=False, default="[]")
+    lock_token = Column(String(32), nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    video_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    expires_at = Column(DateTime, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 
 from app.infrastructure.db.database import Base
 
@@ -10,6 +10,20 @@ class Video(Base):
     title = Column(String(255), nullable=False)
     file_path = Column(String(255), nullable=False)
     status = Column(Integer, nullable=False)
+    content_hash = Column(String(64), nullable=True)
     
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+
+# Listagem paginada por usuário (keyset em id decrescente).
+Index("ix_video_user_id_id", Video.user_id, Video.id.desc())
+# Vídeos que compartilham o mesmo conteúdo (deduplicação por SHA-256).
+Index("ix_video_content_hash", Video.content_hash)
+# Consulta periódica de status (SSE/long-poll): só os vídeos ainda em andamento.
+Index(
+    "ix_video_user_id_active",
+    Video.user_id,
+    postgresql_where=Video.status.notin_((1, 2)),
+    sqlite_where=Video.status.notin_((1, 2)),
+)
@@ -0,0 +1,73 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.use_cases.upload_use_case import UploadUseCase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchUploadItem:
+    filename: str
+    title: str
+    upload_file: object = None
+    error: Optional[str] = None
+    saved_path: object = None
+    content_hash: Optional[str] = None
+    video: object = None
+
+
+class BatchUploadUseCase:
+    """
+    Vários arquivos numa requisição: grava até ``concurrency`` arquivos em
+    paralelo e registra os que deram certo com um INSERT multi-linha e uma
+    publicação em lote. Itens que chegam com ``error`` (validação) são
+    ignorados; falhas de gravação ou registro ficam no próprio item.
+    """
+
+    def __init__(self, upload_use_case: UploadUseCase, concurrency: int):
+        self.upload_use_case = upload_use_case
+        self.concurrency = max(concurrency, 1)
+
+    def execute(self, user_id: int, items: List[BatchUploadItem]) -> List[BatchUploadItem]:
+        timestamp = self.upload_use_case.new_timestamp()
+
+        pending = [item for item in items if item.error is None]
+        if pending:
+            workers = min(self.concurrency, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-upload") as pool:
+                list(pool.map(lambda item: self._store(item, timestamp), pending))
+
+        stored = [item for item in pending if item.error is None]
+        if not stored:
+            return items
+
+        try:
+            videos = self.upload_use_case.register_batch(
+                user_id, [(item.title, item.saved_path, item.content_hash) for item in stored], timestamp
+            )
+        except Exception:
+            # O INSERT multi-linha é uma transação só: nada do lote foi registrado.
+            logger.exception("Falha ao registrar lote de %d uploads do usuário %s", len(stored), user_id)
+            for item in stored:
+                item.error = "Falha ao registrar vídeo"
+            return items
+
+        for item, video in zip(stored, videos):
+            if video is None:
+                item.error = "Falha ao registrar vídeo"
+            else:
+                item.video = video
+
+        return items
+
+    def _store(self, item: BatchUploadItem, timestamp: str) -> None:
+        try:
+            item.saved_path, item.content_hash, _ = self.upload_use_case.processing_gateway.store_upload(
+                item.upload_file, timestamp
+            )
+        except Exception:
+            logger.exception("Falha ao gravar %s do lote", item.filename)
+            item.error = "Falha ao gravar arquivo"
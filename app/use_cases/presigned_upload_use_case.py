@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta
+from pathlib import PurePosixPath
+from typing import Optional
+
+from app.adapters.dto.video_dto import VideoCreateSchema
+from app.adapters.utils.video_signature import VideoSignatureError, check_video_signature
+from app.gateways.presigned_upload_gateway import (
+    EXPECTED_LENGTH_METADATA,
+    TIMESTAMP_METADATA,
+    VIDEO_ID_METADATA,
+    PresignedUploadGateway,
+)
+from app.use_cases.upload_use_case import UploadUseCase
+
+AWAITING_UPLOAD_STATUS = 3
+ERROR_STATUS = 2
+# Folga depois da expiração das URLs antes de dar o upload como abandonado.
+EXPIRY_GRACE_SECONDS = 3600
+EXPIRY_BATCH_SIZE = 100
+
+
+class PresignedUploadNotFoundError(Exception):
+    pass
+
+
+class PresignedUploadStateError(Exception):
+    pass
+
+
+class UploadVerificationError(Exception):
+    pass
+
+
+class PresignedUploadUseCase:
+    def __init__(self, gateway: PresignedUploadGateway, upload_use_case: UploadUseCase):
+        self.gateway = gateway
+        self.upload_use_case = upload_use_case
+        self.video_dao = upload_use_case.video_dao
+
+    def create(self, user_id: int, title: str, filename: str, content_type: str, length: int) -> tuple:
+        timestamp = self.upload_use_case.new_timestamp()
+        key = self.gateway.build_key(timestamp, filename)
+        video = self.video_dao.create_video(VideoCreateSchema(
+            user_id=user_id,
+            title=title,
+            file_path=self.gateway.object_url(key),
+            status=AWAITING_UPLOAD_STATUS,
+        ))
+
+        try:
+            if length > self.gateway.part_size:
+                method, presign = "MULTIPART", self.gateway.presign_multipart
+            else:
+                method, presign = "PUT", self.gateway.presign_put
+            instructions = {"method": method, **presign(key, content_type, length, video.id, timestamp)}
+        except Exception:
+            self.video_dao.update_video_status(video.id, ERROR_STATUS)
+            raise
+
+        instructions["expires_in"] = self.gateway.expires_seconds
+
+        return video, instructions
+
+    def get_video(self, video_id: int):
+        video = self.video_dao.get_video(video_id)
+        if video is None:
+            raise PresignedUploadNotFoundError(f"Vídeo com ID {video_id} não encontrado")
+
+        return video
+
+    def complete(self, video_id: int, upload_id: Optional[str] = None):
+        video = self.get_video(video_id)
+
+        if video.status != AWAITING_UPLOAD_STATUS:
+            return self._already_completed(video)
+
+        key = self.gateway.key_from_url(video.file_path)
+
+        if upload_id:
+            try:
+                self.gateway.complete_multipart(key, upload_id)
+            except Exception as e:
+                # Em retry o multipart já pode ter sido concluído; o HEAD abaixo decide.
+                if self.gateway.head(key) is None:
+                    raise PresignedUploadStateError(f"Não foi possível concluir o multipart: {e}")
+
+        head = self.gateway.head(key)
+        if head is None:
+            raise PresignedUploadStateError("Objeto ainda não foi enviado ao S3")
+
+        try:
+            self._verify(video, key, head)
+        except UploadVerificationError:
+            # Só quem faz a transição apaga o objeto: se outro chamador já concluiu, ele não é mais nosso.
+            if self.video_dao.transition_status(video_id, AWAITING_UPLOAD_STATUS, ERROR_STATUS) is not None:
+                self._delete_if_owned(video, key, head)
+            raise
+
+        timestamp = head["Metadata"].get(TIMESTAMP_METADATA) or self.upload_use_case.new_timestamp()
+
+        uploaded = self.upload_use_case.mark_uploaded(video_id, video.file_path, timestamp, AWAITING_UPLOAD_STATUS)
+        if uploaded is None:
+            # Conclusão concorrente (ou expiração) venceu a transição: nenhum job novo.
+            return self._already_completed(self.get_video(video_id))
+
+        return uploaded
+
+    @staticmethod
+    def _already_completed(video):
+        if video.status == ERROR_STATUS:
+            raise PresignedUploadStateError(f"Upload do vídeo {video.id} foi rejeitado")
+        # Conclusão repetida: o vídeo já está na fila ou processado.
+        return video
+
+    def _delete_if_owned(self, video, key: str, head: Optional[dict]) -> None:
+        # Só apaga o objeto que foi assinado para este vídeo; qualquer outro não é nosso para remover.
+        if head is not None and head.get("Metadata", {}).get(VIDEO_ID_METADATA) == str(video.id):
+            self.gateway.delete(key)
+
+    def expire_abandoned(self, now: Optional[datetime] = None, limit: int = EXPIRY_BATCH_SIZE) -> int:
+        """
+        Marca com erro os vídeos aguardando upload cujas URLs já expiraram (com
+        folga), abortando multipart pendente e apagando o objeto parcial. O
+        corte é feito no SQL pela key (``uploads/<timestamp>/...``), então
+        vídeos ainda no prazo não ocupam o lote.
+        """
+        now = now or datetime.now()
+        cutoff = now - timedelta(seconds=self.gateway.expires_seconds + EXPIRY_GRACE_SECONDS)
+        expired = 0
+
+        candidates = self.video_dao.list_videos_by_status(
+            AWAITING_UPLOAD_STATUS, limit, file_path_range=self.gateway.url_range_created_before(cutoff)
+        )
+        for video in candidates:
+            # Condicional: uma conclusão que chegou antes vence, e o objeto dela fica intacto.
+            if self.video_dao.transition_status(video.id, AWAITING_UPLOAD_STATUS, ERROR_STATUS) is None:
+                continue
+
+            key = self.gateway.key_from_url(video.file_path)
+            self.gateway.abort_multipart_uploads(key)
+            self._delete_if_owned(video, key, self.gateway.head(key))
+            expired += 1
+
+        return expired
+
+    def _verify(self, video, key: str, head: dict) -> None:
+        metadata = head.get("Metadata", {})
+
+        if metadata.get(VIDEO_ID_METADATA) != str(video.id):
+            raise UploadVerificationError("Objeto não pertence a este vídeo")
+
+        if str(head.get("ContentLength")) != metadata.get(EXPECTED_LENGTH_METADATA):
+            raise UploadVerificationError(
+                f"Tamanho enviado ({head.get('ContentLength')} bytes) difere do declarado "
+                f"({metadata.get(EXPECTED_LENGTH_METADATA)} bytes)"
+            )
+
+        try:
+            check_video_signature(self.gateway.read_head_bytes(key), PurePosixPath(key).name)
+        except VideoSignatureError as e:
+            raise UploadVerificationError(str(e))
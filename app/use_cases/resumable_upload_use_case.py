@@ -0,0 +1,154 @@
+import logging
+import uuid
+from datetime import timedelta
+from typing import BinaryIO
+
+from app.dao.upload_session_dao import UploadSessionDAO
+from app.models.outbox import utcnow
+from app.models.upload_session import UploadSession
+from app.use_cases.upload_use_case import UploadUseCase
+
+logger = logging.getLogger(__name__)
+
+EXPIRY_BATCH_SIZE = 100
+
+
+class UploadSessionNotFoundError(Exception):
+    pass
+
+
+class UploadOffsetConflictError(Exception):
+    def __init__(self, current_offset: int):
+        super().__init__(f"Offset divergente; offset atual da sessão: {current_offset}")
+        self.current_offset = current_offset
+
+
+class UploadSessionStateError(Exception):
+    pass
+
+
+class ResumableUploadUseCase:
+    def __init__(self, session_dao: UploadSessionDAO, storage, upload_use_case: UploadUseCase, session_ttl_hours: int):
+        self.session_dao = session_dao
+        self.storage = storage
+        self.upload_use_case = upload_use_case
+        self.session_ttl_hours = session_ttl_hours
+
+    def create_session(self, user_id: int, title: str, filename: str, content_type: str, length: int) -> UploadSession:
+        now = utcnow()
+        upload_session = UploadSession(
+            # O id é definido antes do begin: staging e objeto no S3 são nomeados por ele.
+            id=uuid.uuid4().hex,
+            user_id=user_id,
+            title=title,
+            filename=filename,
+            content_type=content_type,
+            upload_length=length,
+            upload_offset=0,
+            timestamp=self.upload_use_case.new_timestamp(),
+            parts="[]",
+            created_at=now,
+            expires_at=now + timedelta(hours=self.session_ttl_hours),
+        )
+        self.storage.begin(upload_session)
+
+        return self.session_dao.create_session(upload_session)
+
+    def get_session(self, session_id: str) -> UploadSession:
+        upload_session = self.session_dao.get_session(session_id)
+        if upload_session is None:
+            raise UploadSessionNotFoundError(f"Sessão de upload {session_id} não encontrada ou expirada")
+
+        return upload_session
+
+    def append_chunk(self, session_id: str, offset: int, chunk: BinaryIO, size: int) -> UploadSession:
+        upload_session = self.get_session(session_id)
+
+        if upload_session.video_id is not None:
+            raise UploadSessionStateError("Sessão de upload já finalizada")
+        if offset != upload_session.upload_offset:
+            raise UploadOffsetConflictError(upload_session.upload_offset)
+        if offset + size > upload_session.upload_length:
+            raise UploadSessionStateError("Chunk ultrapassa o tamanho declarado do upload")
+
+        token = self.session_dao.claim(session_id, offset)
+        if token is None:
+            # Outra requisição avançou (ou está escrevendo) a partir deste offset.
+            raise UploadOffsetConflictError(self.get_session(session_id).upload_offset)
+
+        try:
+            part = self.storage.write_chunk(upload_session, chunk, size)
+        except Exception:
+            self.session_dao.release(session_id, token)
+            raise
+
+        self.session_dao.advance(session_id, token, offset + size, part)
+
+        return self.get_session(session_id)
+
+    def finalize(self, session_id: str):
+        upload_session = self.get_session(session_id)
+        video_dao = self.upload_use_case.video_dao
+
+        if upload_session.video_id is not None:
+            # Finalização repetida (retry do cliente) devolve o mesmo vídeo.
+            return video_dao.get_video(upload_session.video_id)
+
+        if upload_session.upload_offset != upload_session.upload_length:
+            raise UploadSessionStateError(
+                f"Upload incompleto: {upload_session.upload_offset} de {upload_session.upload_length} bytes recebidos"
+            )
+
+        token = self.session_dao.claim(session_id, upload_session.upload_length)
+        if token is None:
+            raise UploadSessionStateError("Sessão de upload em uso por outra requisição")
+
+        try:
+            saved_path = self.storage.complete(upload_session)
+            content_hash = self.storage.content_hash(saved_path)
+        except Exception:
+            self.session_dao.release(session_id, token)
+            raise
+
+        try:
+            created, _, _ = self.upload_use_case.register_upload(
+                upload_session.user_id,
+                upload_session.title,
+                saved_path,
+                upload_session.timestamp,
+                content_hash=content_hash,
+            )
+        except Exception:
+            # O storage já está concluído; um retry reconhece isso em ``complete`` e só registra o vídeo.
+            self.session_dao.release(session_id, token)
+            raise
+        self.session_dao.mark_completed(session_id, token, created.id)
+
+        return created
+
+    def abort(self, session_id: str) -> None:
+        upload_session = self.get_session(session_id)
+
+        if upload_session.video_id is None:
+            self.storage.abort(upload_session)
+
+        self.session_dao.delete_session(session_id)
+
+    def expire_sessions(self, limit: int = EXPIRY_BATCH_SIZE) -> int:
+        """
+        Remove sessões vencidas; as que não viraram vídeo têm o staging ou o
+        multipart abortado antes.
+        """
+        expired = 0
+
+        for upload_session in self.session_dao.list_expired(limit):
+            if upload_session.video_id is None:
+                try:
+                    self.storage.abort(upload_session)
+                except Exception:
+                    logger.exception("Falha ao abortar o storage da sessão de upload %s", upload_session.id)
+                    continue
+            self.session_dao.delete_session(upload_session.id)
+            expired += 1
+
+        return expired
@@ -2,35 +2,244 @@ import logging
 from datetime import datetime
 from app.gateways.video_processing_gateway import VideoProcessingGateway
 from app.gateways.sqs_producer import SQSProducer
-from app.dao.video_dao import VideoDAO
+from app.gateways.outbox_relay import notify_outbox
+from app.dao.video_dao import DuplicateContentError, VideoDAO
+from app.dao.content_object_dao import ContentObjectDAO
 from app.adapters.dto.video_dto import VideoCreateSchema
+from app.infrastructure.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
 class UploadUseCase:
-    def __init__(self, processing_gateway: VideoProcessingGateway, video_dao: VideoDAO, sqs_producer: SQSProducer = None):
+    def __init__(
+        self,
+        processing_gateway: VideoProcessingGateway,
+        video_dao: VideoDAO,
+        sqs_producer: SQSProducer = None,
+        use_outbox: bool = None,
+        content_dao: ContentObjectDAO = None,
+    ):
         self.processing_gateway = processing_gateway
         self.video_dao = video_dao
         self.sqs_producer = sqs_producer or SQSProducer()
+        self.use_outbox = get_settings().queue.outbox_enabled if use_outbox is None else use_outbox
+        self.content_dao = content_dao
+
+    @staticmethod
+    def new_timestamp() -> str:
+        return datetime.now().strftime("%Y%m%d_%H%M%S")
 
     def execute(self, user_id: int, title: str, upload_file) -> tuple:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self.new_timestamp()
         
-        saved_path = self.processing_gateway.save_upload(upload_file, timestamp)
+        saved_path, content_hash, _ = self.processing_gateway.store_upload(upload_file, timestamp)
 
-        dto = VideoCreateSchema(user_id=user_id, title=title, file_path=str(saved_path), status=0)
-        created = self.video_dao.create_video(dto)
-        
-        message = {
-            "video_id": created.id,
+        return self.register_upload(user_id, title, saved_path, timestamp, content_hash=content_hash)
+
+    @staticmethod
+    def build_processing_message(video, saved_path, timestamp: str) -> dict:
+        return {
+            "video_id": video.id,
             "video_path": str(saved_path),
             "timestamp": timestamp,
-            "user_id": user_id
+            "user_id": video.user_id
         }
+
+    def register_upload(self, user_id: int, title: str, saved_path, timestamp: str, content_hash: str = None) -> tuple:
+        if self.content_dao is not None and content_hash:
+            return self._register_by_content(user_id, title, saved_path, timestamp, content_hash)
+
+        dto = VideoCreateSchema(user_id=user_id, title=title, file_path=str(saved_path), status=0)
+
+        return self._create_and_enqueue(dto, saved_path, timestamp)
+
+    def _create_and_enqueue(self, dto: VideoCreateSchema, saved_path, timestamp: str, content_object=None) -> tuple:
+        def build_message(created) -> dict:
+            return self.build_processing_message(created, saved_path, timestamp)
+
+        if self.use_outbox:
+            # Vídeo e mensagem são commitados juntos; o relay publica no SQS.
+            created = self.video_dao.create_video(dto, outbox_event=build_message, content_object=content_object)
+            notify_outbox()
+            return created, str(saved_path), timestamp
+
+        created = self.video_dao.create_video(dto, content_object=content_object)
         
-        success = self.sqs_producer.send_message(message)
+        success = self.sqs_producer.send_message(build_message(created))
         if not success:
-            logger.warning(f"Falha ao enviar mensagem SQS para vídeo {created.id}, mas upload foi concluído")
+            logger.warning("Falha ao enviar mensagem SQS para vídeo %s, mas upload foi concluído", created.id)
 
         return created, str(saved_path), timestamp
+
+    def register_batch(self, user_id: int, entries, timestamp: str) -> list:
+        """
+        Registra uploads já gravados com um INSERT multi-linha e uma publicação
+        em lote. ``entries`` são ``(title, saved_path, content_hash)``; devolve
+        os vídeos na mesma ordem, com ``None`` nos itens cujo registro
+        individual (fallback de duplicata) falhou. Os demais já estão
+        commitados e publicados.
+        """
+        dedup = self.content_dao is not None
+        known = self.content_dao.get_many(user_id, (h for _, _, h in entries if h)) if dedup else {}
+
+        paths = [str(saved_path) for _, saved_path, _ in entries]
+        rows = []
+        individual = []
+        stored_by_hash = {}
+
+        for index, (title, saved_path, content_hash) in enumerate(entries):
+            if not dedup or not content_hash:
+                dto = VideoCreateSchema(user_id=user_id, title=title, file_path=paths[index], status=0)
+                rows.append((index, dto, paths[index], None))
+                continue
+
+            if content_hash in known:
+                # Conteúdo anterior ao lote: segue as regras de duplicata do upload avulso.
+                individual.append(index)
+                continue
+
+            if content_hash in stored_by_hash:
+                # Repetido dentro do lote: reaproveita o objeto armazenado, com job próprio.
+                stored_path = stored_by_hash[content_hash]
+                if paths[index] != stored_path:
+                    self.processing_gateway.discard_upload(saved_path)
+                paths[index] = stored_path
+                dto = VideoCreateSchema(
+                    user_id=user_id, title=title, file_path=stored_path, status=0, content_hash=content_hash
+                )
+                rows.append((index, dto, stored_path, None))
+                continue
+
+            stored_path = self.processing_gateway.store_by_hash(saved_path, user_id, content_hash)
+            stored_by_hash[content_hash] = paths[index] = stored_path
+            dto = VideoCreateSchema(
+                user_id=user_id, title=title, file_path=stored_path, status=0, content_hash=content_hash
+            )
+            content_object = ContentObjectDAO.build(
+                user_id, content_hash, stored_path, self.processing_gateway.stored_size(stored_path)
+            )
+            rows.append((index, dto, stored_path, content_object))
+
+        videos = [None] * len(entries)
+        try:
+            for (index, *_), created in zip(rows, self._create_and_enqueue_many(rows, timestamp)):
+                videos[index] = created
+        except DuplicateContentError:
+            # Outro upload registrou um dos conteúdos antes do commit: registra um a um.
+            individual.extend(index for index, *_ in rows)
+
+        for index in sorted(individual):
+            title, _, content_hash = entries[index]
+            try:
+                videos[index], _, _ = self.register_upload(
+                    user_id, title, paths[index], timestamp, content_hash=content_hash
+                )
+            except Exception:
+                # Um a um, cada item é commitado sozinho: a falha não desfaz os anteriores.
+                logger.exception("Falha ao registrar item %d do lote do usuário %s", index, user_id)
+
+        return videos
+
+    def _create_and_enqueue_many(self, rows, timestamp: str) -> list:
+        # rows: (índice, dto, caminho para a mensagem ou None, content_object ou None).
+        def message_builder(saved_path):
+            if saved_path is None:
+                return None
+            return lambda created: self.build_processing_message(created, saved_path, timestamp)
+
+        dtos = [dto for _, dto, _, _ in rows]
+        builders = [message_builder(saved_path) for _, _, saved_path, _ in rows]
+        content_objects = [content_object for _, _, _, content_object in rows]
+
+        if self.use_outbox:
+            created = self.video_dao.create_videos(dtos, outbox_events=builders, content_objects=content_objects)
+            notify_outbox()
+            return created
+
+        created = self.video_dao.create_videos(dtos, content_objects=content_objects)
+
+        pending = [(video, builder) for video, builder in zip(created, builders) if builder is not None]
+        results = self.sqs_producer.send_messages([builder(video) for video, builder in pending])
+        for (video, _), success in zip(pending, results):
+            if not success:
+                logger.warning("Falha ao enviar mensagem SQS para vídeo %s, mas upload foi concluído", video.id)
+
+        return created
+
+    def _register_by_content(self, user_id: int, title: str, saved_path, timestamp: str, content_hash: str) -> tuple:
+        # Duas tentativas: se outro upload do mesmo conteúdo vencer a corrida
+        # pelo content_object, este vira duplicata dele.
+        for _ in range(2):
+            existing = self.content_dao.get(user_id, content_hash)
+            if existing is not None:
+                return self._register_duplicate(user_id, title, saved_path, timestamp, existing)
+
+            stored_path = self.processing_gateway.store_by_hash(saved_path, user_id, content_hash)
+            dto = VideoCreateSchema(
+                user_id=user_id, title=title, file_path=stored_path, status=0, content_hash=content_hash
+            )
+            content_object = ContentObjectDAO.build(
+                user_id, content_hash, stored_path, self.processing_gateway.stored_size(stored_path)
+            )
+            try:
+                return self._create_and_enqueue(dto, stored_path, timestamp, content_object=content_object)
+            except DuplicateContentError:
+                saved_path = stored_path
+
+        raise Exception(f"Não foi possível registrar o conteúdo {content_hash}")
+
+    def _register_duplicate(self, user_id: int, title: str, saved_path, timestamp: str, existing) -> tuple:
+        if str(saved_path) != existing.storage_path:
+            self.processing_gateway.discard_upload(saved_path)
+
+        canonical = self.video_dao.get_video(existing.video_id) if existing.video_id else None
+
+        if canonical is not None and canonical.status == 1:
+            # Já concluído (do mesmo usuário): herda o resultado sem novo job.
+            dto = VideoCreateSchema(
+                user_id=user_id,
+                title=title,
+                file_path=canonical.file_path,
+                status=canonical.status,
+                content_hash=existing.sha256,
+            )
+            created = self.video_dao.create_video(dto)
+            return created, created.file_path, timestamp
+
+        # Em processamento, falhou ou foi removido: job próprio a partir do objeto já armazenado,
+        # sem depender de o status do canônico ser repassado.
+        dto = VideoCreateSchema(
+            user_id=user_id, title=title, file_path=existing.storage_path, status=0, content_hash=existing.sha256
+        )
+        result = self._create_and_enqueue(dto, existing.storage_path, timestamp)
+        if canonical is None or canonical.status != 0:
+            self.content_dao.repoint(user_id, existing.sha256, result[0].id)
+
+        return result
+
+    def mark_uploaded(self, video_id: int, saved_path, timestamp: str, from_status: int):
+        """
+        Vídeo criado antes dos bytes (upload direto ao S3): passa de
+        ``from_status`` a 0 e entra na fila de processamento. A transição é
+        condicional; se outro chamador já a fez (ou marcou erro), devolve
+        ``None`` e nada é publicado.
+        """
+        def build_message(video) -> dict:
+            return self.build_processing_message(video, saved_path, timestamp)
+
+        if self.use_outbox:
+            video = self.video_dao.transition_status(video_id, from_status, 0, outbox_event=build_message)
+            if video is not None:
+                notify_outbox()
+            return video
+
+        video = self.video_dao.transition_status(video_id, from_status, 0)
+        if video is None:
+            return None
+
+        success = self.sqs_producer.send_message(build_message(video))
+        if not success:
+            logger.warning("Falha ao enviar mensagem SQS para vídeo %s, mas upload foi concluído", video.id)
+
+        return video
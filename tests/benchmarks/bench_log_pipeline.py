@@ -0,0 +1,142 @@
+"""
+Custo por chamada de log na thread da requisição, antes e depois do pipeline
+com fila.
+
+    python tests/benchmarks/bench_log_pipeline.py --calls 20000 --threads 4 --sink-latency-us 50
+
+"antes" reproduz o que o import do video_dao fazia (basicConfig síncrono, mensagem
+em f-string); "depois" usa configure_logging (JSON, fila limitada, %-style). O
+stdout é simulado por um sink com latência fixa por escrita e serializado por
+lock, como um pipe disputado no container.
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.infrastructure.config.settings import load_settings  # noqa: E402
+from app.infrastructure.observability.logging_config import (  # noqa: E402
+    configure_logging,
+    log_pipeline_stats,
+    shutdown_logging,
+)
+
+
+class SlowSink:
+    def __init__(self, latency_seconds: float):
+        self.latency_seconds = latency_seconds
+        self.lock = threading.Lock()
+        self.writes = 0
+
+    def write(self, _text: str) -> None:
+        with self.lock:
+            self.writes += 1
+            # sleep solta o GIL, como um write bloqueado no pipe.
+            time.sleep(self.latency_seconds)
+
+    def flush(self) -> None:
+        pass
+
+
+def _fstring_call(logger, n):
+    logger.info(f"Mensagem enviada ao SQS: {n} - fila {'video-processing'}")
+
+
+def _lazy_call(logger, n):
+    logger.info("Mensagem enviada ao SQS: %s - fila %s", n, "video-processing")
+
+
+def _fstring_debug_call(logger, n):
+    logger.debug(f"Payload do vídeo {n}: {{'video_id': {n}, 'status': 0}}")
+
+
+def _lazy_debug_call(logger, n):
+    logger.debug("Payload do vídeo %s: %s", n, {"video_id": n, "status": 0})
+
+
+def _run(call, calls: int, threads: int) -> list:
+    logger = logging.getLogger("bench.request")
+    samples = [[] for _ in range(threads)]
+
+    def worker(out):
+        clock = time.perf_counter_ns
+        for n in range(calls // threads):
+            started = clock()
+            call(logger, n)
+            out.append(clock() - started)
+
+    workers = [threading.Thread(target=worker, args=(out,)) for out in samples]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    return [sample for out in samples for sample in out]
+
+
+def _basic_config(sink) -> None:
+    handler = logging.StreamHandler(sink)
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+
+def _reset_root() -> None:
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(logging.WARNING)
+
+
+def _report(name: str, samples: list, extra: str = "") -> None:
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(
+        f"{name:<34} média={statistics.fmean(samples) / 1000:8.2f}µs "
+        f"p50={samples[len(samples) // 2] / 1000:8.2f}µs p99={p99 / 1000:8.2f}µs {extra}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--sink-latency-us", type=float, default=50.0)
+    parser.add_argument("--queue-size", type=int, default=10000)
+    args = parser.parse_args()
+    latency = args.sink_latency_us / 1_000_000
+
+    print(f"{args.calls} chamadas, {args.threads} threads, sink {args.sink_latency_us}µs/escrita\n")
+
+    before = (("antes: síncrono + f-string", _fstring_call), ("antes: debug desligado, f-string", _fstring_debug_call))
+    for name, call in before:
+        _basic_config(SlowSink(latency))
+        _report(name, _run(call, args.calls, args.threads))
+        _reset_root()
+
+    scenarios = (
+        ("depois: síncrono + JSON + %", _lazy_call, "false"),
+        ("depois: fila + JSON + %", _lazy_call, "true"),
+        ("depois: debug desligado, %", _lazy_debug_call, "true"),
+    )
+    for name, call, use_queue in scenarios:
+        sink = SlowSink(latency)
+        configure_logging(
+            load_settings({"LOG_ASYNC": use_queue, "LOG_QUEUE_SIZE": str(args.queue_size)}), stream=sink
+        )
+        samples = _run(call, args.calls, args.threads)
+        dropped = log_pipeline_stats()["dropped"]
+        shutdown_logging()
+        _report(name, samples, f"descartados={dropped}" if use_queue == "true" else "")
+        _reset_root()
+
+
+if __name__ == "__main__":
+    main()
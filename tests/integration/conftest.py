@@ -18,6 +18,10 @@ def test_database_url(monkeypatch, tmp_path):
     monkeypatch.setenv("DATABASE_URL", db_url)
     monkeypatch.setenv("SQLALCHEMY_DATABASE_URL", db_url)
 
+    from app.infrastructure.config.settings import reload_settings
+
+    reload_settings()
+
 
 @pytest.fixture
 def mock_db_session():
@@ -63,7 +63,8 @@ fi
 INVALID_FILE="$WORK_DIR/invalid.txt"
 VALID_FILE="$WORK_DIR/test.mp4"
 echo "conteudo invalido" > "$INVALID_FILE"
-printf 'fake mp4 content for smoke local\n' > "$VALID_FILE"
+# Só o cabeçalho ftyp: a API confere a assinatura do container, não decodifica o vídeo.
+printf '\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00mp42isomsmoke local\n' > "$VALID_FILE"
 
 health_code=$(curl -sS -o "$WORK_DIR/health.json" -w '%{http_code}' "$BASE_URL/health/")
 health_db_code=$(curl -sS -o "$WORK_DIR/health_db.json" -w '%{http_code}' "$BASE_URL/health/db")
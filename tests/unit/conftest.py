@@ -18,6 +18,18 @@ def test_database_url(monkeypatch, tmp_path):
     monkeypatch.setenv("DATABASE_URL", db_url)
     monkeypatch.setenv("SQLALCHEMY_DATABASE_URL", db_url)
 
+    from app.infrastructure.config.settings import reload_settings
+    from app.infrastructure.cache.video_list_cache import reset_video_list_cache
+    from app.infrastructure.events.status_hub import reset_status_hub
+    from app.gateways.sqs_batch_producer import shutdown_sqs_producer
+    from app.gateways.outbox_relay import stop_outbox_relay
+
+    reload_settings()
+    reset_video_list_cache()
+    reset_status_hub()
+    shutdown_sqs_producer()
+    stop_outbox_relay()
+
 
 @pytest.fixture
 def mock_db():
@@ -0,0 +1,129 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.dao.async_video_dao import AsyncVideoDAO
+from app.dao.video_dao import video_from_row, video_insert_statement, video_status_update_statement
+from app.infrastructure.db import async_database
+from app.infrastructure.db.async_database import is_memory_sqlite, to_async_url
+from app.infrastructure.db.database import Base
+from app.models.video import Video
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def async_session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[Video.__table__])
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+def _video(user_id=1, title="Video", status=0):
+    return SimpleNamespace(user_id=user_id, title=title, file_path="/uploads/video.mp4", status=status)
+
+
+async def _create(session, video):
+    # As escritas ficam no DAO síncrono; aqui só semeia a tabela pela mesma instrução.
+    result = await session.execute(video_insert_statement(video))
+    created = video_from_row(result.one())
+    await session.commit()
+    return created
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("sqlite:///./test.db", "sqlite+aiosqlite:///./test.db"),
+        ("postgresql://u:p@host:5432/db", "postgresql+asyncpg://u:p@host:5432/db"),
+        ("postgresql+psycopg2://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("postgresql+asyncpg://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("postgresql://u:p@host/db?sslmode=require", "postgresql+asyncpg://u:p@host/db?ssl=require"),
+    ],
+)
+def test_to_async_url_swaps_driver(url, expected):
+    assert to_async_url(url).render_as_string(hide_password=False) == expected
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("sqlite:///:memory:", True),
+        ("sqlite://", True),
+        ("sqlite:///file:mem?mode=memory&uri=true", True),
+        ("sqlite:///./test.db", False),
+        ("postgresql://u:p@host/db", False),
+    ],
+)
+def test_is_memory_sqlite(url, expected):
+    assert is_memory_sqlite(url) is expected
+
+
+def test_async_engine_rejects_in_memory_sqlite(monkeypatch):
+    monkeypatch.setattr(async_database.database, "engine", SimpleNamespace(url="sqlite:///:memory:"))
+    monkeypatch.setattr(async_database, "_async_engine", None)
+
+    with pytest.raises(RuntimeError, match="in-memory SQLite"):
+        async_database.get_async_engine()
+
+
+@pytest.mark.anyio
+async def test_create_and_list_videos_by_user(async_session):
+    dao = AsyncVideoDAO(async_session)
+
+    first = await _create(async_session, _video(title="Primeiro"))
+    second = await _create(async_session, _video(title="Segundo"))
+    await _create(async_session, _video(user_id=2, title="Outro usuário"))
+
+    videos = await dao.list_videos_by_user(1)
+
+    assert [video.id for video in videos] == [second.id, first.id]
+    assert videos[0].title == "Segundo"
+
+
+@pytest.mark.anyio
+async def test_list_videos_by_user_paginates_by_keyset(async_session):
+    dao = AsyncVideoDAO(async_session)
+    created = [await _create(async_session, _video(title=f"Video {i}")) for i in range(5)]
+    ids = sorted((video.id for video in created), reverse=True)
+
+    first_page = await dao.list_videos_by_user(1, limit=2)
+    second_page = await dao.list_videos_by_user(1, limit=2, after_id=first_page[-1].id)
+
+    assert [video.id for video in first_page] == ids[:2]
+    assert [video.id for video in second_page] == ids[2:4]
+    assert set(first_page[0]._fields) == {"id", "user_id", "title", "file_path", "status"}
+
+
+def test_video_table_has_user_id_keyset_index():
+    indexes = {index.name: index for index in Video.__table__.indexes}
+
+    assert [column.name for column in indexes["ix_video_user_id_id"].columns] == ["user_id", "id"]
+
+
+@pytest.mark.anyio
+async def test_listing_etag_changes_when_file_path_changes_with_same_status(async_session):
+    from app.controllers.list_videos_controller import ListVideosController
+
+    controller = ListVideosController(AsyncVideoDAO(async_session))
+    empty = await controller.listing_etag_async(1, limit=50)
+
+    created = await _create(async_session, _video())
+    after_create = await controller.listing_etag_async(1, limit=50)
+
+    await async_session.execute(video_status_update_statement(created.id, 0, "/uploads/outro.mp4"))
+    await async_session.commit()
+    after_path_change = await controller.listing_etag_async(1, limit=50)
+
+    assert len({empty, after_create, after_path_change}) == 3
+    assert await controller.listing_etag_async(2, limit=50) != empty
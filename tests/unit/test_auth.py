@@ -1,9 +1,12 @@
+import time
+
 import pytest
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
 from jwt import InvalidTokenError
 
 from app.infrastructure.security import auth
+from app.infrastructure.config.settings import _as_bool, reload_settings
 
 
 def _bearer(token: str = "token") -> HTTPAuthorizationCredentials:
@@ -11,21 +14,24 @@ def _bearer(token: str = "token") -> HTTPAuthorizationCredentials:
 
 
 def test_as_bool_and_is_auth_required(monkeypatch):
-    assert auth._as_bool("true", False) is True
-    assert auth._as_bool("0", True) is False
-    assert auth._as_bool(None, True) is True
+    assert _as_bool("true", False) is True
+    assert _as_bool("0", True) is False
+    assert _as_bool(None, True) is True
 
     monkeypatch.setenv("APP_ENV", "production")
     monkeypatch.delenv("AUTH_REQUIRED", raising=False)
+    reload_settings()
     assert auth._is_auth_required() is True
 
     monkeypatch.setenv("AUTH_REQUIRED", "false")
+    reload_settings()
     assert auth._is_auth_required() is False
 
     monkeypatch.delenv("AUTH_REQUIRED", raising=False)
     monkeypatch.setenv("APP_ENV", "development")
     monkeypatch.setenv("COGNITO_ISSUER", "https://issuer")
     monkeypatch.setenv("COGNITO_CLIENT_ID", "client")
+    reload_settings()
     assert auth._is_auth_required() is True
 
 
@@ -49,6 +55,7 @@ def test_validate_audience_variants():
 
 def test_get_current_user_auth_disabled(monkeypatch):
     monkeypatch.setenv("AUTH_REQUIRED", "false")
+    reload_settings()
 
     user = auth.get_current_user(None)
 
@@ -60,6 +67,7 @@ def test_get_current_user_missing_config(monkeypatch):
     monkeypatch.setenv("AUTH_REQUIRED", "true")
     monkeypatch.delenv("COGNITO_ISSUER", raising=False)
     monkeypatch.delenv("COGNITO_CLIENT_ID", raising=False)
+    reload_settings()
 
     with pytest.raises(HTTPException) as exc:
         auth.get_current_user(_bearer())
@@ -71,6 +79,7 @@ def test_get_current_user_missing_credentials(monkeypatch):
     monkeypatch.setenv("AUTH_REQUIRED", "true")
     monkeypatch.setenv("COGNITO_ISSUER", "https://issuer")
     monkeypatch.setenv("COGNITO_CLIENT_ID", "client")
+    reload_settings()
 
     with pytest.raises(HTTPException) as exc:
         auth.get_current_user(None)
@@ -82,6 +91,7 @@ def test_get_current_user_invalid_token_error(monkeypatch):
     monkeypatch.setenv("AUTH_REQUIRED", "true")
     monkeypatch.setenv("COGNITO_ISSUER", "https://issuer")
     monkeypatch.setenv("COGNITO_CLIENT_ID", "client")
+    reload_settings()
     monkeypatch.setattr(auth, "_resolve_signing_key", lambda *_: ("key", "RS256"))
 
     def _raise_invalid(*_args, **_kwargs):
@@ -100,6 +110,7 @@ def test_get_current_user_unexpected_validation_error(monkeypatch):
     monkeypatch.setenv("AUTH_REQUIRED", "true")
     monkeypatch.setenv("COGNITO_ISSUER", "https://issuer")
     monkeypatch.setenv("COGNITO_CLIENT_ID", "client")
+    reload_settings()
 
     def _raise_any(*_args, **_kwargs):
         raise RuntimeError("boom")
@@ -117,6 +128,7 @@ def test_get_current_user_missing_sub(monkeypatch):
     monkeypatch.setenv("AUTH_REQUIRED", "true")
     monkeypatch.setenv("COGNITO_ISSUER", "https://issuer")
     monkeypatch.setenv("COGNITO_CLIENT_ID", "client")
+    reload_settings()
     monkeypatch.setattr(auth, "_resolve_signing_key", lambda *_: ("key", "RS256"))
     monkeypatch.setattr(auth.jwt, "decode", lambda *_args, **_kwargs: {"token_use": "id", "aud": "client"})
 
@@ -131,6 +143,7 @@ def test_get_current_user_success(monkeypatch):
     monkeypatch.setenv("AUTH_REQUIRED", "true")
     monkeypatch.setenv("COGNITO_ISSUER", "https://issuer")
     monkeypatch.setenv("COGNITO_CLIENT_ID", "client")
+    reload_settings()
     monkeypatch.setattr(auth, "_resolve_signing_key", lambda *_: ("key", "RS256"))
     monkeypatch.setattr(
         auth.jwt,
@@ -144,11 +157,37 @@ def test_get_current_user_success(monkeypatch):
     assert user.claims["custom:user_id"] == "42"
 
 
+def test_get_current_user_caches_verified_token(monkeypatch):
+    monkeypatch.setenv("AUTH_REQUIRED", "true")
+    monkeypatch.setenv("COGNITO_ISSUER", "https://issuer")
+    monkeypatch.setenv("COGNITO_CLIENT_ID", "client")
+    reload_settings()
+    monkeypatch.setattr(auth, "_resolve_signing_key", lambda *_: ("key", "RS256"))
+    auth.get_token_cache().clear()
+    decode_calls = []
+
+    def _decode(*_args, **_kwargs):
+        decode_calls.append(True)
+        return {"sub": "42", "token_use": "id", "aud": "client", "exp": time.time() + 300}
+
+    monkeypatch.setattr(auth.jwt, "decode", _decode)
+
+    first = auth.get_current_user(_bearer("cached-token"))
+    second = auth.get_current_user(_bearer("cached-token"))
+
+    assert first is second
+    assert decode_calls == [True]
+    assert auth.get_token_cache().stats()["hits"] == 1
+    auth.get_token_cache().clear()
+
+
 def test_enforce_same_user_rules(monkeypatch):
     monkeypatch.setenv("AUTH_REQUIRED", "false")
+    reload_settings()
     auth.enforce_same_user(10, auth.AuthenticatedUser(sub="x", claims={}))
 
     monkeypatch.setenv("AUTH_REQUIRED", "true")
+    reload_settings()
     auth.enforce_same_user(10, auth.AuthenticatedUser(sub="x", claims={}))
     auth.enforce_same_user(10, auth.AuthenticatedUser(sub="10", claims={}))
     auth.enforce_same_user(10, auth.AuthenticatedUser(sub="x", claims={"custom:user_id": "10"}))
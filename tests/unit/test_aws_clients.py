@@ -0,0 +1,84 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from app.infrastructure.aws import clients
+from app.infrastructure.config.settings import get_settings, reload_settings
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    clients.reset_clients()
+    yield
+    clients.reset_clients()
+
+
+def test_get_client_is_lazy_and_reused(monkeypatch):
+    created = []
+
+    def fake_create(service_name):
+        client = Mock(name=service_name)
+        created.append(service_name)
+        return client
+
+    monkeypatch.setattr(clients, "_create_client", fake_create)
+
+    assert created == []
+    first = clients.get_s3_client()
+    second = clients.get_s3_client()
+    sqs = clients.get_sqs_client()
+
+    assert first is second
+    assert sqs is not first
+    assert created == ["s3", "sqs"]
+
+
+def test_get_client_creates_single_instance_under_concurrency(monkeypatch):
+    created = []
+    barrier = threading.Barrier(8)
+
+    def fake_create(service_name):
+        created.append(service_name)
+        return Mock()
+
+    monkeypatch.setattr(clients, "_create_client", fake_create)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(clients.get_sqs_client())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert created == ["sqs"]
+    assert all(result is results[0] for result in results)
+
+
+def test_build_client_config_reads_env(monkeypatch):
+    monkeypatch.setenv("AWS_MAX_POOL_CONNECTIONS", "128")
+    monkeypatch.setenv("AWS_MAX_ATTEMPTS", "5")
+    monkeypatch.setenv("AWS_READ_TIMEOUT_SECONDS", "invalid")
+    reload_settings()
+
+    config = clients.build_client_config(get_settings().aws)
+
+    assert config.max_pool_connections == 128
+    assert config.retries == {"max_attempts": 5, "mode": "standard"}
+    assert config.read_timeout == 60
+    assert config.tcp_keepalive is True
+
+
+def test_real_client_uses_tuned_config(monkeypatch):
+    monkeypatch.setenv("AWS_REGION", "sa-east-1")
+    monkeypatch.setenv("AWS_MAX_POOL_CONNECTIONS", "64")
+    reload_settings()
+
+    client = clients.get_s3_client()
+
+    assert client.meta.region_name == "sa-east-1"
+    assert client.meta.config.max_pool_connections == 64
@@ -0,0 +1,288 @@
+import hashlib
+import io
+import json
+from unittest.mock import Mock
+
+import boto3
+import pytest
+from fastapi import HTTPException, Response, UploadFile
+from moto import mock_aws
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from starlette.datastructures import Headers
+
+import app.api.upload as upload_module
+from app.dao.content_object_dao import ContentObjectDAO
+from app.dao.video_dao import VideoDAO, match_returned_rows, video_values
+from app.gateways.sqs_producer import SQSProducer
+from app.gateways.video_processing_gateway import VideoProcessingGateway
+from app.infrastructure.config.settings import reload_settings
+from app.infrastructure.db.database import Base
+from app.infrastructure.security.auth import AuthenticatedUser
+from app.models.content_object import ContentObject
+from app.models.outbox import OutboxMessage
+from app.models.video import Video
+from app.use_cases.batch_upload_use_case import BatchUploadItem, BatchUploadUseCase
+from app.use_cases.upload_use_case import UploadUseCase
+
+MP4_HEAD = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00"
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'batch.db'}")
+    Base.metadata.create_all(
+        bind=engine, tables=[Video.__table__, OutboxMessage.__table__, ContentObject.__table__]
+    )
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(" ".join(statement.split()[:3]).upper())
+
+    session = sessionmaker(bind=engine, autoflush=False)()
+    session.statements = statements
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def gateway(monkeypatch, tmp_path):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    monkeypatch.setenv("UPLOAD_DEDUP_ENABLED", "true")
+    reload_settings()
+    return VideoProcessingGateway(base_dir=tmp_path)
+
+
+def _upload_file(filename, content=None, content_type="video/mp4"):
+    content = MP4_HEAD + filename.encode() if content is None else content
+    return UploadFile(file=io.BytesIO(content), filename=filename, headers=Headers({"content-type": content_type}))
+
+
+def _use_case(db, gateway, sqs_producer=None, use_outbox=False, dedup=True):
+    return UploadUseCase(
+        processing_gateway=gateway,
+        video_dao=VideoDAO(db),
+        sqs_producer=sqs_producer or Mock(send_messages=Mock(side_effect=lambda messages: [True] * len(messages))),
+        use_outbox=use_outbox,
+        content_dao=ContentObjectDAO(db) if dedup else None,
+    )
+
+
+def _items(*files):
+    return [BatchUploadItem(filename=file.filename, title=file.filename, upload_file=file) for file in files]
+
+
+def test_batch_inserts_all_videos_at_once_and_publishes_one_batch(db, gateway):
+    sqs_producer = Mock(send_messages=Mock(return_value=[True, True, True]))
+    use_case = BatchUploadUseCase(_use_case(db, gateway, sqs_producer), concurrency=2)
+
+    db.statements.clear()
+    items = use_case.execute(7, _items(_upload_file("a.mp4"), _upload_file("b.mp4"), _upload_file("c.mp4")))
+
+    assert [item.error for item in items] == [None, None, None]
+    assert [item.video.title for item in items] == ["a.mp4", "b.mp4", "c.mp4"]
+    assert db.statements.count("INSERT INTO VIDEO") == 1
+    sqs_producer.send_messages.assert_called_once()
+    messages = sqs_producer.send_messages.call_args.args[0]
+    assert [message["video_id"] for message in messages] == [item.video.id for item in items]
+    assert all(message["user_id"] == 7 for message in messages)
+
+
+def test_returned_rows_are_matched_by_values_not_by_id_order():
+    inputs = [
+        Video(user_id=1, title="a", file_path="/uploads/a.mp4", status=0),
+        Video(user_id=1, title="b", file_path="/uploads/b.mp4", status=0),
+        Video(user_id=1, title="c", file_path="/uploads/c.mp4", status=0),
+    ]
+    # Postgres pode devolver o RETURNING fora da ordem do VALUES, com ids trocados.
+    returned = [
+        Video(id=30, user_id=1, title="b", file_path="/uploads/b.mp4", status=0),
+        Video(id=10, user_id=1, title="c", file_path="/uploads/c.mp4", status=0),
+        Video(id=20, user_id=1, title="a", file_path="/uploads/a.mp4", status=0),
+    ]
+
+    matched = match_returned_rows([video_values(video) for video in inputs], returned)
+
+    assert [(video.id, video.title) for video in matched] == [(20, "a"), (30, "b"), (10, "c")]
+
+
+def test_batch_with_outbox_writes_one_event_per_video(db, gateway):
+    use_case = BatchUploadUseCase(_use_case(db, gateway, use_outbox=True), concurrency=4)
+
+    items = use_case.execute(1, _items(_upload_file("a.mp4"), _upload_file("b.mp4")))
+
+    payloads = [json.loads(message.payload) for message in db.query(OutboxMessage).order_by(OutboxMessage.id)]
+    assert [payload["video_id"] for payload in payloads] == [item.video.id for item in items]
+
+
+def test_batch_reports_storage_failures_per_file(db, gateway, monkeypatch):
+    original = gateway.store_upload
+
+    def flaky_store(upload_file, timestamp):
+        if upload_file.filename == "bad.mp4":
+            raise OSError("disk full")
+        return original(upload_file, timestamp)
+
+    monkeypatch.setattr(gateway, "store_upload", flaky_store)
+    use_case = BatchUploadUseCase(_use_case(db, gateway), concurrency=2)
+    invalid = BatchUploadItem(filename="notes.txt", title="notes", error="Formato de arquivo não suportado")
+
+    items = use_case.execute(1, [*_items(_upload_file("ok.mp4"), _upload_file("bad.mp4")), invalid])
+
+    assert items[0].video is not None
+    assert (items[1].video, items[1].error) == (None, "Falha ao gravar arquivo")
+    assert (items[2].video, items[2].error) == (None, "Formato de arquivo não suportado")
+    assert db.query(Video).count() == 1
+
+
+def test_batch_deduplicates_repeated_content_inside_the_batch(db, gateway):
+    sqs_producer = Mock(send_messages=Mock(return_value=[True]))
+    use_case = BatchUploadUseCase(_use_case(db, gateway, sqs_producer), concurrency=2)
+    content = MP4_HEAD + b"same"
+    content_hash = hashlib.sha256(content).hexdigest()
+
+    items = use_case.execute(1, _items(_upload_file("a.mp4", content), _upload_file("b.mp4", content)))
+
+    stored = str(gateway.content_path(1, content_hash, ".mp4"))
+    assert [item.video.file_path for item in items] == [stored, stored]
+    assert [p.name for p in gateway.uploads_dir.iterdir()] == ["objects"]
+    # Cada cópia tem job próprio sobre o mesmo objeto armazenado.
+    messages = sqs_producer.send_messages.call_args.args[0]
+    assert [message["video_path"] for message in messages] == [stored, stored]
+    assert ContentObjectDAO(db).get(1, content_hash).video_id == items[0].video.id
+
+
+def test_batch_reuses_content_registered_before_the_batch(db, gateway):
+    upload_use_case = _use_case(db, gateway)
+    content = MP4_HEAD + b"known"
+    canonical, _, _ = upload_use_case.execute(1, "original", _upload_file("orig.mp4", content))
+    VideoDAO(db).update_video_status(canonical.id, 1, file_path="/outputs/frames.zip")
+
+    items = BatchUploadUseCase(upload_use_case, concurrency=2).execute(
+        1, _items(_upload_file("copy.mp4", content), _upload_file("new.mp4"))
+    )
+
+    assert (items[0].video.status, items[0].video.file_path) == (1, "/outputs/frames.zip")
+    assert items[1].video.status == 0
+
+
+def test_individual_fallback_failure_only_marks_the_failing_item(db, gateway, monkeypatch):
+    upload_use_case = _use_case(db, gateway)
+    first, second = MP4_HEAD + b"known-1", MP4_HEAD + b"known-2"
+    upload_use_case.execute(1, "original 1", _upload_file("orig1.mp4", first))
+    upload_use_case.execute(1, "original 2", _upload_file("orig2.mp4", second))
+
+    original = upload_use_case.register_upload
+
+    def flaky_register(user_id, title, *args, **kwargs):
+        if title == "copy2.mp4":
+            raise RuntimeError("banco indisponível")
+        return original(user_id, title, *args, **kwargs)
+
+    monkeypatch.setattr(upload_use_case, "register_upload", flaky_register)
+
+    items = BatchUploadUseCase(upload_use_case, concurrency=2).execute(
+        1, _items(_upload_file("copy1.mp4", first), _upload_file("copy2.mp4", second), _upload_file("new.mp4"))
+    )
+
+    assert items[0].video is not None and items[0].error is None
+    assert items[1].video is None and items[1].error == "Falha ao registrar vídeo"
+    assert items[2].video is not None and items[2].error is None
+    assert db.query(Video).count() == 4
+
+
+def test_batch_without_dedup_keeps_original_paths(db, gateway):
+    use_case = BatchUploadUseCase(_use_case(db, gateway, dedup=False), concurrency=2)
+
+    items = use_case.execute(1, _items(_upload_file("a.mp4"), _upload_file("b.mp4")))
+
+    assert all(item.video.content_hash is None for item in items)
+    assert all(item.video.file_path.startswith(str(gateway.uploads_dir)) for item in items)
+
+
+@pytest.mark.anyio
+async def test_batch_route_returns_207_with_per_file_results(db, gateway, monkeypatch):
+    monkeypatch.setenv("OUTBOX_ENABLED", "false")
+    reload_settings()
+    sqs_producer = Mock(send_messages=Mock(side_effect=lambda messages: [True] * len(messages)))
+    response = Response()
+
+    result = await upload_module.upload_video_batch(
+        response=response,
+        user_id=1,
+        files=[
+            _upload_file("a.mp4"),
+            _upload_file("notes.txt", content_type="text/plain"),
+            _upload_file("fake.mp4", content=b"not a video at all"),
+            _upload_file("a.mp4"),
+        ],
+        titles=["Primeiro"],
+        db=db,
+        processing_gateway=gateway,
+        sqs_producer=sqs_producer,
+        current_user=AuthenticatedUser(sub="1", claims={"user_id": "1"}),
+    )
+
+    assert response.status_code == 207
+    assert (result.status, result.created, result.failed) == ("partial", 1, 3)
+    assert result.results[0].data.title == "Primeiro"
+    assert [r.error for r in result.results[1:]] == [
+        "Formato de arquivo não suportado",
+        result.results[2].error,
+        "Arquivo com nome repetido no lote",
+    ]
+    assert result.results[2].status == "error"
+
+
+@pytest.mark.anyio
+async def test_batch_route_rejects_too_many_files(db, gateway, monkeypatch):
+    monkeypatch.setenv("BATCH_UPLOAD_MAX_FILES", "2")
+    reload_settings()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.upload_video_batch(
+            response=Response(),
+            user_id=1,
+            files=[_upload_file(f"{n}.mp4") for n in range(3)],
+            titles=None,
+            db=db,
+            processing_gateway=gateway,
+            sqs_producer=Mock(),
+            current_user=AuthenticatedUser(sub="1", claims={"user_id": "1"}),
+        )
+
+    assert exc_info.value.status_code == 400
+
+
+def test_sqs_producer_send_messages_uses_send_message_batch(monkeypatch):
+    with mock_aws():
+        client = boto3.client("sqs", region_name="us-east-1")
+        queue_url = client.create_queue(QueueName="video-processing")["QueueUrl"]
+        monkeypatch.setenv("SQS_VIDEO_PROCESSING_QUEUE", queue_url)
+        reload_settings()
+
+        results = SQSProducer(client).send_messages([{"video_id": n} for n in range(12)])
+
+        received = []
+        for _ in range(3):
+            received += client.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10).get("Messages", [])
+
+    assert results == [True] * 12
+    assert sorted(json.loads(message["Body"])["video_id"] for message in received) == list(range(12))
+
+
+def test_sqs_producer_send_messages_reports_failed_entries():
+    client = Mock()
+    client.send_message_batch.return_value = {
+        "Successful": [{"Id": "0", "MessageId": "m0"}],
+        "Failed": [{"Id": "1", "Code": "InternalError", "Message": "boom"}],
+    }
+
+    assert SQSProducer(client).send_messages([{"n": 0}, {"n": 1}]) == [True, False]
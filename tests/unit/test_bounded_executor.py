@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from app.infrastructure.concurrency import bounded_executor
+from app.infrastructure.concurrency.bounded_executor import BoundedExecutor, ExecutorSaturatedError
+from app.infrastructure.config.settings import reload_settings
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_submit_rejects_when_workers_and_queue_are_full():
+    executor = BoundedExecutor(max_workers=1, max_queue=1, name="test")
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    try:
+        first = executor.submit(blocking)
+        started.wait(5)
+        second = executor.submit(blocking)
+
+        assert executor.stats()["active"] == 1
+        assert executor.stats()["queued"] == 1
+
+        with pytest.raises(ExecutorSaturatedError):
+            executor.submit(blocking)
+
+        release.set()
+        assert first.result(5) == "done"
+        assert second.result(5) == "done"
+    finally:
+        release.set()
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+    assert stats["completed"] == 2
+    assert stats["rejected"] == 1
+
+
+def test_failed_jobs_release_their_slot():
+    executor = BoundedExecutor(max_workers=1, max_queue=0, name="test")
+
+    def boom():
+        raise ValueError("boom")
+
+    try:
+        with pytest.raises(ValueError):
+            executor.submit(boom).result(5)
+
+        assert executor.submit(lambda: 1).result(5) == 1
+    finally:
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert (stats["failed"], stats["completed"]) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_run_executes_off_the_event_loop_thread():
+    executor = BoundedExecutor(max_workers=1, max_queue=0, name="test")
+
+    try:
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+    finally:
+        executor.shutdown()
+
+    assert thread_name.startswith("test")
+
+
+def test_get_upload_executor_uses_settings(monkeypatch):
+    monkeypatch.setenv("UPLOAD_EXECUTOR_WORKERS", "3")
+    monkeypatch.setenv("UPLOAD_EXECUTOR_QUEUE_SIZE", "7")
+    reload_settings()
+    bounded_executor.shutdown_upload_executor()
+
+    try:
+        executor = bounded_executor.get_upload_executor()
+
+        assert executor is bounded_executor.get_upload_executor()
+        assert executor.max_workers == 3
+        assert executor.max_queue == 7
+    finally:
+        bounded_executor.shutdown_upload_executor()
@@ -0,0 +1,161 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import app.dao.video_dao as video_dao_module
+from app.adapters.schemas.video import BulkStatusUpdateSchema
+from app.api.internal import bulk_update_video_status
+from app.dao.video_dao import VideoDAO
+from app.infrastructure.config.settings import reload_settings
+from app.infrastructure.db.database import Base
+from app.infrastructure.events.status_hub import get_status_hub
+from app.infrastructure.security.auth import require_internal_token
+from app.models.outbox import OutboxMessage
+from app.models.video import Video
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    Base.metadata.create_all(bind=engine, tables=[Video.__table__, OutboxMessage.__table__])
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement.split()[0].upper())
+
+    session = sessionmaker(bind=engine, autoflush=False)()
+    session.statements = statements
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _create(dao, count, **overrides):
+    values = dict(user_id=1, title="Video", file_path="/uploads/v.mp4", status=0)
+    values.update(overrides)
+    return [dao.create_video(SimpleNamespace(**values)) for _ in range(count)]
+
+
+def test_bulk_update_applies_all_rows_in_one_statement(db):
+    dao = VideoDAO(db)
+    first, second, third = _create(dao, 3)
+
+    db.statements.clear()
+    updated = dao.bulk_update_status([
+        (first.id, 1, "/outputs/a.zip"),
+        (second.id, 2, None),
+        (third.id, 1, "/outputs/c.zip"),
+    ])
+
+    assert db.statements == ["UPDATE"]
+    assert {video.id: (video.status, video.file_path) for video in updated} == {
+        first.id: (1, "/outputs/a.zip"),
+        second.id: (2, "/uploads/v.mp4"),
+        third.id: (1, "/outputs/c.zip"),
+    }
+
+    db.expire_all()
+    assert dao.get_video(second.id).status == 2
+
+
+def test_bulk_update_returns_only_existing_rows_and_last_entry_wins(db):
+    dao = VideoDAO(db)
+    (video,) = _create(dao, 1)
+
+    updated = dao.bulk_update_status([(video.id, 1, None), (999, 1, None), (video.id, 2, None)])
+
+    assert [(v.id, v.status) for v in updated] == [(video.id, 2)]
+    assert dao.bulk_update_status([]) == []
+
+
+def test_bulk_update_splits_large_batches_in_one_transaction(db, monkeypatch):
+    monkeypatch.setattr(video_dao_module, "BULK_UPDATE_CHUNK_SIZE", 2)
+    dao = VideoDAO(db)
+    videos = _create(dao, 5)
+
+    db.statements.clear()
+    updated = dao.bulk_update_status([(video.id, 2, None) for video in videos])
+
+    assert db.statements == ["UPDATE", "UPDATE", "UPDATE"]
+    assert len(updated) == 5
+
+
+def test_bulk_update_leaves_other_uploads_of_the_same_content_alone(db):
+    dao = VideoDAO(db)
+    (canonical,) = _create(dao, 1, content_hash="a" * 64)
+    (duplicate,) = _create(dao, 1, user_id=2, content_hash="a" * 64)
+
+    assert [video.id for video in dao.bulk_update_status([(canonical.id, 1, "/outputs/frames.zip")])] == [canonical.id]
+
+    db.expire_all()
+    refreshed = dao.get_video(duplicate.id)
+    assert (refreshed.status, refreshed.file_path) == (0, "/uploads/v.mp4")
+
+
+@pytest.mark.anyio
+async def test_bulk_update_publishes_each_change(db):
+    dao = VideoDAO(db)
+    first, second = _create(dao, 2)
+
+    with get_status_hub().subscribe(1) as subscription:
+        dao.bulk_update_status([(first.id, 1, None), (second.id, 2, None)])
+        events = [await subscription.get(timeout=1), await subscription.get(timeout=1)]
+
+    assert {(event["video_id"], event["status"]) for event in events} == {(first.id, 1), (second.id, 2)}
+
+
+def test_internal_endpoint_reports_updated_and_missing_ids(db):
+    (video,) = _create(VideoDAO(db), 1)
+    payload = BulkStatusUpdateSchema(updates=[
+        {"id": video.id, "status": 1, "file_path": "/outputs/frames.zip"},
+        {"id": 404, "status": 2},
+    ])
+
+    response = bulk_update_video_status(payload, db=db)
+
+    assert response.updated == 1
+    assert response.not_found == [404]
+    assert response.data[0].file_path == "/outputs/frames.zip"
+
+
+def test_bulk_schema_rejects_empty_and_invalid_status():
+    with pytest.raises(ValidationError):
+        BulkStatusUpdateSchema(updates=[])
+
+    with pytest.raises(ValidationError):
+        BulkStatusUpdateSchema(updates=[{"id": 1, "status": 9}])
+
+
+def test_internal_token_is_required(monkeypatch):
+    monkeypatch.delenv("INTERNAL_API_TOKEN", raising=False)
+    reload_settings()
+
+    with pytest.raises(HTTPException) as exc_info:
+        require_internal_token("anything")
+    assert exc_info.value.status_code == 403
+
+    monkeypatch.setenv("INTERNAL_API_TOKEN", "s3cret")
+    reload_settings()
+
+    with pytest.raises(HTTPException) as exc_info:
+        require_internal_token("wrong")
+    assert exc_info.value.status_code == 403
+
+    with pytest.raises(HTTPException):
+        require_internal_token(None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        require_internal_token("sênha")
+    assert exc_info.value.status_code == 403
+
+    assert require_internal_token("s3cret") is None
@@ -0,0 +1,14 @@
+from app.infrastructure.api.conditional import etag_matches
+
+
+def test_etag_matches_exact_weak_and_list_values():
+    assert etag_matches('"abc"', '"abc"') is True
+    assert etag_matches('W/"abc"', '"abc"') is True
+    assert etag_matches('"x", "abc"', '"abc"') is True
+    assert etag_matches("*", '"abc"') is True
+
+
+def test_etag_does_not_match_missing_or_different_values():
+    assert etag_matches(None, '"abc"') is False
+    assert etag_matches("", '"abc"') is False
+    assert etag_matches('"abd"', '"abc"') is False
@@ -0,0 +1,202 @@
+import hashlib
+import io
+from types import SimpleNamespace
+from unittest.mock import ANY, Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.dao.content_object_dao import ContentObjectDAO
+from app.dao.video_dao import DuplicateContentError, VideoDAO
+from app.adapters.dto.video_dto import VideoCreateSchema
+from app.gateways.video_processing_gateway import VideoProcessingGateway
+from app.infrastructure.config.settings import load_settings, reload_settings
+from app.infrastructure.db.database import Base
+from app.models.content_object import ContentObject
+from app.models.outbox import OutboxMessage
+from app.models.video import Video
+from app.use_cases.upload_use_case import UploadUseCase
+
+CONTENT = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00" + b"frames" * 10
+CONTENT_HASH = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'dedup.db'}")
+    Base.metadata.create_all(
+        bind=engine, tables=[Video.__table__, OutboxMessage.__table__, ContentObject.__table__]
+    )
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def gateway(monkeypatch, tmp_path):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    monkeypatch.setenv("UPLOAD_DEDUP_ENABLED", "true")
+    reload_settings()
+    return VideoProcessingGateway(base_dir=tmp_path)
+
+
+def _use_case(db, gateway, sqs_producer=None):
+    return UploadUseCase(
+        processing_gateway=gateway,
+        video_dao=VideoDAO(db),
+        sqs_producer=sqs_producer or Mock(),
+        use_outbox=False,
+        content_dao=ContentObjectDAO(db),
+    )
+
+
+def _upload(use_case, user_id=1, title="Video", content=CONTENT):
+    upload_file = SimpleNamespace(filename="video.mp4", file=io.BytesIO(content))
+    return use_case.execute(user_id, title, upload_file)
+
+
+def test_first_upload_is_stored_by_hash_and_indexed(db, gateway):
+    sqs_producer = Mock()
+    created, saved_path, _ = _upload(_use_case(db, gateway, sqs_producer))
+
+    target = gateway.content_path(1, CONTENT_HASH, ".mp4")
+    assert saved_path == str(target)
+    assert target.read_bytes() == CONTENT
+    assert created.content_hash == CONTENT_HASH
+    assert [p.name for p in gateway.uploads_dir.iterdir()] == ["objects"]
+
+    content_object = ContentObjectDAO(db).get(1, CONTENT_HASH)
+    assert content_object.video_id == created.id
+    assert content_object.size == len(CONTENT)
+    assert sqs_producer.send_message.call_args.args[0]["video_path"] == str(target)
+
+
+def test_duplicate_while_processing_gets_its_own_job(db, gateway):
+    sqs_producer = Mock()
+    use_case = _use_case(db, gateway, sqs_producer)
+    canonical, _, _ = _upload(use_case)
+
+    duplicate, saved_path, _ = _upload(use_case, title="Copia")
+
+    assert duplicate.id != canonical.id
+    assert (duplicate.status, duplicate.file_path) == (0, canonical.file_path)
+    # Não depende de o status do canônico ser repassado: o worker processa cada vídeo.
+    assert sqs_producer.send_message.call_count == 2
+    assert sqs_producer.send_message.call_args.args[0] == {
+        "video_id": duplicate.id, "video_path": saved_path, "timestamp": ANY, "user_id": 1,
+    }
+    assert [p.name for p in gateway.uploads_dir.iterdir()] == ["objects"]
+    assert ContentObjectDAO(db).get(1, CONTENT_HASH).video_id == canonical.id
+
+    VideoDAO(db).update_video_status(canonical.id, 1, file_path="outputs/frames.zip")
+
+    db.expire_all()
+    assert VideoDAO(db).get_video(duplicate.id).status == 0
+
+
+def test_duplicate_of_processed_video_is_completed_immediately(db, gateway):
+    use_case = _use_case(db, gateway)
+    canonical, _, _ = _upload(use_case)
+    VideoDAO(db).update_video_status(canonical.id, 1, file_path="outputs/frames.zip")
+
+    duplicate, saved_path, _ = _upload(use_case)
+
+    assert duplicate.status == 1
+    assert saved_path == "outputs/frames.zip"
+
+
+def test_same_content_from_another_user_is_not_shared(db, gateway):
+    sqs_producer = Mock()
+    use_case = _use_case(db, gateway, sqs_producer)
+    canonical, _, _ = _upload(use_case)
+    VideoDAO(db).update_video_status(canonical.id, 1, file_path="outputs/frames.zip")
+
+    other, saved_path, _ = _upload(use_case, user_id=2)
+
+    assert other.status == 0
+    assert saved_path == str(gateway.content_path(2, CONTENT_HASH, ".mp4"))
+    assert gateway.content_path(1, CONTENT_HASH, ".mp4").read_bytes() == CONTENT
+    assert sqs_producer.send_message.call_count == 2
+    assert ContentObjectDAO(db).get(2, CONTENT_HASH).video_id == other.id
+    assert ContentObjectDAO(db).get(1, CONTENT_HASH).video_id == canonical.id
+
+
+def test_duplicate_of_failed_video_is_reprocessed_from_stored_object(db, gateway):
+    sqs_producer = Mock()
+    use_case = _use_case(db, gateway, sqs_producer)
+    canonical, _, _ = _upload(use_case)
+    VideoDAO(db).update_video_status(canonical.id, 2)
+
+    retry, saved_path, _ = _upload(use_case)
+
+    assert retry.status == 0
+    assert saved_path == str(gateway.content_path(1, CONTENT_HASH, ".mp4"))
+    assert sqs_producer.send_message.call_count == 2
+    assert ContentObjectDAO(db).get(1, CONTENT_HASH).video_id == retry.id
+
+
+def test_race_on_same_hash_falls_back_to_duplicate(db, gateway, monkeypatch):
+    use_case = _use_case(db, gateway)
+    canonical, _, _ = _upload(use_case)
+
+    # Simula outro upload que ainda não viu o content_object no primeiro get.
+    calls = []
+    original_get = use_case.content_dao.get
+
+    def stale_get(user_id, sha256):
+        calls.append(sha256)
+        return None if len(calls) == 1 else original_get(user_id, sha256)
+
+    monkeypatch.setattr(use_case.content_dao, "get", stale_get)
+
+    duplicate, _, _ = _upload(use_case)
+
+    assert len(calls) == 2
+    assert duplicate.file_path == canonical.file_path
+    assert gateway.content_path(1, CONTENT_HASH, ".mp4").read_bytes() == CONTENT
+
+
+def test_create_video_raises_duplicate_content_error_on_existing_hash(db):
+    dao = VideoDAO(db)
+    dto = VideoCreateSchema(user_id=1, title="a", file_path="a.mp4", status=0, content_hash=CONTENT_HASH)
+    dao.create_video(dto, content_object=ContentObjectDAO.build(1, CONTENT_HASH, "a.mp4"))
+
+    with pytest.raises(DuplicateContentError):
+        dao.create_video(dto, content_object=ContentObjectDAO.build(1, CONTENT_HASH, "a.mp4"))
+
+
+def test_unrelated_integrity_error_is_not_reported_as_duplicate(db):
+    from types import SimpleNamespace
+
+    dao = VideoDAO(db)
+    # title NULL viola o NOT NULL do vídeo; o conteúdo ainda não existe.
+    broken = SimpleNamespace(user_id=1, title=None, file_path="a.mp4", status=0, content_hash=CONTENT_HASH)
+
+    with pytest.raises(Exception, match="Erro de integridade") as exc_info:
+        dao.create_video(broken, content_object=ContentObjectDAO.build(1, CONTENT_HASH, "a.mp4"))
+    assert not isinstance(exc_info.value, DuplicateContentError)
+
+    with pytest.raises(Exception, match="Erro de integridade") as exc_info:
+        dao.create_videos([broken], content_objects=[ContentObjectDAO.build(1, CONTENT_HASH, "a.mp4")])
+    assert not isinstance(exc_info.value, DuplicateContentError)
+
+
+def test_dedup_is_off_by_default():
+    assert load_settings({}).storage.dedup_enabled is False
+    assert load_settings({"UPLOAD_DEDUP_ENABLED": "true"}).storage.dedup_enabled is True
+
+
+def test_without_content_dao_uploads_are_not_deduplicated(db, gateway):
+    use_case = UploadUseCase(
+        processing_gateway=gateway, video_dao=VideoDAO(db), sqs_producer=Mock(), use_outbox=False
+    )
+
+    first, first_path, _ = _upload(use_case)
+    second, _, _ = _upload(use_case)
+
+    assert first.id != second.id
+    assert first.content_hash is None
+    assert first_path.startswith(str(gateway.uploads_dir))
+    assert not (gateway.uploads_dir / "objects").exists()
@@ -0,0 +1,76 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.infrastructure.config.settings import load_settings
+from app.infrastructure.db import database
+from app.infrastructure.db.pool_metrics import InstrumentedQueuePool, checkout_metrics, pool_status
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    checkout_metrics.reset()
+    yield
+    checkout_metrics.reset()
+
+
+def test_pool_kwargs_come_from_settings():
+    settings = load_settings({
+        "DB_POOL_SIZE": "20",
+        "DB_MAX_OVERFLOW": "0",
+        "DB_POOL_TIMEOUT_SECONDS": "3",
+        "DB_POOL_RECYCLE_SECONDS": "300",
+        "DB_POOL_PRE_PING": "false",
+    })
+
+    kwargs = database._pool_kwargs("postgresql://u:p@host/db", settings)
+
+    assert kwargs == {
+        "pool_size": 20,
+        "max_overflow": 0,
+        "pool_timeout": 3,
+        "pool_recycle": 300,
+        "pool_pre_ping": False,
+    }
+
+
+def test_pool_kwargs_default_to_pre_ping_and_recycle():
+    kwargs = database._pool_kwargs("postgresql://u:p@host/db", load_settings({}))
+
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["pool_recycle"] == 1800
+    assert kwargs["pool_size"] == 5
+
+
+def test_pool_kwargs_skip_sqlite():
+    assert database._pool_kwargs("sqlite:///./test.db", load_settings({})) == {}
+
+
+def test_instrumented_pool_records_checkouts_and_timeouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+            status = pool_status(engine)
+            assert status["pool_class"] == "InstrumentedQueuePool"
+            assert status["checked_out"] == 1
+
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        status = pool_status(engine)
+    finally:
+        engine.dispose()
+
+    assert status["checked_out"] == 0
+    assert status["checkout"]["checkouts"] == 1
+    assert status["checkout"]["timeouts"] == 1
+    assert status["checkout"]["wait_ms_max"] >= 0
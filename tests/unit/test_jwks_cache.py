@@ -0,0 +1,237 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi.security import HTTPAuthorizationCredentials
+from jwt import InvalidTokenError
+from jwt.algorithms import RSAAlgorithm
+
+from app.infrastructure.security import auth
+from app.infrastructure.security.jwks import JWKSCache, get_jwks_cache, reset_jwks_caches
+from app.infrastructure.config.settings import reload_settings
+
+
+def _rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _jwks(*entries):
+    keys = []
+    for kid, private_key in entries:
+        jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+        jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+        keys.append(jwk)
+    return {"keys": keys}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class StubFetcher:
+    def __init__(self, jwks):
+        self.jwks = jwks
+        self.calls = 0
+
+    def __call__(self, url):
+        self.calls += 1
+        return self.jwks
+
+
+@pytest.fixture(scope="module")
+def key_a():
+    return _rsa_key()
+
+
+@pytest.fixture(scope="module")
+def key_b():
+    return _rsa_key()
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    reset_jwks_caches()
+    yield
+    reset_jwks_caches()
+
+
+def test_get_signing_key_fetches_once_within_ttl(key_a):
+    fetcher = StubFetcher(_jwks(("kid-a", key_a)))
+    cache = JWKSCache("https://issuer/.well-known/jwks.json", ttl_seconds=60, fetcher=fetcher, clock=FakeClock())
+
+    first = cache.get_signing_key("kid-a")
+    second = cache.get_signing_key("kid-a")
+
+    assert first is second
+    assert fetcher.calls == 1
+
+
+def test_get_signing_key_refetches_on_unknown_kid_with_rate_limit(key_a, key_b):
+    clock = FakeClock()
+    fetcher = StubFetcher(_jwks(("kid-a", key_a)))
+    cache = JWKSCache(
+        "https://issuer/.well-known/jwks.json",
+        ttl_seconds=600,
+        min_refetch_interval_seconds=30,
+        fetcher=fetcher,
+        clock=clock,
+    )
+    cache.get_signing_key("kid-a")
+
+    clock.now += 31
+    fetcher.jwks = _jwks(("kid-a", key_a), ("kid-b", key_b))
+    assert cache.get_signing_key("kid-b") is not None
+    assert fetcher.calls == 2
+
+    with pytest.raises(InvalidTokenError):
+        cache.get_signing_key("kid-unknown")
+    assert fetcher.calls == 2
+
+
+def test_burst_of_unknown_kids_fetches_once(key_a, monkeypatch):
+    clock = FakeClock()
+    fetcher = StubFetcher(_jwks(("kid-a", key_a)))
+    cache = JWKSCache(
+        "https://issuer/.well-known/jwks.json",
+        ttl_seconds=600,
+        min_refetch_interval_seconds=30,
+        fetcher=fetcher,
+        clock=clock,
+    )
+    cache.get_signing_key("kid-a")
+    clock.now += 31
+
+    # Alarga a janela entre o rate limit e o fetch para todas as threads passarem por ela.
+    original_check = cache._can_force_refetch
+
+    def slow_check():
+        allowed = original_check()
+        time.sleep(0.05)
+        return allowed
+
+    monkeypatch.setattr(cache, "_can_force_refetch", slow_check)
+    errors = []
+
+    def forged():
+        try:
+            cache.get_signing_key("kid-forged")
+        except InvalidTokenError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=forged) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(errors) == 8
+    assert fetcher.calls == 2
+
+
+def test_get_signing_key_serves_stale_and_refreshes_in_background(key_a, monkeypatch):
+    clock = FakeClock()
+    fetcher = StubFetcher(_jwks(("kid-a", key_a)))
+    cache = JWKSCache(
+        "https://issuer/.well-known/jwks.json", ttl_seconds=60, stale_seconds=600, fetcher=fetcher, clock=clock
+    )
+    cache.get_signing_key("kid-a")
+    scheduled = []
+    monkeypatch.setattr(cache, "_schedule_background_refresh", lambda: scheduled.append(True))
+
+    clock.now += 120
+    assert cache.get_signing_key("kid-a") is not None
+
+    assert scheduled == [True]
+    assert fetcher.calls == 1
+
+
+def test_background_refresh_failure_keeps_current_keys(key_a):
+    clock = FakeClock()
+    fetcher = StubFetcher(_jwks(("kid-a", key_a)))
+    cache = JWKSCache("https://issuer/.well-known/jwks.json", fetcher=fetcher, clock=clock)
+    cache.refresh()
+
+    def broken(_url):
+        raise OSError("network down")
+
+    cache.fetcher = broken
+    cache._refreshing = True
+    cache._refresh_in_background()
+
+    assert cache._refreshing is False
+    assert cache.get_signing_key("kid-a") is not None
+
+
+def test_get_signing_key_refetches_after_stale_window(key_a):
+    clock = FakeClock()
+    fetcher = StubFetcher(_jwks(("kid-a", key_a)))
+    cache = JWKSCache(
+        "https://issuer/.well-known/jwks.json", ttl_seconds=60, stale_seconds=60, fetcher=fetcher, clock=clock
+    )
+    cache.get_signing_key("kid-a")
+
+    clock.now += 121
+    cache.get_signing_key("kid-a")
+
+    assert fetcher.calls == 2
+
+
+def test_get_signing_key_requires_kid():
+    cache = JWKSCache("https://issuer/.well-known/jwks.json", fetcher=StubFetcher({"keys": []}))
+
+    with pytest.raises(InvalidTokenError):
+        cache.get_signing_key(None)
+
+
+def test_get_jwks_cache_is_shared_per_issuer():
+    assert get_jwks_cache("https://issuer/") is get_jwks_cache("https://issuer")
+    assert get_jwks_cache("https://issuer") is not get_jwks_cache("https://other")
+
+
+def test_get_current_user_validates_against_local_jwks_stub(monkeypatch, key_a):
+    jwks_body = json.dumps(_jwks(("kid-a", key_a))).encode()
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(jwks_body)
+
+        def log_message(self, *_args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        issuer = f"http://127.0.0.1:{server.server_port}/pool"
+        monkeypatch.setenv("AUTH_REQUIRED", "true")
+        monkeypatch.setenv("COGNITO_ISSUER", issuer)
+        monkeypatch.setenv("COGNITO_CLIENT_ID", "client")
+        reload_settings()
+
+        token = jwt.encode(
+            {"sub": "42", "iss": issuer, "token_use": "access", "client_id": "client"},
+            key_a,
+            algorithm="RS256",
+            headers={"kid": "kid-a"},
+        )
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        assert auth.get_current_user(credentials).sub == "42"
+        assert auth.get_current_user(credentials).sub == "42"
+        assert hits == ["/pool/.well-known/jwks.json"]
+    finally:
+        server.shutdown()
@@ -1,6 +1,6 @@
 import pytest
 from types import SimpleNamespace
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from app.controllers.list_videos_controller import ListVideosController
 
@@ -73,3 +73,70 @@ def test_list_videos_controller_maps_video_fields():
     assert response_video.title == "Test Video"
     assert response_video.file_path == "/outputs/frames_20260208.zip"
     assert response_video.status == 1
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_list_videos_controller_list_user_videos_async():
+    video = SimpleNamespace(id=3, user_id=7, title="Async", file_path="/path/video3.mp4", status=0)
+    mock_video_dao = Mock()
+    mock_video_dao.list_videos_by_user = AsyncMock(return_value=[video])
+
+    controller = ListVideosController(video_dao=mock_video_dao)
+
+    response = await controller.list_user_videos_async(user_id=7)
+
+    assert response.status == "success"
+    assert response.data[0].id == 3
+    mock_video_dao.list_videos_by_user.assert_awaited_once_with(7)
+
+
+def test_list_videos_controller_returns_next_cursor_when_more_pages():
+    videos = [
+        SimpleNamespace(id=video_id, user_id=1, title=f"Video {video_id}", file_path="/p", status=0)
+        for video_id in (9, 8, 7)
+    ]
+    mock_video_dao = Mock()
+    mock_video_dao.list_videos_by_user.return_value = videos
+
+    controller = ListVideosController(video_dao=mock_video_dao)
+
+    response = controller.list_user_videos(user_id=1, limit=2, after_id=10)
+
+    mock_video_dao.list_videos_by_user.assert_called_once_with(1, limit=3, after_id=10)
+    assert [video.id for video in response.data] == [9, 8]
+    assert response.next_cursor == 8
+
+
+def test_list_videos_controller_last_page_has_no_cursor():
+    mock_video_dao = Mock()
+    mock_video_dao.list_videos_by_user.return_value = [
+        SimpleNamespace(id=1, user_id=1, title="Video 1", file_path="/p", status=0)
+    ]
+
+    controller = ListVideosController(video_dao=mock_video_dao)
+
+    response = controller.list_user_videos(user_id=1, limit=2)
+
+    assert len(response.data) == 1
+    assert response.next_cursor is None
+
+
+def test_build_etag_depends_on_every_field_of_the_page():
+    def page(**changes):
+        video = {"id": 9, "user_id": 1, "title": "Video", "file_path": "/uploads/v.mp4", "status": 0, **changes}
+        return [SimpleNamespace(**video)]
+
+    etag = ListVideosController.build_etag(1, page(), 50, None)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == ListVideosController.build_etag(1, page(), 50, None)
+    assert etag != ListVideosController.build_etag(1, page(status=1), 50, None)
+    assert etag != ListVideosController.build_etag(1, page(file_path="/outputs/v.zip"), 50, None)
+    assert etag != ListVideosController.build_etag(1, page(title="Outro"), 50, None)
+    assert etag != ListVideosController.build_etag(1, page(), 50, 5)
+    assert etag != ListVideosController.build_etag(2, page(), 50, None)
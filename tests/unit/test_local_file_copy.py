@@ -0,0 +1,106 @@
+import errno
+import hashlib
+import io
+import os
+import tempfile
+
+import pytest
+
+import app.gateways.local_file_copy as local_file_copy
+from app.gateways.local_file_copy import copy_into, disk_fileno, kernel_copy
+from app.gateways.upload_sinks import LocalUploadSink
+
+CONTENT = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00" + os.urandom(3 * 1024 * 1024)
+
+
+def _rolled_spool(content=CONTENT):
+    spool = tempfile.SpooledTemporaryFile(max_size=1024)
+    spool.write(content)
+    spool.seek(0)
+    return spool
+
+
+def test_disk_fileno_ignores_in_memory_sources():
+    in_memory = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    in_memory.write(b"abc")
+
+    assert disk_fileno(io.BytesIO(b"abc")) is None
+    assert disk_fileno(in_memory) is None
+    assert not in_memory._rolled
+    assert disk_fileno(_rolled_spool()) is not None
+
+
+def test_copy_into_uses_kernel_copy_for_spooled_file_on_disk(tmp_path, monkeypatch):
+    calls = []
+
+    def recording_sendfile(*args):
+        calls.append(args)
+        return local_file_copy._sendfile(*args)
+
+    monkeypatch.setattr(local_file_copy, "_KERNEL_COPIES", [recording_sendfile])
+    dest = tmp_path / "video.mp4"
+
+    content_hash = copy_into(_rolled_spool(), dest, with_hash=True)
+
+    assert dest.read_bytes() == CONTENT
+    assert content_hash == hashlib.sha256(CONTENT).hexdigest()
+    assert len(calls) == 1
+    assert list(tmp_path.iterdir()) == [dest]
+
+
+def test_copy_into_starts_at_current_position_and_skips_hash_when_not_requested(tmp_path):
+    spool = _rolled_spool()
+    spool.read(16)
+    dest = tmp_path / "video.mp4"
+
+    assert copy_into(spool, dest, with_hash=False) is None
+    assert dest.read_bytes() == CONTENT[16:]
+
+
+def test_copy_into_streams_in_memory_sources(tmp_path):
+    dest = tmp_path / "video.mp4"
+
+    content_hash = copy_into(io.BytesIO(b"small"), dest, with_hash=True)
+
+    assert dest.read_bytes() == b"small"
+    assert content_hash == hashlib.sha256(b"small").hexdigest()
+
+
+def test_kernel_copy_falls_back_when_copy_is_not_supported(tmp_path, monkeypatch):
+    def unsupported(*_args):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(local_file_copy, "_KERNEL_COPIES", [unsupported])
+    source = tmp_path / "source.bin"
+    source.write_bytes(CONTENT)
+    dest = tmp_path / "dest.bin"
+
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        kernel_copy(src.fileno(), dst.fileno(), 4, len(CONTENT) - 4)
+
+    assert dest.read_bytes() == CONTENT[4:]
+
+
+def test_copy_into_leaves_nothing_behind_on_failure(tmp_path, monkeypatch):
+    def broken(*_args):
+        raise OSError(errno.EIO, "disk error")
+
+    monkeypatch.setattr(local_file_copy, "_KERNEL_COPIES", [broken])
+    dest = tmp_path / "video.mp4"
+
+    with pytest.raises(OSError):
+        copy_into(_rolled_spool(), dest, with_hash=False)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_local_sink_exposes_file_only_after_close(tmp_path):
+    dest = tmp_path / "video.mp4"
+    sink = LocalUploadSink(dest)
+    sink.write(b"partial")
+
+    assert not dest.exists()
+
+    assert sink.close() == dest
+    assert dest.read_bytes() == b"partial"
+    assert list(tmp_path.iterdir()) == [dest]
@@ -0,0 +1,167 @@
+import io
+import json
+import logging
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+import app.infrastructure.observability.logging_config as logging_config
+from app.infrastructure.config.settings import load_settings
+from app.infrastructure.observability.logging_config import (
+    BoundedQueueHandler,
+    JsonFormatter,
+    configure_logging,
+    log_pipeline_stats,
+    shutdown_logging,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def stdout():
+    stream = io.StringIO()
+    root = logging.getLogger()
+    original_level = root.level
+    touched = ["sqlalchemy.engine", "sqlalchemy.pool", "botocore", "app.gateways"]
+    original_levels = {name: logging.getLogger(name).level for name in touched}
+    yield stream
+    shutdown_logging()
+    root.setLevel(original_level)
+    for name, level in original_levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+def _lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_settings_parse_levels_and_ignore_invalid_entries():
+    settings = load_settings({
+        "LOG_LEVEL": "debug",
+        "LOG_LEVELS": "botocore=warning, app.gateways=DEBUG,broken,x=LOUD",
+        "LOG_FORMAT": "TEXT",
+    }).logging
+
+    assert settings.level == "DEBUG"
+    assert settings.format == "text"
+    assert dict(settings.logger_levels) == {"botocore": "WARNING", "app.gateways": "DEBUG"}
+    assert settings.sql_echo is False
+    assert load_settings({"LOG_LEVEL": "verbose"}).logging.level == "INFO"
+
+
+def test_json_output_with_extra_fields_and_exception(stdout):
+    configure_logging(load_settings({"LOG_ASYNC": "false"}), stdout)
+    logger = logging.getLogger("app.test")
+
+    logger.info("Vídeo %s criado", 7, extra={"user_id": 3})
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Falhou")
+
+    first, second = _lines(stdout)
+    assert first["message"] == "Vídeo 7 criado"
+    assert (first["level"], first["logger"], first["user_id"]) == ("INFO", "app.test", 3)
+    assert "ValueError: boom" in second["exc_info"]
+
+
+def test_async_handler_writes_from_listener_thread(stdout):
+    configure_logging(load_settings({}), stdout)
+    threads = []
+    original_format = JsonFormatter.format
+
+    def recording_format(self, record):
+        threads.append(threading.current_thread())
+        return original_format(self, record)
+
+    JsonFormatter.format = recording_format
+    try:
+        logging.getLogger("app.test").warning("Fila %d", 1)
+        shutdown_logging()
+    finally:
+        JsonFormatter.format = original_format
+
+    assert _lines(stdout)[0]["message"] == "Fila 1"
+    assert threads and threads[0] is not threading.current_thread()
+
+
+def test_queue_handler_resolves_args_before_enqueue():
+    handler = BoundedQueueHandler(queue.Queue())
+    payload = [1]
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, "payload=%s", (payload,), None)
+
+    prepared = handler.prepare(record)
+    payload.append(2)
+
+    assert (prepared.getMessage(), prepared.args) == ("payload=[1]", None)
+    assert record.args == (payload,)
+
+
+def test_full_queue_drops_and_counts_without_blocking():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2))
+    logger = logging.getLogger("app.test.bounded")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        for n in range(5):
+            logger.warning("registro %d", n)
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_dropped_records_are_reported_on_shutdown(stdout):
+    configure_logging(load_settings({"LOG_QUEUE_SIZE": "1"}), stdout)
+    blocker = threading.Event()
+    writes = []
+    stream_handler = logging_config._listener.handlers[0]
+    original_emit = stream_handler.emit
+
+    def slow_emit(record):
+        blocker.wait(timeout=5)
+        writes.append(record)
+        original_emit(record)
+
+    stream_handler.emit = slow_emit
+    logger = logging.getLogger("app.test")
+    for n in range(10):
+        logger.warning("registro %d", n)
+
+    stats = log_pipeline_stats()
+    blocker.set()
+    shutdown_logging()
+
+    assert stats["async"] is True and stats["queue_size"] == 1
+    assert stats["dropped"] >= 8
+    assert _lines(stdout)[-1]["message"] == f"{stats['dropped']} registros de log descartados com a fila cheia"
+    assert log_pipeline_stats()["async"] is False
+
+
+def test_sql_echo_is_opt_in_and_per_logger_levels_apply(stdout):
+    configure_logging(load_settings({"LOG_LEVELS": "botocore=ERROR"}), stdout)
+
+    assert logging.getLogger("sqlalchemy.engine").level == logging.WARNING
+    assert logging.getLogger("botocore").level == logging.ERROR
+
+    configure_logging(load_settings({"LOG_SQL_ECHO": "true"}), stdout)
+
+    assert logging.getLogger("sqlalchemy.engine").level == logging.INFO
+    assert len([h for h in logging.getLogger().handlers if isinstance(h, BoundedQueueHandler)]) == 1
+
+
+def test_importing_video_dao_does_not_touch_logging():
+    code = (
+        "import logging, app.dao.video_dao; "
+        "print(logging.getLogger('sqlalchemy.engine').level, len(logging.getLogger().handlers))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT)
+
+    assert result.stdout.splitlines()[-1] == "0 0"
@@ -9,6 +9,7 @@ def test_main_includes_routers():
     assert "/health/" in paths
     assert "/health/db" in paths
     assert "/upload/video" in paths
+    assert "/internal/videos/status" in paths
 
 
 def test_health_check_returns_ok():
@@ -21,3 +22,82 @@ def test_health_db_check_returns_connected():
     from app.api.check import health_db_check
 
     assert health_db_check(db=Mock()) == {"status": "connected"}
+
+
+def test_health_token_cache_reports_stats():
+    from app.api.check import health_token_cache
+
+    result = health_token_cache()
+
+    assert result["status"] == "ok"
+    assert {"hits", "misses", "hit_rate", "size"} <= set(result["token_cache"])
+
+
+def test_health_executor_reports_gauges():
+    from app.api.check import health_executor
+
+    result = health_executor()
+
+    assert result["status"] == "ok"
+    assert {"active", "queued", "rejected", "max_workers", "max_queue"} <= set(result["upload_executor"])
+
+
+def test_health_db_pool_reports_pool_status():
+    from app.api.check import health_db_pool
+
+    result = health_db_pool()
+
+    assert result["status"] == "ok"
+    assert {"checkouts", "timeouts", "wait_ms_avg", "wait_ms_p95", "wait_ms_max"} <= set(result["pool"]["checkout"])
+
+
+def test_health_cache_reports_video_list_cache_stats():
+    from app.api.check import health_cache
+
+    result = health_cache()
+
+    assert result["status"] == "ok"
+    assert {"hits", "misses", "hit_rate", "size", "backend"} <= set(result["video_list_cache"])
+
+
+def test_health_events_reports_hub_stats():
+    from app.api.check import health_events
+
+    result = health_events()
+
+    assert result["status"] == "ok"
+    assert {"subscribers", "published", "delivered"} <= set(result["status_hub"])
+
+
+def test_health_outbox_reports_disabled_without_building_relay(monkeypatch):
+    import app.api.check as check_module
+
+    def fail():
+        raise AssertionError("não deveria montar o relay")
+
+    monkeypatch.setattr(check_module, "get_outbox_relay", fail)
+
+    assert check_module.health_outbox() == {"status": "disabled"}
+
+
+def test_health_outbox_reports_lag(monkeypatch):
+    from app.api.check import health_outbox
+    from app.infrastructure.config.settings import reload_settings
+    from app.infrastructure.db.database import init_schema
+
+    monkeypatch.setenv("OUTBOX_ENABLED", "true")
+    reload_settings()
+    init_schema()
+    result = health_outbox()
+
+    assert result["status"] == "ok"
+    assert {"pending", "retrying", "dead_lettered", "oldest_pending_age_seconds", "running"} <= set(result["outbox"])
+
+
+def test_health_logging_reports_pipeline_stats():
+    from app.api.check import health_logging
+
+    result = health_logging()
+
+    assert result["status"] == "ok"
+    assert {"async", "queued", "queue_size", "dropped"} <= set(result["logging"])
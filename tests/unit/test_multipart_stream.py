@@ -0,0 +1,218 @@
+import pytest
+from fastapi import HTTPException
+
+from app.adapters.utils.video_signature import VideoSignatureValidator
+from app.infrastructure.api.multipart_stream import MultipartUploadStream
+
+
+BOUNDARY = "test-boundary"
+MP4_HEAD = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00"
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _build_body(fields: dict, file_bytes: bytes = None, filename: str = "video.mp4", file_first: bool = False) -> bytes:
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"{name}\"\r\n\r\n{value}\r\n".encode()
+        )
+
+    if file_bytes is not None:
+        file_part = (
+            f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"{filename}\"\r\n"
+            f"Content-Type: video/mp4\r\n\r\n"
+        ).encode() + file_bytes + b"\r\n"
+        if file_first:
+            parts.insert(0, file_part)
+        else:
+            parts.append(file_part)
+
+    return b"".join(parts) + f"--{BOUNDARY}--\r\n".encode()
+
+
+def _chunked(body: bytes, size: int = 7):
+    async def _gen():
+        for i in range(0, len(body), size):
+            yield body[i:i + size]
+
+    return _gen()
+
+
+class FakeSink:
+    def __init__(self, filename):
+        self.filename = filename
+        self.data = bytearray()
+        self.writes = 0
+        self.closed = False
+        self.aborted = False
+
+    def write(self, data):
+        self.writes += 1
+        self.data.extend(data)
+
+    def close(self):
+        self.closed = True
+        return f"/uploads/{self.filename}"
+
+    def abort(self):
+        self.aborted = True
+
+
+def _stream(body: bytes, sinks: list, max_size_bytes: int = 1024, **kwargs):
+    def open_sink(filename):
+        sink = FakeSink(filename)
+        sinks.append(sink)
+        return sink
+
+    return MultipartUploadStream(
+        headers={"content-type": f"multipart/form-data; boundary={BOUNDARY}"},
+        stream=_chunked(body),
+        open_sink=open_sink,
+        max_size_bytes=max_size_bytes,
+        **kwargs,
+    )
+
+
+@pytest.mark.anyio
+async def test_parse_streams_file_to_sink_and_collects_fields():
+    sinks = []
+    payload = b"\x00\x01video-bytes" * 20
+    body = _build_body({"user_id": "10", "title": "Meu vídeo"}, payload)
+    seen = {}
+
+    def on_file_start(filename, content_type, fields):
+        seen.update(filename=filename, content_type=content_type, fields=fields)
+
+    result = await _stream(body, sinks, on_file_start=on_file_start, write_chunk_bytes=32).parse()
+
+    assert result.fields == {"user_id": "10", "title": "Meu vídeo"}
+    assert result.filename == "video.mp4"
+    assert result.content_type == "video/mp4"
+    assert result.size == len(payload)
+    assert result.saved_path == "/uploads/video.mp4"
+    assert bytes(sinks[0].data) == payload
+    assert sinks[0].writes > 1
+    assert sinks[0].closed is True
+    assert seen["fields"] == {"user_id": "10", "title": "Meu vídeo"}
+
+
+@pytest.mark.anyio
+async def test_parse_aborts_sink_when_size_limit_exceeded():
+    sinks = []
+    body = _build_body({"user_id": "1", "title": "x"}, b"a" * 2048)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _stream(body, sinks, max_size_bytes=1024).parse()
+
+    assert exc_info.value.status_code == 413
+    assert sinks[0].aborted is True
+    assert sinks[0].closed is False
+
+
+@pytest.mark.anyio
+async def test_parse_rejection_in_on_file_start_never_opens_sink():
+    sinks = []
+    body = _build_body({"user_id": "1"}, b"abc")
+
+    def reject(*_args):
+        raise HTTPException(status_code=400, detail="Formato de arquivo não suportado")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _stream(body, sinks, on_file_start=reject).parse()
+
+    assert exc_info.value.status_code == 400
+    assert sinks == []
+
+
+@pytest.mark.anyio
+async def test_parse_without_file_returns_no_saved_path():
+    result = await _stream(_build_body({"user_id": "1", "title": "x"}), []).parse()
+
+    assert result.saved_path is None
+    assert result.fields["title"] == "x"
+
+
+@pytest.mark.anyio
+async def test_parse_requires_boundary():
+    stream = MultipartUploadStream(
+        headers={"content-type": "multipart/form-data"},
+        stream=_chunked(b""),
+        open_sink=FakeSink,
+        max_size_bytes=1024,
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await stream.parse()
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_parse_aborts_sink_on_truncated_body():
+    sinks = []
+    body = _build_body({"user_id": "1", "title": "x"}, b"a" * 100)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _stream(body[:-40], sinks).parse()
+
+    assert exc_info.value.status_code == 400
+    assert sinks[0].aborted is True
+
+
+@pytest.mark.anyio
+async def test_parse_with_validator_opens_sink_after_head_is_accepted():
+    sinks = []
+    payload = MP4_HEAD + b"\x00" * 200
+    body = _build_body({"user_id": "1", "title": "x"}, payload)
+
+    result = await _stream(body, sinks, open_validator=VideoSignatureValidator, write_chunk_bytes=32).parse()
+
+    assert result.saved_path == "/uploads/video.mp4"
+    assert bytes(sinks[0].data) == payload
+
+
+@pytest.mark.anyio
+async def test_parse_with_validator_rejects_junk_before_opening_sink():
+    sinks = []
+    body = _build_body({"user_id": "1", "title": "x"}, b"<html>not a video</html>" * 50)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _stream(body, sinks, max_size_bytes=4096, open_validator=VideoSignatureValidator).parse()
+
+    assert exc_info.value.status_code == 400
+    assert sinks == []
+
+
+@pytest.mark.anyio
+async def test_parse_with_validator_checks_files_shorter_than_the_head():
+    sinks = []
+    body = _build_body({"user_id": "1", "title": "x"}, b"FLV\x01")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _stream(body, sinks, open_validator=VideoSignatureValidator).parse()
+
+    # FLV reconhecido, mas a extensão é .mp4.
+    assert exc_info.value.status_code == 400
+    assert "flv" in exc_info.value.detail
+    assert sinks == []
+
+
+@pytest.mark.anyio
+async def test_parse_discards_closed_file_when_body_fails_afterwards():
+    sinks = []
+    discarded = []
+    body = _build_body({"user_id": "1", "title": "x"}, b"a" * 100)
+    second_file = _build_body({}, b"b" * 100, filename="other.mp4")
+    body = body[:-len(f"--{BOUNDARY}--\r\n")] + second_file
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _stream(body, sinks, discard_saved=discarded.append).parse()
+
+    assert exc_info.value.status_code == 400
+    assert sinks[0].closed is True
+    assert len(sinks) == 1
+    assert discarded == ["/uploads/video.mp4"]
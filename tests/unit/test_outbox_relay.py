@@ -0,0 +1,272 @@
+import json
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import boto3
+import pytest
+from moto import mock_aws
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.dao.outbox_dao import OutboxDAO
+from app.dao.video_dao import VideoDAO
+from app.gateways.outbox_relay import OutboxRelay
+from app.infrastructure.config.settings import load_settings
+from app.infrastructure.db.database import Base
+from app.models.outbox import OutboxMessage, utcnow
+from app.models.video import Video
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}")
+    Base.metadata.create_all(bind=engine, tables=[Video.__table__, OutboxMessage.__table__])
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+
+
+class StubSQSClient:
+    def __init__(self, fail_ids=(), raise_error=False):
+        self.calls = []
+        self.fail_ids = set(fail_ids)
+        self.raise_error = raise_error
+
+    def send_message_batch(self, QueueUrl, Entries):
+        self.calls.append(Entries)
+        if self.raise_error:
+            raise ConnectionError("sqs indisponível")
+
+        successful, failed = [], []
+        for entry in Entries:
+            if json.loads(entry["MessageBody"])["video_id"] in self.fail_ids:
+                failed.append({"Id": entry["Id"], "Code": "InternalError", "Message": "boom", "SenderFault": False})
+            else:
+                successful.append({"Id": entry["Id"], "MessageId": "m-" + entry["Id"]})
+        return {"Successful": successful, "Failed": failed}
+
+
+def _create_videos(session_factory, count):
+    with session_factory() as session:
+        dao = VideoDAO(session)
+        return [
+            dao.create_video(
+                SimpleNamespace(user_id=1, title=f"Video {n}", file_path=f"/uploads/{n}.mp4", status=0),
+                outbox_event=lambda created: {"video_id": created.id, "user_id": created.user_id},
+            ).id
+            for n in range(count)
+        ]
+
+
+def test_create_video_writes_outbox_row_in_same_transaction(session_factory):
+    video_ids = _create_videos(session_factory, 2)
+
+    with session_factory() as session:
+        messages = session.query(OutboxMessage).order_by(OutboxMessage.id).all()
+
+    assert [message.aggregate_id for message in messages] == video_ids
+    assert json.loads(messages[0].payload) == {"video_id": video_ids[0], "user_id": 1}
+    assert len({message.dedup_id for message in messages}) == 2
+
+
+def test_create_video_rolls_back_outbox_with_video(session_factory):
+    def broken_event(_created):
+        raise RuntimeError("payload inválido")
+
+    with session_factory() as session:
+        with pytest.raises(RuntimeError):
+            VideoDAO(session).create_video(
+                SimpleNamespace(user_id=1, title="x", file_path="/x.mp4", status=0), outbox_event=broken_event
+            )
+        session.rollback()
+
+    with session_factory() as session:
+        assert session.query(Video).count() == 0
+        assert session.query(OutboxMessage).count() == 0
+
+
+def test_run_once_sends_batches_and_marks_rows_sent(session_factory):
+    _create_videos(session_factory, 12)
+    client = StubSQSClient()
+    relay = OutboxRelay(session_factory=session_factory, client=client, queue_url="https://sqs/queue", batch_size=50)
+
+    assert relay.run_once() == 12
+    assert [len(call) for call in client.calls] == [10, 2]
+    assert "dedup_id" in client.calls[0][0]["MessageAttributes"]
+    assert relay.run_once() == 0
+
+    stats = relay.stats()
+    assert stats["pending"] == 0
+    assert stats["sent"] == 12
+
+
+def test_failed_entries_stay_pending_with_backoff(session_factory):
+    video_ids = _create_videos(session_factory, 3)
+    relay = OutboxRelay(
+        session_factory=session_factory,
+        client=StubSQSClient(fail_ids={video_ids[1]}),
+        queue_url="https://sqs/queue",
+    )
+
+    assert relay.run_once() == 2
+
+    with session_factory() as session:
+        failed = session.query(OutboxMessage).filter(OutboxMessage.sent_at.is_(None)).one()
+        assert failed.aggregate_id == video_ids[1]
+        assert failed.attempts == 1
+        assert failed.available_at > utcnow()
+
+    # Ainda em backoff: não é reenviada imediatamente.
+    assert relay.run_once() == 0
+
+    stats = relay.stats()
+    assert stats["pending"] == 1
+    assert stats["retrying"] == 1
+    assert stats["oldest_pending_age_seconds"] >= 0
+
+
+def test_message_is_dead_lettered_after_max_attempts(session_factory, caplog):
+    video_ids = _create_videos(session_factory, 2)
+    relay = OutboxRelay(
+        session_factory=session_factory,
+        client=StubSQSClient(fail_ids={video_ids[0]}),
+        queue_url="https://sqs/queue",
+        max_attempts=2,
+    )
+
+    assert relay.run_once() == 1
+    with session_factory() as session:
+        session.query(OutboxMessage).update({"available_at": utcnow()})
+        session.commit()
+
+    with caplog.at_level("ERROR", logger="app.gateways.outbox_relay"):
+        assert relay.run_once() == 0
+
+    with session_factory() as session:
+        failed = session.query(OutboxMessage).filter(OutboxMessage.aggregate_id == video_ids[0]).one()
+        assert failed.attempts == 2
+        assert failed.failed_at is not None
+        assert failed.sent_at is None
+
+    # Fora da fila: não volta a ser reivindicada.
+    assert relay.run_once() == 0
+    assert "descartada após 2 tentativas" in caplog.text
+
+    stats = relay.stats()
+    assert stats["pending"] == 0
+    assert stats["dead_lettered"] == 1
+    assert stats["dead_lettered_by_relay"] == 1
+
+
+def test_api_error_keeps_whole_batch_pending(session_factory):
+    _create_videos(session_factory, 2)
+    relay = OutboxRelay(session_factory=session_factory, client=StubSQSClient(raise_error=True), queue_url="q")
+
+    assert relay.run_once() == 0
+
+    with session_factory() as session:
+        assert OutboxDAO(session).stats()["pending"] == 2
+
+
+def test_fifo_queue_uses_message_deduplication_id(session_factory):
+    _create_videos(session_factory, 1)
+    client = StubSQSClient()
+    relay = OutboxRelay(session_factory=session_factory, client=client, queue_url="https://sqs/queue.fifo")
+
+    relay.run_once()
+
+    entry = client.calls[0][0]
+    assert entry["MessageGroupId"] == "1"
+    assert len(entry["MessageDeduplicationId"]) == 32
+
+
+def test_relay_drains_to_moto_sqs(session_factory):
+    video_ids = _create_videos(session_factory, 3)
+
+    with mock_aws():
+        client = boto3.client("sqs", region_name="us-east-1")
+        queue_url = client.create_queue(QueueName="video-processing")["QueueUrl"]
+
+        relay = OutboxRelay(session_factory=session_factory, client=client, queue_url=queue_url)
+        relay.run_once()
+
+        messages = client.receive_message(
+            QueueUrl=queue_url, MaxNumberOfMessages=10, MessageAttributeNames=["All"]
+        )["Messages"]
+
+    assert sorted(json.loads(message["Body"])["video_id"] for message in messages) == video_ids
+    assert all("dedup_id" in message["MessageAttributes"] for message in messages)
+
+
+def test_background_thread_drains_on_wake(session_factory):
+    client = StubSQSClient()
+    relay = OutboxRelay(session_factory=session_factory, client=client, queue_url="q", poll_interval_seconds=30)
+
+    relay.start()
+    try:
+        _create_videos(session_factory, 1)
+        relay.wake()
+
+        for _ in range(200):
+            if relay.sent:
+                break
+            time.sleep(0.01)
+    finally:
+        relay.stop(5)
+
+    assert relay.sent == 1
+
+
+def test_claim_is_committed_with_a_lease_before_sending(session_factory):
+    _create_videos(session_factory, 2)
+    seen_during_send = []
+
+    class InspectingClient(StubSQSClient):
+        def send_message_batch(self, QueueUrl, Entries):
+            # Outra sessão (outra réplica) enxerga o lease e não reivindica as mesmas linhas.
+            with session_factory() as other:
+                leased = [row.available_at > utcnow() for row in other.query(OutboxMessage)]
+                seen_during_send.append((OutboxDAO(other).claim_batch(10), leased))
+            return super().send_message_batch(QueueUrl, Entries)
+
+    relay = OutboxRelay(session_factory=session_factory, client=InspectingClient(), queue_url="q")
+
+    assert relay.run_once() == 2
+    assert seen_during_send == [([], [True, True])]
+
+
+def test_rows_of_a_relay_that_died_mid_send_return_after_the_lease(session_factory):
+    _create_videos(session_factory, 1)
+    with session_factory() as session:
+        assert len(OutboxDAO(session).claim_batch(10)) == 1
+        assert OutboxDAO(session).claim_batch(10) == []
+        session.query(OutboxMessage).update({"available_at": utcnow() - timedelta(seconds=1)})
+        session.commit()
+
+    relay = OutboxRelay(session_factory=session_factory, client=StubSQSClient(), queue_url="q")
+    assert relay.run_once() == 1
+
+
+def test_sent_rows_are_purged_after_retention(session_factory):
+    _create_videos(session_factory, 3)
+    relay = OutboxRelay(session_factory=session_factory, client=StubSQSClient(), queue_url="q", retention_hours=24)
+    relay.run_once()
+    _create_videos(session_factory, 1)
+
+    with session_factory() as session:
+        old_id = session.query(OutboxMessage.id).order_by(OutboxMessage.id).first()[0]
+        session.query(OutboxMessage).filter(OutboxMessage.id == old_id).update(
+            {"sent_at": utcnow() - timedelta(hours=25)}
+        )
+        session.commit()
+
+    keep_all = OutboxRelay(session_factory=session_factory, client=StubSQSClient(), queue_url="q", retention_hours=0)
+    assert keep_all.purge_sent() == 0
+    assert relay.purge_sent() == 1
+
+    with session_factory() as session:
+        remaining = session.query(OutboxMessage).all()
+    assert len(remaining) == 3
+    assert sum(row.sent_at is None for row in remaining) == 1
+    assert relay.stats()["purged"] == 1
+    assert load_settings({"OUTBOX_RETENTION_HOURS": "6"}).queue.outbox_retention_hours == 6
@@ -0,0 +1,317 @@
+import json
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import boto3
+import pytest
+import requests
+from fastapi import HTTPException
+from moto import mock_aws
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.api.upload as upload_module
+from app.api.internal import expire_abandoned_uploads
+from app.adapters.schemas.upload_session import UploadSessionCreateSchema
+from app.dao.video_dao import VideoDAO
+from app.gateways.presigned_upload_gateway import VIDEO_ID_METADATA, PresignedUploadGateway
+from app.gateways.video_processing_gateway import VideoProcessingGateway
+from app.infrastructure.config.settings import reload_settings
+from app.infrastructure.db.database import Base
+from app.infrastructure.security.auth import AuthenticatedUser
+from app.models.outbox import OutboxMessage
+from app.models.upload_session import UploadSession
+from app.models.video import Video
+from app.use_cases.presigned_upload_use_case import (
+    AWAITING_UPLOAD_STATUS,
+    ERROR_STATUS,
+    EXPIRY_GRACE_SECONDS,
+    PresignedUploadStateError,
+    PresignedUploadUseCase,
+    UploadVerificationError,
+)
+from app.use_cases.upload_use_case import UploadUseCase
+
+MP4_HEAD = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00"
+PART_SIZE = 5 * 1024 * 1024
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'presigned.db'}")
+    Base.metadata.create_all(bind=engine, tables=[Video.__table__, OutboxMessage.__table__, UploadSession.__table__])
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="videos")
+        yield client
+
+
+def _use_case(db, s3_client):
+    gateway = PresignedUploadGateway(s3_client, "videos", expires_seconds=600, part_size=PART_SIZE)
+    upload_use_case = UploadUseCase(processing_gateway=Mock(), video_dao=VideoDAO(db), sqs_producer=Mock(), use_outbox=True)
+    return PresignedUploadUseCase(gateway, upload_use_case)
+
+
+def test_single_put_upload_is_verified_and_enqueued(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    body = MP4_HEAD + b"\x00" * 100
+
+    video, instructions = use_case.create(1, "Direto", "video.mp4", "video/mp4", len(body))
+    assert video.status == AWAITING_UPLOAD_STATUS
+    assert instructions["method"] == "PUT"
+
+    with pytest.raises(PresignedUploadStateError):
+        use_case.complete(video.id)
+
+    response = requests.put(instructions["url"], data=body, headers=instructions["headers"])
+    assert response.status_code == 200
+
+    completed = use_case.complete(video.id)
+
+    assert completed.status == 0
+    message = db.query(OutboxMessage).filter(OutboxMessage.aggregate_id == video.id).one()
+    assert json.loads(message.payload)["video_path"] == video.file_path
+    # Retry da conclusão não publica de novo.
+    assert use_case.complete(video.id).status == 0
+    assert db.query(OutboxMessage).count() == 1
+
+
+def test_multipart_upload_is_completed_from_listed_parts(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    body = MP4_HEAD + b"\x01" * (PART_SIZE + 1000)
+
+    video, instructions = use_case.create(1, "Grande", "video.mp4", "video/mp4", len(body))
+    assert instructions["method"] == "MULTIPART"
+    assert [part["size"] for part in instructions["parts"]] == [PART_SIZE, len(body) - PART_SIZE]
+
+    for part in instructions["parts"]:
+        start = (part["part_number"] - 1) * instructions["part_size"]
+        assert requests.put(part["url"], data=body[start:start + part["size"]]).status_code == 200
+
+    completed = use_case.complete(video.id, instructions["upload_id"])
+    key = use_case.gateway.key_from_url(video.file_path)
+
+    assert completed.status == 0
+    assert s3_client.head_object(Bucket="videos", Key=key)["ContentLength"] == len(body)
+
+
+def test_non_video_content_is_rejected_and_deleted(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    body = b"%PDF-1.7\n" + b"\x00" * 50
+
+    video, instructions = use_case.create(1, "Falso", "video.mp4", "video/mp4", len(body))
+    requests.put(instructions["url"], data=body, headers=instructions["headers"])
+
+    with pytest.raises(UploadVerificationError):
+        use_case.complete(video.id)
+
+    key = use_case.gateway.key_from_url(video.file_path)
+    assert use_case.gateway.head(key) is None
+    assert db.get(Video, video.id).status == ERROR_STATUS
+    assert db.query(OutboxMessage).count() == 0
+
+    with pytest.raises(PresignedUploadStateError):
+        use_case.complete(video.id)
+
+
+def test_object_without_signed_metadata_is_rejected(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    video, _ = use_case.create(1, "Trocado", "video.mp4", "video/mp4", 20)
+    s3_client.put_object(Bucket="videos", Key=use_case.gateway.key_from_url(video.file_path), Body=MP4_HEAD + b"\x00" * 4)
+
+    with pytest.raises(UploadVerificationError):
+        use_case.complete(video.id)
+
+    # Objeto sem a assinatura deste vídeo não é apagado: pode ser de outro upload.
+    assert use_case.gateway.head(use_case.gateway.key_from_url(video.file_path)) is not None
+    assert db.get(Video, video.id).status == ERROR_STATUS
+
+
+def test_same_file_in_the_same_second_gets_distinct_keys(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    use_case.upload_use_case.new_timestamp = lambda: "20260218_220000"
+
+    first, _ = use_case.create(1, "A", "video.mp4", "video/mp4", 20)
+    second, _ = use_case.create(2, "B", "video.mp4", "video/mp4", 20)
+
+    first_key = use_case.gateway.key_from_url(first.file_path)
+    second_key = use_case.gateway.key_from_url(second.file_path)
+    assert first_key != second_key
+    assert first_key.endswith("/video.mp4") and second_key.endswith("/video.mp4")
+
+
+def test_completion_uses_the_signed_timestamp(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    use_case.upload_use_case.new_timestamp = lambda: "20260218_220000"
+    body = MP4_HEAD + b"\x00" * 10
+
+    video, instructions = use_case.create(1, "Direto", "video.mp4", "video/mp4", len(body))
+    requests.put(instructions["url"], data=body, headers=instructions["headers"])
+    use_case.upload_use_case.new_timestamp = lambda: "20260218_230000"
+    use_case.complete(video.id)
+
+    message = db.query(OutboxMessage).filter(OutboxMessage.aggregate_id == video.id).one()
+    assert json.loads(message.payload)["timestamp"] == "20260218_220000"
+
+
+def test_expiry_sweep_aborts_multipart_and_marks_error(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    body = MP4_HEAD + b"\x01" * (PART_SIZE + 10)
+
+    abandoned, instructions = use_case.create(1, "Largado", "video.mp4", "video/mp4", len(body))
+    part = instructions["parts"][0]
+    requests.put(part["url"], data=body[:part["size"]])
+
+    later = datetime.now() + timedelta(seconds=600 + EXPIRY_GRACE_SECONDS + 5)
+    recent, _ = use_case.create(1, "Recente", "video.mp4", "video/mp4", 20)
+    use_case.upload_use_case.new_timestamp = lambda: later.strftime("%Y%m%d_%H%M%S")
+    fresh, _ = use_case.create(1, "Novo", "video.mp4", "video/mp4", 20)
+
+    assert use_case.expire_abandoned(now=datetime.now()) == 0
+    assert use_case.expire_abandoned(now=later) == 2
+
+    assert db.get(Video, abandoned.id).status == ERROR_STATUS
+    assert db.get(Video, recent.id).status == ERROR_STATUS
+    assert db.get(Video, fresh.id).status == AWAITING_UPLOAD_STATUS
+    assert s3_client.list_multipart_uploads(Bucket="videos").get("Uploads", []) == []
+
+
+def test_expiry_sweep_keeps_objects_signed_for_other_videos(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    video, _ = use_case.create(1, "Largado", "video.mp4", "video/mp4", 20)
+    key = use_case.gateway.key_from_url(video.file_path)
+    s3_client.put_object(Bucket="videos", Key=key, Body=MP4_HEAD, Metadata={VIDEO_ID_METADATA: str(video.id + 1)})
+
+    later = datetime.now() + timedelta(seconds=600 + EXPIRY_GRACE_SECONDS + 5)
+    assert use_case.expire_abandoned(now=later) == 1
+
+    assert use_case.gateway.head(key) is not None
+    assert db.get(Video, video.id).status == ERROR_STATUS
+
+
+def _serve_stale_reads(use_case, stale, reads):
+    original = use_case.get_video
+    pending = [stale] * reads
+    use_case.get_video = lambda video_id: pending.pop() if pending else original(video_id)
+
+
+def test_concurrent_complete_enqueues_a_single_job(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    body = MP4_HEAD + b"\x00" * 10
+
+    video, instructions = use_case.create(1, "Direto", "video.mp4", "video/mp4", len(body))
+    requests.put(instructions["url"], data=body, headers=instructions["headers"])
+    # As duas chamadas leem o vídeo ainda aguardando upload antes de qualquer uma concluir.
+    stale = use_case.get_video(video.id)
+    db.expunge(stale)
+    _serve_stale_reads(use_case, stale, reads=2)
+
+    first = use_case.complete(video.id)
+    second = use_case.complete(video.id)
+
+    assert first.status == second.status == 0
+    assert db.query(OutboxMessage).filter(OutboxMessage.aggregate_id == video.id).count() == 1
+
+
+def test_complete_after_expiry_is_rejected_without_enqueue(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    body = MP4_HEAD + b"\x00" * 10
+
+    video, instructions = use_case.create(1, "Atrasado", "video.mp4", "video/mp4", len(body))
+    requests.put(instructions["url"], data=body, headers=instructions["headers"])
+    stale = use_case.get_video(video.id)
+    db.expunge(stale)
+
+    later = datetime.now() + timedelta(seconds=600 + EXPIRY_GRACE_SECONDS + 5)
+    assert use_case.expire_abandoned(now=later) == 1
+
+    _serve_stale_reads(use_case, stale, reads=1)
+    with pytest.raises(PresignedUploadStateError):
+        use_case.complete(video.id)
+
+    assert db.get(Video, video.id).status == ERROR_STATUS
+    assert db.query(OutboxMessage).count() == 0
+
+
+def test_expiry_sweep_is_not_blocked_by_uploads_still_in_time(db, s3_client):
+    use_case = _use_case(db, s3_client)
+    later = datetime.now() + timedelta(seconds=600 + EXPIRY_GRACE_SECONDS + 5)
+
+    use_case.upload_use_case.new_timestamp = lambda: later.strftime("%Y%m%d_%H%M%S")
+    fresh = [use_case.create(1, f"Novo {n}", "video.mp4", "video/mp4", 20)[0] for n in range(3)]
+    use_case.upload_use_case.new_timestamp = lambda: datetime.now().strftime("%Y%m%d_%H%M%S")
+    old = [use_case.create(1, f"Velho {n}", "video.mp4", "video/mp4", 20)[0] for n in range(2)]
+
+    assert use_case.expire_abandoned(now=later, limit=2) == 2
+
+    assert all(db.get(Video, video.id).status == ERROR_STATUS for video in old)
+    assert all(db.get(Video, video.id).status == AWAITING_UPLOAD_STATUS for video in fresh)
+
+
+@pytest.mark.anyio
+async def test_presigned_routes_require_bucket_and_owner(monkeypatch, db, s3_client, tmp_path):
+    monkeypatch.delenv("AWS_S3_BUCKET", raising=False)
+    reload_settings()
+    deps = {
+        "db": db,
+        "processing_gateway": VideoProcessingGateway(base_dir=tmp_path, s3_client=s3_client),
+        "sqs_producer": Mock(),
+    }
+    payload = UploadSessionCreateSchema(user_id=1, title="x", filename="video.mp4", length=10)
+    owner = AuthenticatedUser(sub="1", claims={"user_id": "1"})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.create_presigned_upload(payload=payload, current_user=owner, **deps)
+    assert exc_info.value.status_code == 500
+
+    monkeypatch.setenv("AWS_S3_BUCKET", "videos")
+    monkeypatch.setenv("AUTH_REQUIRED", "true")
+    reload_settings()
+
+    created = await upload_module.create_presigned_upload(payload=payload, current_user=owner, **deps)
+    assert created.method == "PUT"
+    assert created.headers["x-amz-meta-video-id"] == str(created.video_id)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.complete_presigned_upload(
+            video_id=created.video_id,
+            payload=None,
+            current_user=AuthenticatedUser(sub="2", claims={"user_id": "2"}),
+            **deps,
+        )
+    assert exc_info.value.status_code == 403
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.complete_presigned_upload(video_id=created.video_id, payload=None, current_user=owner, **deps)
+    assert exc_info.value.status_code == 409
+
+
+def test_internal_expiry_route_skips_presigned_without_bucket(monkeypatch, db, s3_client, tmp_path):
+    deps = {
+        "db": db,
+        "processing_gateway": VideoProcessingGateway(base_dir=tmp_path, s3_client=s3_client),
+        "sqs_producer": Mock(),
+    }
+    monkeypatch.delenv("AWS_S3_BUCKET", raising=False)
+    reload_settings()
+
+    assert expire_abandoned_uploads(**deps).presigned == 0
+
+    monkeypatch.setenv("AWS_S3_BUCKET", "videos")
+    reload_settings()
+
+    response = expire_abandoned_uploads(**deps)
+    assert (response.status, response.presigned, response.resumable) == ("success", 0, 0)
@@ -0,0 +1,404 @@
+import hashlib
+import io
+import json
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import boto3
+import pytest
+from fastapi import HTTPException, Response
+from moto import mock_aws
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.api.upload as upload_module
+from app.adapters.schemas.upload_session import UploadSessionCreateSchema
+from app.dao.upload_session_dao import UploadSessionDAO
+from app.dao.video_dao import VideoDAO
+from app.gateways.resumable_storage import LocalResumableStorage, ResumableChunkError, S3ResumableStorage
+from app.gateways.video_processing_gateway import VideoProcessingGateway
+from app.infrastructure.api.chunk_body import spool_request_body
+from app.infrastructure.config.settings import reload_settings
+from app.infrastructure.db.database import Base
+from app.infrastructure.security.auth import AuthenticatedUser
+from app.models.content_object import ContentObject
+from app.models.outbox import OutboxMessage, utcnow
+from app.models.upload_session import UploadSession
+from app.models.video import Video
+from app.use_cases.resumable_upload_use_case import (
+    ResumableUploadUseCase,
+    UploadOffsetConflictError,
+    UploadSessionNotFoundError,
+    UploadSessionStateError,
+)
+from app.use_cases.upload_use_case import UploadUseCase
+
+MP4_HEAD = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00"
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'sessions.db'}")
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[Video.__table__, OutboxMessage.__table__, UploadSession.__table__, ContentObject.__table__],
+    )
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _use_case(db, storage, sqs_producer=None):
+    upload_use_case = UploadUseCase(
+        processing_gateway=Mock(), video_dao=VideoDAO(db), sqs_producer=sqs_producer or Mock(), use_outbox=True
+    )
+    return ResumableUploadUseCase(UploadSessionDAO(db), storage, upload_use_case, session_ttl_hours=1)
+
+
+def _create(use_case, length=10):
+    return use_case.create_session(1, "Longo", "video.mp4", "video/mp4", length)
+
+
+def test_local_session_resumes_and_finalizes_into_upload(db, tmp_path):
+    use_case = _use_case(db, LocalResumableStorage(tmp_path))
+    upload_session = _create(use_case)
+
+    assert use_case.append_chunk(upload_session.id, 0, io.BytesIO(b"01234"), 5).upload_offset == 5
+
+    with pytest.raises(UploadOffsetConflictError) as exc_info:
+        use_case.append_chunk(upload_session.id, 0, io.BytesIO(b"01234"), 5)
+    assert exc_info.value.current_offset == 5
+
+    with pytest.raises(UploadSessionStateError):
+        use_case.finalize(upload_session.id)
+
+    use_case.append_chunk(upload_session.id, 5, io.BytesIO(b"56789"), 5)
+    created = use_case.finalize(upload_session.id)
+
+    saved = tmp_path / f"{upload_session.timestamp}_{upload_session.id}_video.mp4"
+    assert saved.read_bytes() == b"0123456789"
+    assert not saved.with_name(saved.name + ".part").exists()
+    assert created.file_path == str(saved)
+    assert db.query(OutboxMessage).filter(OutboxMessage.aggregate_id == created.id).count() == 1
+
+    # Retry do finalize devolve o mesmo vídeo sem registrar de novo.
+    assert use_case.finalize(upload_session.id).id == created.id
+    assert db.query(Video).count() == 1
+
+
+def test_chunk_beyond_declared_length_is_rejected(db, tmp_path):
+    use_case = _use_case(db, LocalResumableStorage(tmp_path))
+    upload_session = _create(use_case, length=4)
+
+    with pytest.raises(UploadSessionStateError):
+        use_case.append_chunk(upload_session.id, 0, io.BytesIO(b"01234"), 5)
+
+
+def test_retry_after_failed_write_overwrites_stale_bytes(db, tmp_path):
+    storage = LocalResumableStorage(tmp_path)
+    use_case = _use_case(db, storage)
+    upload_session = _create(use_case, length=6)
+    use_case.append_chunk(upload_session.id, 0, io.BytesIO(b"abc"), 3)
+
+    # Bytes gravados por uma tentativa que caiu antes de avançar o offset.
+    staging = tmp_path / f"{upload_session.timestamp}_{upload_session.id}_video.mp4.part"
+    staging.write_bytes(b"abcXXXXXXX")
+
+    use_case.append_chunk(upload_session.id, 3, io.BytesIO(b"def"), 3)
+
+    assert staging.read_bytes() == b"abcdef"
+
+
+def test_concurrent_writer_holding_the_lock_gets_conflict(db, tmp_path):
+    use_case = _use_case(db, LocalResumableStorage(tmp_path))
+    upload_session = _create(use_case)
+    assert UploadSessionDAO(db).claim(upload_session.id, 0) is not None
+
+    with pytest.raises(UploadOffsetConflictError):
+        use_case.append_chunk(upload_session.id, 0, io.BytesIO(b"01234"), 5)
+
+
+def test_failed_write_releases_lock(db, tmp_path):
+    storage = Mock(wraps=LocalResumableStorage(tmp_path))
+    storage.write_chunk.side_effect = OSError("disco cheio")
+    use_case = _use_case(db, storage)
+    upload_session = _create(use_case)
+
+    with pytest.raises(OSError):
+        use_case.append_chunk(upload_session.id, 0, io.BytesIO(b"01234"), 5)
+
+    assert UploadSessionDAO(db).claim(upload_session.id, 0) is not None
+
+
+def test_abort_removes_staging_and_session(db, tmp_path):
+    use_case = _use_case(db, LocalResumableStorage(tmp_path))
+    upload_session = _create(use_case)
+    session_id = upload_session.id
+    use_case.append_chunk(session_id, 0, io.BytesIO(b"01"), 2)
+
+    use_case.abort(session_id)
+
+    assert list(tmp_path.glob("*.part")) == []
+    with pytest.raises(UploadSessionNotFoundError):
+        use_case.get_session(session_id)
+
+
+def test_sessions_for_the_same_file_in_the_same_second_do_not_share_staging(db, tmp_path):
+    use_case = _use_case(db, LocalResumableStorage(tmp_path))
+    use_case.upload_use_case.new_timestamp = lambda: "20260218_220000"
+    first, second = _create(use_case, length=3), _create(use_case, length=3)
+
+    use_case.append_chunk(first.id, 0, io.BytesIO(b"aaa"), 3)
+    use_case.append_chunk(second.id, 0, io.BytesIO(b"bbb"), 3)
+
+    assert first.storage_path != second.storage_path
+    assert open(use_case.finalize(first.id).file_path, "rb").read() == b"aaa"
+    assert open(use_case.finalize(second.id).file_path, "rb").read() == b"bbb"
+
+
+def test_finalize_retry_after_failed_registration_reuses_completed_file(db, tmp_path):
+    use_case = _use_case(db, LocalResumableStorage(tmp_path))
+    upload_session = _create(use_case, length=3)
+    use_case.append_chunk(upload_session.id, 0, io.BytesIO(b"abc"), 3)
+    register_upload = use_case.upload_use_case.register_upload
+    use_case.upload_use_case.register_upload = Mock(side_effect=RuntimeError("banco fora"))
+
+    with pytest.raises(RuntimeError):
+        use_case.finalize(upload_session.id)
+
+    use_case.upload_use_case.register_upload = register_upload
+    created = use_case.finalize(upload_session.id)
+
+    assert open(created.file_path, "rb").read() == b"abc"
+    assert db.query(Video).count() == 1
+
+
+def test_expire_sessions_aborts_unfinished_and_drops_completed(db, tmp_path):
+    use_case = _use_case(db, LocalResumableStorage(tmp_path))
+    abandoned, finished, active = _create(use_case, length=3), _create(use_case, length=3), _create(use_case)
+    use_case.append_chunk(abandoned.id, 0, io.BytesIO(b"ab"), 2)
+    staging = tmp_path / f"{abandoned.timestamp}_{abandoned.id}_video.mp4.part"
+    use_case.append_chunk(finished.id, 0, io.BytesIO(b"abc"), 3)
+    created = use_case.finalize(finished.id)
+    for upload_session in (abandoned, finished):
+        db.query(UploadSession).filter(UploadSession.id == upload_session.id).update(
+            {"expires_at": utcnow() - timedelta(minutes=1)}
+        )
+    db.commit()
+
+    assert use_case.expire_sessions() == 2
+
+    assert [row.id for row in db.query(UploadSession).all()] == [active.id]
+    assert not staging.exists()
+    assert open(created.file_path, "rb").read() == b"abc"
+
+
+def test_s3_session_uploads_each_chunk_as_a_part(db):
+    with mock_aws():
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="videos")
+        use_case = _use_case(db, S3ResumableStorage(s3_client, "videos", min_part_size=5 * 1024 * 1024))
+        first = b"a" * (5 * 1024 * 1024)
+        upload_session = _create(use_case, length=len(first) + 3)
+
+        with pytest.raises(ResumableChunkError):
+            use_case.append_chunk(upload_session.id, 0, io.BytesIO(b"abc"), 3)
+
+        use_case.append_chunk(upload_session.id, 0, io.BytesIO(first), len(first))
+        use_case.append_chunk(upload_session.id, len(first), io.BytesIO(b"end"), 3)
+        assert [part["PartNumber"] for part in json.loads(use_case.get_session(upload_session.id).parts)] == [1, 2]
+
+        created = use_case.finalize(upload_session.id)
+        body = s3_client.get_object(Bucket="videos", Key=upload_session.storage_path)["Body"].read()
+
+    assert created.file_path == f"s3://videos/{upload_session.storage_path}"
+    assert body == first + b"end"
+
+
+def test_s3_finalize_retry_after_completed_multipart_and_expiry_of_aborted_upload(db):
+    with mock_aws():
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="videos")
+        storage = S3ResumableStorage(s3_client, "videos")
+        use_case = _use_case(db, storage)
+        upload_session = _create(use_case, length=3)
+        use_case.append_chunk(upload_session.id, 0, io.BytesIO(b"abc"), 3)
+
+        # Multipart concluído numa tentativa anterior que falhou ao registrar o vídeo.
+        storage.complete(use_case.get_session(upload_session.id))
+        created = use_case.finalize(upload_session.id)
+
+        abandoned = _create(use_case, length=3)
+        storage.abort(abandoned)
+        db.query(UploadSession).filter(UploadSession.id == abandoned.id).update(
+            {"expires_at": utcnow() - timedelta(minutes=1)}
+        )
+        db.commit()
+        expired = use_case.expire_sessions()
+
+    assert created.file_path == f"s3://videos/{upload_session.storage_path}"
+    assert f"/{upload_session.id}/" in upload_session.storage_path
+    assert expired == 1
+
+
+class FakeChunkRequest:
+    def __init__(self, body: bytes, content_type: str = "application/offset+octet-stream"):
+        self.headers = {"content-type": content_type, "content-length": str(len(body))}
+        self._body = body
+
+    async def stream(self):
+        for i in range(0, len(self._body), 4):
+            yield self._body[i:i + 4]
+
+
+@pytest.mark.anyio
+async def test_session_routes_create_patch_head_and_finalize(monkeypatch, db, tmp_path):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    monkeypatch.setenv("UPLOAD_DEDUP_ENABLED", "true")
+    reload_settings()
+    gateway = VideoProcessingGateway(base_dir=tmp_path)
+    user = AuthenticatedUser(sub="1", claims={"user_id": "1"})
+    deps = {"db": db, "processing_gateway": gateway, "sqs_producer": Mock(), "current_user": user}
+
+    response = Response()
+    created = await upload_module.create_upload_session(
+        payload=UploadSessionCreateSchema(user_id=1, title="Longo", filename="video.mp4", length=len(MP4_HEAD) + 4),
+        response=response,
+        **deps,
+    )
+    assert response.headers["Location"] == f"/upload/sessions/{created.id}"
+    assert response.headers["Upload-Offset"] == "0"
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.append_upload_chunk(
+            request=FakeChunkRequest(b"%PDF-1.7\n" + b"\x00" * 7), session_id=created.id, upload_offset=0, **deps
+        )
+    assert exc_info.value.status_code == 400
+
+    patched = await upload_module.append_upload_chunk(
+        request=FakeChunkRequest(MP4_HEAD), session_id=created.id, upload_offset=0, **deps
+    )
+    assert patched.status_code == 204
+    assert patched.headers["Upload-Offset"] == "16"
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.append_upload_chunk(
+            request=FakeChunkRequest(MP4_HEAD), session_id=created.id, upload_offset=0, **deps
+        )
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.headers["Upload-Offset"] == "16"
+
+    head = await upload_module.get_upload_session_offset(session_id=created.id, **deps)
+    assert head.headers["Upload-Offset"] == "16"
+    assert head.headers["Upload-Length"] == "20"
+
+    await upload_module.append_upload_chunk(
+        request=FakeChunkRequest(b"4567"), session_id=created.id, upload_offset=16, **deps
+    )
+    video = await upload_module.finalize_upload_session(session_id=created.id, **deps)
+
+    assert video.data.user_id == 1
+    content_hash = hashlib.sha256(MP4_HEAD + b"4567").hexdigest()
+    saved = tmp_path / "uploads" / "objects" / "1" / content_hash[:2] / f"{content_hash}.mp4"
+    assert video.data.file_path == str(saved)
+    assert saved.read_bytes() == MP4_HEAD + b"4567"
+
+
+@pytest.mark.anyio
+async def test_session_routes_reject_other_user_and_bad_content_type(monkeypatch, db, tmp_path):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    monkeypatch.setenv("AUTH_REQUIRED", "true")
+    reload_settings()
+    gateway = VideoProcessingGateway(base_dir=tmp_path)
+    owner = AuthenticatedUser(sub="1", claims={"user_id": "1"})
+    deps = {"db": db, "processing_gateway": gateway, "sqs_producer": Mock()}
+
+    created = await upload_module.create_upload_session(
+        payload=UploadSessionCreateSchema(user_id=1, title="Longo", filename="video.mp4", length=8),
+        response=Response(),
+        current_user=owner,
+        **deps,
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.append_upload_chunk(
+            request=FakeChunkRequest(b"0123", content_type="video/mp4"),
+            session_id=created.id, upload_offset=0, current_user=owner, **deps
+        )
+    assert exc_info.value.status_code == 415
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.get_upload_session_offset(
+            session_id=created.id, current_user=AuthenticatedUser(sub="2", claims={"user_id": "2"}), **deps
+        )
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_create_session_rejects_length_above_resumable_limit(monkeypatch, db, tmp_path):
+    monkeypatch.setenv("RESUMABLE_MAX_UPLOAD_SIZE_MB", "1")
+    reload_settings()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.create_upload_session(
+            payload=UploadSessionCreateSchema(user_id=1, title="x", filename="video.mp4", length=2 * 1024 * 1024),
+            response=Response(),
+            db=db,
+            processing_gateway=VideoProcessingGateway(base_dir=tmp_path),
+            sqs_producer=Mock(),
+            current_user=AuthenticatedUser(sub="1", claims={"user_id": "1"}),
+        )
+
+    assert exc_info.value.status_code == 413
+
+
+@pytest.mark.anyio
+async def test_spool_request_body_enforces_limit():
+    async def stream():
+        yield b"0123"
+        yield b"4567"
+
+    with pytest.raises(HTTPException) as exc_info:
+        await spool_request_body(stream(), max_bytes=6)
+    assert exc_info.value.status_code == 413
+
+    spool, size = await spool_request_body(stream(), max_bytes=8, write_chunk_bytes=2)
+    assert size == 8
+    assert spool.read() == b"01234567"
+
+
+@pytest.mark.anyio
+async def test_session_offset_lookup_bypasses_saturated_upload_executor(monkeypatch, db, tmp_path):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    reload_settings()
+    gateway = VideoProcessingGateway(base_dir=tmp_path)
+    user = AuthenticatedUser(sub="1", claims={"user_id": "1"})
+    deps = {"db": db, "processing_gateway": gateway, "sqs_producer": Mock(), "current_user": user}
+
+    created = await upload_module.create_upload_session(
+        payload=UploadSessionCreateSchema(user_id=1, title="Longo", filename="video.mp4", length=len(MP4_HEAD)),
+        response=Response(),
+        **deps,
+    )
+
+    class SaturatedExecutor:
+        def run(self, *_args, **_kwargs):
+            raise upload_module.ExecutorSaturatedError("saturado")
+
+    monkeypatch.setattr(upload_module, "get_upload_executor", lambda: SaturatedExecutor())
+
+    head = await upload_module.get_upload_session_offset(session_id=created.id, **deps)
+    assert head.headers["Upload-Offset"] == "0"
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.append_upload_chunk(
+            request=FakeChunkRequest(MP4_HEAD), session_id=created.id, upload_offset=0, **deps
+        )
+    assert exc_info.value.status_code == 503
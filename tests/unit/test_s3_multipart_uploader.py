@@ -0,0 +1,81 @@
+import io
+
+import boto3
+import pytest
+from unittest.mock import Mock
+from moto import mock_aws
+
+from app.gateways.s3_multipart_uploader import S3_MIN_PART_SIZE_BYTES, S3MultipartUploader
+from app.infrastructure.config.settings import reload_settings
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_ENDPOINT_URL", raising=False)
+    reload_settings()
+
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="bucket-test")
+        yield client
+
+
+def test_upload_fileobj_uses_parallel_multipart_parts(s3_client):
+    payload = b"a" * S3_MIN_PART_SIZE_BYTES + b"b" * S3_MIN_PART_SIZE_BYTES + b"tail"
+    uploader = S3MultipartUploader(s3_client, "bucket-test", part_size=S3_MIN_PART_SIZE_BYTES, max_concurrency=2)
+
+    result = uploader.upload_fileobj(io.BytesIO(payload), "uploads/video.mp4")
+
+    assert result.url == "s3://bucket-test/uploads/video.mp4"
+    assert result.multipart is True
+    assert result.size == len(payload)
+    assert [part.part_number for part in result.parts] == [1, 2, 3]
+    assert [part.size for part in result.parts] == [S3_MIN_PART_SIZE_BYTES, S3_MIN_PART_SIZE_BYTES, 4]
+    assert all(part.seconds >= 0 for part in result.parts)
+
+    stored = s3_client.get_object(Bucket="bucket-test", Key="uploads/video.mp4")["Body"].read()
+    assert stored == payload
+
+
+def test_upload_fileobj_small_file_uses_single_put(s3_client):
+    uploader = S3MultipartUploader(s3_client, "bucket-test")
+
+    result = uploader.upload_fileobj(io.BytesIO(b"small"), "uploads/small.mp4")
+
+    assert result.multipart is False
+    assert result.parts == []
+    assert s3_client.get_object(Bucket="bucket-test", Key="uploads/small.mp4")["Body"].read() == b"small"
+
+
+def test_upload_fileobj_aborts_incomplete_upload_on_part_failure(s3_client):
+    failing_client = Mock(wraps=s3_client)
+    failing_client.upload_part.side_effect = Exception("network down")
+    uploader = S3MultipartUploader(failing_client, "bucket-test", part_size=S3_MIN_PART_SIZE_BYTES, max_concurrency=2)
+
+    with pytest.raises(Exception, match="network down"):
+        uploader.upload_fileobj(io.BytesIO(b"a" * (S3_MIN_PART_SIZE_BYTES * 2)), "uploads/broken.mp4")
+
+    failing_client.abort_multipart_upload.assert_called_once()
+    assert s3_client.list_multipart_uploads(Bucket="bucket-test").get("Uploads", []) == []
+
+
+def test_uploader_reads_part_size_and_concurrency_from_env(monkeypatch):
+    monkeypatch.setenv("S3_MULTIPART_PART_SIZE_MB", "16")
+    monkeypatch.setenv("S3_MULTIPART_CONCURRENCY", "8")
+    reload_settings()
+
+    uploader = S3MultipartUploader(Mock(), "bucket-test")
+
+    assert uploader.part_size == 16 * 1024 * 1024
+    assert uploader.max_concurrency == 8
+
+    monkeypatch.setenv("S3_MULTIPART_PART_SIZE_MB", "1")
+    monkeypatch.setenv("S3_MULTIPART_CONCURRENCY", "abc")
+    reload_settings()
+
+    uploader = S3MultipartUploader(Mock(), "bucket-test")
+
+    assert uploader.part_size == S3_MIN_PART_SIZE_BYTES
+    assert uploader.max_concurrency == 4
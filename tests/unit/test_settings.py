@@ -0,0 +1,101 @@
+import signal
+
+import pytest
+
+from app.infrastructure.config import settings as settings_module
+from app.infrastructure.config.settings import get_settings, install_reload_signal_handler, load_settings, reload_settings
+
+
+def test_load_settings_defaults():
+    settings = load_settings({})
+
+    assert settings.auth.required is False
+    assert settings.storage.app_env == "development"
+    assert settings.storage.is_production is False
+    assert settings.storage.s3_multipart_part_size_bytes == 8 * 1024 * 1024
+    assert settings.aws.region == "us-east-1"
+    assert settings.limits.max_upload_size_bytes == 100 * 1024 * 1024
+    assert settings.database.url is None
+
+
+def test_load_settings_parses_environment():
+    settings = load_settings({
+        "APP_ENV": "production",
+        "AWS_S3_BUCKET": "bucket",
+        "AWS_DEFAULT_REGION": "sa-east-1",
+        "AWS_SECRET_ACCESS_KEY": "super-secret",
+        "COGNITO_ISSUER": "https://issuer",
+        "COGNITO_CLIENT_ID": "client",
+        "MAX_UPLOAD_SIZE_MB": "12",
+        "SQS_VIDEO_PROCESSING_QUEUE": "https://sqs/queue",
+        "SQLALCHEMY_DATABASE_URL": "sqlite://",
+        "AUTH_TOKEN_CACHE_SIZE": "0",
+    })
+
+    assert settings.auth.required is True
+    assert settings.auth.cognito_issuer == "https://issuer"
+    assert settings.auth.token_cache_size == 0
+    assert settings.storage.is_production is True
+    assert settings.storage.s3_bucket == "bucket"
+    assert settings.aws.region == "sa-east-1"
+    assert settings.limits.max_upload_size_mb == 12
+    assert settings.queue.video_processing_queue_url == "https://sqs/queue"
+    assert settings.database.url == "sqlite://"
+    assert "super-secret" not in repr(settings)
+
+
+@pytest.mark.parametrize("raw", ["abc", "0", "-5"])
+def test_load_settings_invalid_numbers_fall_back_to_defaults(raw):
+    settings = load_settings({"MAX_UPLOAD_SIZE_MB": raw, "S3_MULTIPART_CONCURRENCY": raw})
+
+    assert settings.limits.max_upload_size_mb == 100
+    assert settings.storage.s3_multipart_concurrency == 4
+
+
+def test_settings_are_immutable():
+    settings = load_settings({})
+
+    with pytest.raises(Exception):
+        settings.limits.max_upload_size_mb = 1
+
+
+def test_get_settings_is_a_snapshot_until_reload(monkeypatch):
+    monkeypatch.setenv("MAX_UPLOAD_SIZE_MB", "5")
+    reload_settings()
+    snapshot = get_settings()
+
+    monkeypatch.setenv("MAX_UPLOAD_SIZE_MB", "7")
+    assert get_settings() is snapshot
+    assert get_settings().limits.max_upload_size_mb == 5
+
+    assert reload_settings().limits.max_upload_size_mb == 7
+    assert get_settings().limits.max_upload_size_mb == 7
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="SIGHUP indisponível")
+def test_sighup_reloads_settings(monkeypatch):
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        assert install_reload_signal_handler() is True
+
+        monkeypatch.setenv("MAX_UPLOAD_SIZE_MB", "9")
+        signal.getsignal(signal.SIGHUP)(signal.SIGHUP, None)
+
+        assert settings_module.get_settings().limits.max_upload_size_mb == 9
+    finally:
+        signal.signal(signal.SIGHUP, previous)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="SIGHUP indisponível")
+def test_sighup_while_settings_lock_is_held_does_not_deadlock(monkeypatch):
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        assert install_reload_signal_handler() is True
+        monkeypatch.setenv("MAX_UPLOAD_SIZE_MB", "11")
+
+        with settings_module._lock:
+            signal.getsignal(signal.SIGHUP)(signal.SIGHUP, None)
+
+        assert settings_module.get_settings().limits.max_upload_size_mb == 11
+    finally:
+        signal.signal(signal.SIGHUP, previous)
@@ -0,0 +1,269 @@
+import json
+import threading
+import time
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from app.gateways import sqs_batch_producer
+from app.gateways.sqs_batch_producer import BatchingSQSProducer, SQSBatchEntryError
+from app.gateways.sqs_producer import SQSProducer
+from app.infrastructure.config.settings import reload_settings
+
+
+class StubSQSClient:
+    def __init__(self, failures=None, raise_times=0):
+        self.calls = []
+        self.failures = dict(failures or {})
+        self.raise_times = raise_times
+        self._lock = threading.Lock()
+
+    def send_message_batch(self, QueueUrl, Entries):
+        with self._lock:
+            self.calls.append([json.loads(entry["MessageBody"]) for entry in Entries])
+            if self.raise_times:
+                self.raise_times -= 1
+                raise ConnectionError("timeout")
+
+        successful, failed = [], []
+        for entry in Entries:
+            body = json.loads(entry["MessageBody"])
+            failure = self.failures.get(body["n"])
+            if failure:
+                failed.append({"Id": entry["Id"], "Code": "InternalError", "Message": "falhou", "SenderFault": failure == "sender"})
+                if failure == "once":
+                    self.failures.pop(body["n"])
+            else:
+                successful.append({"Id": entry["Id"], "MessageId": f"id-{body['n']}"})
+
+        return {"Successful": successful, "Failed": failed}
+
+
+def _producer(client, **kwargs):
+    kwargs.setdefault("linger_seconds", 0.01)
+    kwargs.setdefault("max_attempts", 3)
+    kwargs.setdefault("ack_timeout_seconds", 5)
+    kwargs.setdefault("retry_backoff_seconds", 0.01)
+    return BatchingSQSProducer(client=client, **kwargs)
+
+
+def test_submit_batches_up_to_ten_entries_and_resolves_futures():
+    client = StubSQSClient()
+    producer = _producer(client, linger_seconds=0.2)
+
+    try:
+        futures = [producer.submit({"n": n}) for n in range(25)]
+        results = [future.result(5) for future in futures]
+    finally:
+        producer.close(5)
+
+    assert results == [f"id-{n}" for n in range(25)]
+    assert [len(call) for call in client.calls] == [10, 10, 5]
+    assert producer.stats()["messages_sent"] == 25
+
+
+def test_linger_flushes_partial_batch():
+    client = StubSQSClient()
+    producer = _producer(client, linger_seconds=0.02)
+
+    try:
+        assert producer.submit({"n": 1}).result(5) == "id-1"
+    finally:
+        producer.close(5)
+
+    assert client.calls == [[{"n": 1}]]
+
+
+def test_batches_respect_byte_limit():
+    client = StubSQSClient()
+    producer = _producer(client, linger_seconds=0.2, max_batch_bytes=100)
+
+    try:
+        futures = [producer.submit({"n": n, "pad": "x" * 30}) for n in range(4)]
+        for future in futures:
+            future.result(5)
+    finally:
+        producer.close(5)
+
+    assert all(len(json.dumps(call)) <= 200 for call in client.calls)
+    assert sum(len(call) for call in client.calls) == 4
+    assert len(client.calls) >= 2
+
+
+def test_failed_entries_are_retried_individually():
+    client = StubSQSClient(failures={2: "once"})
+    producer = _producer(client)
+
+    try:
+        futures = [producer.submit({"n": n}) for n in range(3)]
+        results = [future.result(5) for future in futures]
+    finally:
+        producer.close(5)
+
+    assert results == ["id-0", "id-1", "id-2"]
+    assert client.calls[-1] == [{"n": 2}]
+    assert producer.stats()["retries"] == 1
+
+
+def test_sender_fault_and_exhausted_retries_fail_the_future():
+    client = StubSQSClient(failures={1: "sender", 2: "always"})
+    producer = _producer(client, max_attempts=2)
+
+    try:
+        ok = producer.submit({"n": 0})
+        sender = producer.submit({"n": 1})
+        exhausted = producer.submit({"n": 2})
+
+        assert ok.result(5) == "id-0"
+        with pytest.raises(SQSBatchEntryError) as sender_error:
+            sender.result(5)
+        with pytest.raises(SQSBatchEntryError):
+            exhausted.result(5)
+    finally:
+        producer.close(5)
+
+    assert sender_error.value.sender_fault is True
+    assert producer.stats()["messages_failed"] == 2
+
+
+def test_retries_wait_with_exponential_backoff():
+    client = StubSQSClient(raise_times=2)
+    call_times = []
+    original = client.send_message_batch
+
+    def timed(**kwargs):
+        call_times.append(time.monotonic())
+        return original(**kwargs)
+
+    client.send_message_batch = timed
+    producer = _producer(client, retry_backoff_seconds=0.1)
+
+    try:
+        assert producer.submit({"n": 1}).result(5) == "id-1"
+    finally:
+        producer.close(5)
+
+    first_wait, second_wait = call_times[1] - call_times[0], call_times[2] - call_times[1]
+    assert first_wait >= 0.1
+    assert second_wait >= 0.2
+
+
+def test_unexpected_error_fails_batch_and_keeps_flush_thread_alive():
+    client = StubSQSClient()
+    original = client.send_message_batch
+    responses = iter([{"Successful": [{"Id": "99", "MessageId": "x"}], "Failed": None}])
+
+    def broken_once(**kwargs):
+        response = next(responses, None)
+        return response if response is not None else original(**kwargs)
+
+    client.send_message_batch = broken_once
+    producer = _producer(client)
+
+    try:
+        with pytest.raises(TypeError):
+            producer.submit({"n": 1}).result(5)
+        assert producer.submit({"n": 2}).result(5) == "id-2"
+    finally:
+        producer.close(5)
+
+
+def test_dead_flush_thread_is_restarted_on_submit():
+    producer = _producer(StubSQSClient())
+
+    try:
+        producer.submit({"n": 1}).result(5)
+        dead = threading.Thread(target=lambda: None)
+        dead.start()
+        dead.join()
+        producer._thread = dead
+
+        assert producer.submit({"n": 2}).result(5) == "id-2"
+    finally:
+        producer.close(5)
+
+
+def test_whole_batch_is_retried_after_api_error():
+    client = StubSQSClient(raise_times=1)
+    producer = _producer(client)
+
+    try:
+        assert producer.send_message({"n": 5}) is True
+    finally:
+        producer.close(5)
+
+    assert len(client.calls) == 2
+
+
+def test_send_message_returns_false_for_oversized_message():
+    producer = _producer(StubSQSClient(), max_batch_bytes=10)
+
+    assert producer.send_message({"n": 1, "payload": "x" * 100}) is False
+
+
+def test_close_drains_pending_messages():
+    client = StubSQSClient()
+    producer = _producer(client, linger_seconds=60)
+
+    future = producer.submit({"n": 1})
+    producer.close(5)
+
+    assert future.result(0) == "id-1"
+    with pytest.raises(RuntimeError):
+        producer.submit({"n": 2})
+
+
+def test_send_messages_enqueues_all_before_waiting():
+    client = StubSQSClient()
+    client.failures = {3: "sender"}
+    producer = _producer(client, linger_seconds=0.2)
+
+    try:
+        results = producer.send_messages([{"n": n} for n in range(12)])
+    finally:
+        producer.close(5)
+
+    assert results == [n != 3 for n in range(12)]
+    assert [len(call) for call in client.calls] == [10, 2]
+
+
+def test_batching_producer_against_moto_sqs(monkeypatch):
+    with mock_aws():
+        client = boto3.client("sqs", region_name="us-east-1")
+        queue_url = client.create_queue(QueueName="video-processing")["QueueUrl"]
+        monkeypatch.setenv("SQS_VIDEO_PROCESSING_QUEUE", queue_url)
+        reload_settings()
+
+        producer = _producer(client)
+        try:
+            futures = [producer.submit({"video_id": n}) for n in range(12)]
+            for future in futures:
+                future.result(5)
+        finally:
+            producer.close(5)
+
+        received = client.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10)["Messages"]
+        received += client.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10).get("Messages", [])
+
+    assert sorted(json.loads(message["Body"])["video_id"] for message in received) == list(range(12))
+    assert producer.stats()["batches_sent"] == 2
+
+
+def test_shared_producer_honours_batching_flag(monkeypatch):
+    monkeypatch.delenv("SQS_BATCHING_ENABLED", raising=False)
+    reload_settings()
+    sqs_batch_producer.shutdown_sqs_producer()
+
+    try:
+        # Padrão: envio direto, sem o linger do lote no caminho da requisição.
+        producer = sqs_batch_producer.get_shared_sqs_producer()
+        assert type(producer) is SQSProducer
+        assert sqs_batch_producer.get_shared_sqs_producer() is producer
+
+        monkeypatch.setenv("SQS_BATCHING_ENABLED", "true")
+        reload_settings()
+        sqs_batch_producer.shutdown_sqs_producer()
+        assert isinstance(sqs_batch_producer.get_shared_sqs_producer(), sqs_batch_producer.BatchingSQSProducer)
+    finally:
+        sqs_batch_producer.shutdown_sqs_producer()
@@ -0,0 +1,196 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.dao.video_dao import VideoDAO
+from app.infrastructure.db.database import Base
+from app.infrastructure.events.status_hub import InMemoryHubBackend, StatusHub, get_status_hub
+from app.infrastructure.events.status_poller import StatusPoller
+from app.models.video import Video
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_publish_from_another_thread_reaches_subscriber():
+    hub = StatusHub()
+
+    with hub.subscribe(1) as subscription:
+        thread = threading.Thread(target=hub.publish, args=(1, {"video_id": 3, "status": 1}))
+        thread.start()
+        thread.join()
+
+        event = await subscription.get(timeout=1)
+
+    assert event == {"video_id": 3, "status": 1}
+    assert hub.stats() == {"users": 0, "subscribers": 0, "published": 1, "delivered": 1, "backend": None}
+
+
+@pytest.mark.anyio
+async def test_subscribers_only_receive_their_user_events():
+    hub = StatusHub()
+
+    with hub.subscribe(1) as mine, hub.subscribe(2) as other:
+        hub.publish(2, {"video_id": 9, "status": 1})
+        await asyncio.sleep(0)
+
+        assert await mine.get(timeout=0.05) is None
+        assert (await other.get(timeout=1))["video_id"] == 9
+
+
+@pytest.mark.anyio
+async def test_slow_subscriber_drops_oldest_event():
+    hub = StatusHub(queue_size=2)
+
+    with hub.subscribe(1) as subscription:
+        for video_id in range(3):
+            hub.publish(1, {"video_id": video_id})
+        await asyncio.sleep(0)
+
+        assert subscription.dropped == 1
+        assert (await subscription.get(timeout=1))["video_id"] == 1
+
+
+@pytest.mark.anyio
+async def test_backend_fans_out_across_nodes():
+    backend = InMemoryHubBackend()
+    node_a = StatusHub(backend=backend)
+    node_b = StatusHub(backend=backend)
+
+    with node_a.subscribe(1) as on_a, node_b.subscribe(1) as on_b:
+        node_a.publish(1, {"video_id": 5, "status": 1})
+
+        assert (await on_a.get(timeout=1))["video_id"] == 5
+        assert (await on_b.get(timeout=1))["video_id"] == 5
+
+
+@pytest.mark.anyio
+async def test_video_dao_update_publishes_status_change():
+    from app.dao.video_dao import VideoDAO
+
+    row = SimpleNamespace(_mapping={
+        "id": 4, "user_id": 8, "title": "v", "status": 1, "file_path": "/outputs/frames.zip", "content_hash": None,
+    })
+
+    class FakeResult:
+        def first(self):
+            return row
+
+    class FakeSession:
+        def execute(self, _statement):
+            return FakeResult()
+
+        def commit(self):
+            pass
+
+    with get_status_hub().subscribe(8) as subscription:
+        VideoDAO(FakeSession()).update_video_status(4, 1, file_path="/outputs/frames.zip")
+        event = await subscription.get(timeout=1)
+
+    assert event == {"video_id": 4, "user_id": 8, "status": 1, "file_path": "/outputs/frames.zip"}
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'status.db'}")
+    Base.metadata.create_all(bind=engine, tables=[Video.__table__])
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_poller_delivers_status_written_directly_to_the_database(db):
+    hub = StatusHub()
+    db.add_all([
+        Video(id=1, user_id=8, title="a", file_path="/uploads/a.mp4", status=0),
+        Video(id=2, user_id=9, title="b", file_path="/uploads/b.mp4", status=0),
+    ])
+    db.commit()
+    loaded = []
+
+    def load(user_ids, video_ids):
+        loaded.append((sorted(user_ids), sorted(video_ids)))
+        return VideoDAO(db).list_statuses_by_users(user_ids, video_ids)
+
+    poller = StatusPoller(hub, load, interval_seconds=60)
+    assert poller.poll_once() == 0 and loaded == []
+
+    with hub.subscribe(8) as subscription:
+        assert poller.poll_once() == 0
+        # Worker grava direto na tabela, sem passar pelo DAO da API.
+        db.execute(text("UPDATE video SET status = 1, file_path = '/outputs/a.zip'"))
+        db.commit()
+
+        assert poller.poll_once() == 1
+        event = await subscription.get(timeout=1)
+        # Em status final o vídeo sai do acompanhamento.
+        assert poller.poll_once() == 0
+
+    assert event == {"video_id": 1, "user_id": 8, "status": 1, "file_path": "/outputs/a.zip"}
+    assert loaded == [([8], []), ([8], [1]), ([8], [])]
+
+
+def test_list_statuses_by_users_skips_finished_videos_unless_tracked(db):
+    db.add_all([
+        Video(id=1, user_id=8, title="a", file_path="/uploads/a.mp4", status=0),
+        Video(id=2, user_id=8, title="b", file_path="/outputs/b.zip", status=1),
+        Video(id=3, user_id=8, title="c", file_path="/uploads/c.mp4", status=2),
+        Video(id=4, user_id=8, title="d", file_path="/uploads/d.mp4", status=3),
+        Video(id=5, user_id=9, title="e", file_path="/uploads/e.mp4", status=0),
+    ])
+    db.commit()
+    dao = VideoDAO(db)
+
+    assert sorted(row[0] for row in dao.list_statuses_by_users([8])) == [1, 4]
+    assert sorted(row[0] for row in dao.list_statuses_by_users([8], [2, 1])) == [1, 2, 4]
+
+
+@pytest.mark.anyio
+async def test_poller_does_not_repeat_events_already_published():
+    hub = StatusHub()
+    rows = [(1, 8, 0, "/uploads/a.mp4")]
+    poller = StatusPoller(hub, lambda _users, _videos: list(rows), interval_seconds=60)
+
+    with hub.subscribe(8) as subscription:
+        poller.poll_once()
+        rows[0] = (1, 8, 1, "/outputs/a.zip")
+        hub.publish(8, {"video_id": 1, "user_id": 8, "status": 1, "file_path": "/outputs/a.zip"})
+
+        assert poller.poll_once() == 0
+        assert (await subscription.get(timeout=1))["status"] == 1
+        assert await subscription.get(timeout=0.05) is None
+
+
+@pytest.mark.anyio
+async def test_poller_keeps_event_that_arrives_during_the_read():
+    hub = StatusHub()
+    rows = [(1, 8, 0, "/uploads/a.mp4")]
+    stale_read = []
+
+    def load(_users, _videos):
+        if stale_read:
+            # Leitura antiga; o evento novo chega enquanto ela está em curso.
+            hub.publish(8, {"video_id": 1, "user_id": 8, "status": 2, "file_path": "/uploads/a.mp4"})
+        return list(rows)
+
+    poller = StatusPoller(hub, load, interval_seconds=60)
+
+    with hub.subscribe(8):
+        poller.poll_once()
+        stale_read.append(True)
+
+        # A linha antiga (status 0) não desfaz o evento recebido.
+        assert poller.poll_once() == 0
+        stale_read.clear()
+        rows[0] = (1, 8, 2, "/uploads/a.mp4")
+        assert poller.poll_once() == 0
@@ -0,0 +1,96 @@
+import threading
+
+from app.infrastructure.security.token_cache import VerifiedTokenCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_returns_cached_user_until_exp():
+    clock = FakeClock()
+    cache = VerifiedTokenCache(max_size=10, clock=clock)
+    cache.put("token", "issuer", "client", "user-42", clock.now + 60)
+
+    assert cache.get("token", "issuer", "client") == "user-42"
+
+    clock.now += 61
+    assert cache.get("token", "issuer", "client") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_key_is_scoped_by_issuer_and_client():
+    clock = FakeClock()
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put("token", "issuer", "client", "user", clock.now + 60)
+
+    assert cache.get("token", "other-issuer", "client") is None
+    assert cache.get("token", "issuer", "other-client") is None
+
+
+def test_put_ignores_tokens_without_valid_exp():
+    clock = FakeClock()
+    cache = VerifiedTokenCache(clock=clock)
+
+    cache.put("no-exp", "issuer", "client", "user", None)
+    cache.put("expired", "issuer", "client", "user", clock.now - 1)
+    cache.put("bad-exp", "issuer", "client", "user", "soon")
+
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction_keeps_most_recently_used():
+    clock = FakeClock()
+    cache = VerifiedTokenCache(max_size=2, clock=clock)
+    cache.put("a", "issuer", "client", "user-a", clock.now + 60)
+    cache.put("b", "issuer", "client", "user-b", clock.now + 60)
+
+    cache.get("a", "issuer", "client")
+    cache.put("c", "issuer", "client", "user-c", clock.now + 60)
+
+    assert cache.get("a", "issuer", "client") == "user-a"
+    assert cache.get("b", "issuer", "client") is None
+    assert cache.get("c", "issuer", "client") == "user-c"
+
+
+def test_stats_counts_hits_and_misses():
+    clock = FakeClock()
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put("a", "issuer", "client", "user", clock.now + 60)
+
+    cache.get("a", "issuer", "client")
+    cache.get("a", "issuer", "client")
+    cache.get("missing", "issuer", "client")
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == round(2 / 3, 4)
+
+    cache.clear()
+    assert cache.stats()["hits"] == 0
+
+
+def test_concurrent_access_keeps_counters_consistent():
+    clock = FakeClock()
+    cache = VerifiedTokenCache(max_size=50, clock=clock)
+
+    def worker(worker_id):
+        for i in range(200):
+            token = f"t-{worker_id}-{i % 20}"
+            if cache.get(token, "issuer", "client") is None:
+                cache.put(token, "issuer", "client", token, clock.now + 60)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 8 * 200
+    assert stats["size"] <= 50
@@ -10,6 +10,7 @@ from app.api.upload import (
     is_valid_video_file,
     is_valid_video_size,
 )
+from app.infrastructure.config.settings import reload_settings
 
 
 class TestVideoValidation:
@@ -68,20 +69,25 @@ class TestVideoContentTypeValidation:
 class TestVideoSizeValidation:
     def test_get_max_upload_size_bytes_default(self, monkeypatch):
         monkeypatch.delenv("MAX_UPLOAD_SIZE_MB", raising=False)
+        reload_settings()
         assert get_max_upload_size_bytes() == DEFAULT_MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
     def test_get_max_upload_size_bytes_custom(self, monkeypatch):
         monkeypatch.setenv("MAX_UPLOAD_SIZE_MB", "12")
+        reload_settings()
         assert get_max_upload_size_bytes() == 12 * 1024 * 1024
 
     def test_get_max_upload_size_bytes_invalid(self, monkeypatch):
         monkeypatch.setenv("MAX_UPLOAD_SIZE_MB", "abc")
+        reload_settings()
         assert get_max_upload_size_bytes() == DEFAULT_MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
     def test_get_max_upload_size_bytes_zero_negative(self, monkeypatch):
         monkeypatch.setenv("MAX_UPLOAD_SIZE_MB", "0")
+        reload_settings()
         assert get_max_upload_size_bytes() == DEFAULT_MAX_UPLOAD_SIZE_MB * 1024 * 1024
         monkeypatch.setenv("MAX_UPLOAD_SIZE_MB", "-5")
+        reload_settings()
         assert get_max_upload_size_bytes() == DEFAULT_MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
     def test_is_valid_video_size_true(self):
@@ -1,12 +1,19 @@
-from unittest.mock import Mock
+import asyncio
+import hashlib
+import io
+import threading
+from unittest.mock import AsyncMock, Mock
 
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 
 import app.api.upload as upload_module
 from app.gateways.sqs_producer import SQSProducer
 from app.gateways.video_processing_gateway import VideoProcessingGateway
 from app.infrastructure.security.auth import AuthenticatedUser
+from app.infrastructure.config.settings import reload_settings
+
+MP4_HEAD = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00"
 
 
 @pytest.fixture
@@ -26,23 +33,48 @@ def test_get_sqs_producer_returns_instance():
     assert isinstance(producer, SQSProducer)
 
 
+def test_get_sqs_producer_is_shared_across_requests():
+    assert upload_module.get_sqs_producer() is upload_module.get_sqs_producer()
+
+
+class ListControllerStub:
+    etag = '"v1"'
+
+    def __init__(self, _video_dao):
+        pass
+
+    async def listing_etag_async(self, _user_id, limit=None, after_id=None):
+        return self.etag
+
+    async def list_user_videos_async(self, _user_id, limit=None, after_id=None):
+        return {"status": "success", "data": []}
+
+
+async def _list_user_videos(**kwargs):
+    params = {
+        "response": Response(),
+        "user_id": 1,
+        "limit": 50,
+        "after_id": None,
+        "if_none_match": None,
+        "wait": 0,
+        "db": AsyncMock(),
+        "current_user": AuthenticatedUser(sub="1", claims={"user_id": "1"}),
+    }
+    params.update(kwargs)
+    return await upload_module.list_user_videos(**params)
+
+
 @pytest.mark.anyio
 async def test_list_user_videos_raises_http_500_on_unexpected_error(monkeypatch):
-    class BrokenController:
-        def __init__(self, _video_dao):
-            pass
-
-        def list_user_videos(self, _user_id):
+    class BrokenController(ListControllerStub):
+        async def list_user_videos_async(self, _user_id, limit=None, after_id=None):
             raise Exception("boom")
 
     monkeypatch.setattr(upload_module, "ListVideosController", BrokenController)
 
     with pytest.raises(HTTPException) as exc_info:
-        await upload_module.list_user_videos(
-            user_id=1,
-            db=Mock(),
-            current_user=AuthenticatedUser(sub="1", claims={"user_id": "1"}),
-        )
+        await _list_user_videos()
 
     assert exc_info.value.status_code == 500
     assert exc_info.value.detail == "boom"
@@ -50,22 +82,123 @@ async def test_list_user_videos_raises_http_500_on_unexpected_error(monkeypatch)
 
 @pytest.mark.anyio
 async def test_list_user_videos_success(monkeypatch):
-    class OkController:
-        def __init__(self, _video_dao):
-            pass
+    monkeypatch.setattr(upload_module, "ListVideosController", ListControllerStub)
+    response = Response()
 
-        def list_user_videos(self, _user_id):
-            return {"status": "success", "data": []}
+    result = await _list_user_videos(response=response)
+
+    assert result == {"status": "success", "data": []}
+    assert response.headers["ETag"] == '"v1"'
+
+
+@pytest.mark.anyio
+async def test_list_user_videos_returns_304_when_etag_matches(monkeypatch):
+    class NoBodyController(ListControllerStub):
+        async def list_user_videos_async(self, _user_id, limit=None, after_id=None):
+            raise AssertionError("não deveria montar a listagem")
+
+    monkeypatch.setattr(upload_module, "ListVideosController", NoBodyController)
+
+    result = await _list_user_videos(if_none_match='W/"v0", "v1"')
+
+    assert result.status_code == 304
+    assert result.headers["ETag"] == '"v1"'
+
+
+@pytest.mark.anyio
+async def test_list_user_videos_long_poll_returns_fresh_page_after_status_event(monkeypatch):
+    from app.infrastructure.events.status_hub import get_status_hub
+
+    versions = iter(['"v1"', '"v2"'])
+
+    class ChangingController(ListControllerStub):
+        async def listing_etag_async(self, _user_id, limit=None, after_id=None):
+            return next(versions)
+
+    monkeypatch.setattr(upload_module, "ListVideosController", ChangingController)
+    db = AsyncMock()
+    response = Response()
+
+    async def publish_later():
+        await asyncio.sleep(0.05)
+        threading.Thread(target=get_status_hub().publish, args=(1, {"video_id": 7, "status": 1})).start()
+
+    publisher = asyncio.create_task(publish_later())
+    result = await _list_user_videos(response=response, if_none_match='"v1"', wait=5, db=db)
+    await publisher
+
+    assert result == {"status": "success", "data": []}
+    assert response.headers["ETag"] == '"v2"'
+    db.close.assert_awaited_once()
+    assert get_status_hub().stats()["subscribers"] == 0
 
-    monkeypatch.setattr(upload_module, "ListVideosController", OkController)
 
-    result = await upload_module.list_user_videos(
+@pytest.mark.anyio
+async def test_list_user_videos_long_poll_times_out_with_304(monkeypatch):
+    monkeypatch.setattr(upload_module, "ListVideosController", ListControllerStub)
+
+    class InstantTimeoutHub:
+        def subscribe(self, _user_id):
+            subscription = Mock()
+            subscription.get = AsyncMock(return_value=None)
+            subscription.__enter__ = Mock(return_value=subscription)
+            subscription.__exit__ = Mock(return_value=None)
+            return subscription
+
+    monkeypatch.setattr(upload_module, "get_status_hub", lambda: InstantTimeoutHub())
+
+    result = await _list_user_videos(if_none_match='"v1"', wait=30)
+
+    assert result.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_stream_video_status_events_emits_sse_frames(monkeypatch):
+    from app.infrastructure.events.status_hub import get_status_hub
+
+    class FakeRequest:
+        def __init__(self):
+            self.checks = 0
+
+        async def is_disconnected(self):
+            self.checks += 1
+            return self.checks > 1
+
+    response = await upload_module.stream_video_status_events(
+        request=FakeRequest(),
         user_id=1,
-        db=Mock(),
         current_user=AuthenticatedUser(sub="1", claims={"user_id": "1"}),
     )
+    assert response.media_type == "text/event-stream"
 
-    assert result == {"status": "success", "data": []}
+    frames = response.body_iterator
+    assert (await frames.__anext__()).startswith("retry:")
+
+    get_status_hub().publish(1, {"video_id": 7, "user_id": 1, "status": 1, "file_path": "/outputs/a.zip"})
+    frame = await frames.__anext__()
+
+    assert frame.startswith("event: status\nid: 7:1\n")
+    assert '"status": 1' in frame
+
+    with pytest.raises(StopAsyncIteration):
+        await frames.__anext__()
+    assert get_status_hub().stats()["subscribers"] == 0
+
+
+@pytest.mark.anyio
+async def test_list_user_videos_forwards_pagination(monkeypatch):
+    received = {}
+
+    class OkController(ListControllerStub):
+        async def list_user_videos_async(self, user_id, limit=None, after_id=None):
+            received.update(user_id=user_id, limit=limit, after_id=after_id)
+            return {"status": "success", "data": [], "next_cursor": None}
+
+    monkeypatch.setattr(upload_module, "ListVideosController", OkController)
+
+    await _list_user_videos(limit=10, after_id=55)
+
+    assert received == {"user_id": 1, "limit": 10, "after_id": 55}
 
 
 @pytest.mark.anyio
@@ -91,6 +224,7 @@ async def test_upload_and_process_video_enforces_user_and_validates_file(monkeyp
     fake_file = Mock()
     fake_file.filename = "video.mp4"
     fake_file.content_type = "video/mp4"
+    fake_file.file = io.BytesIO(MP4_HEAD + b"\x00" * 16)
 
     response = await upload_module.upload_and_process_video(
         user_id=10,
@@ -105,3 +239,189 @@ async def test_upload_and_process_video_enforces_user_and_validates_file(monkeyp
     assert response["status"] == "success"
     assert response["data"]["user_id"] == 10
 
+
+@pytest.mark.anyio
+async def test_upload_and_process_video_returns_503_when_executor_is_saturated(monkeypatch):
+    class SaturatedExecutor:
+        def run(self, *_args, **_kwargs):
+            raise upload_module.ExecutorSaturatedError("saturado")
+
+    monkeypatch.setattr(upload_module, "UploadController", lambda _use_case: Mock())
+    monkeypatch.setattr(upload_module, "get_upload_executor", lambda: SaturatedExecutor())
+
+    fake_file = Mock()
+    fake_file.filename = "video.mp4"
+    fake_file.content_type = "video/mp4"
+    fake_file.file = io.BytesIO(MP4_HEAD + b"\x00" * 16)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.upload_and_process_video(
+            user_id=10,
+            title="Teste",
+            file=fake_file,
+            db=Mock(),
+            processing_gateway=Mock(),
+            sqs_producer=Mock(),
+            current_user=AuthenticatedUser(sub="10", claims={"user_id": "10"}),
+        )
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers["Retry-After"] == "5"
+
+
+class FakeStreamRequest:
+    def __init__(self, body: bytes, boundary: str = "b0undary"):
+        self.headers = {
+            "content-type": f"multipart/form-data; boundary={boundary}",
+            "content-length": str(len(body)),
+        }
+        self._body = body
+
+    async def stream(self):
+        for i in range(0, len(self._body), 16):
+            yield self._body[i:i + 16]
+
+
+def _stream_body(
+    user_id: str = "10", filename: str = "video.mp4", boundary: str = "b0undary", content: bytes = MP4_HEAD + b"\x00" * 84
+) -> bytes:
+    return (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"user_id\"\r\n\r\n{user_id}\r\n"
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"title\"\r\n\r\nStream\r\n"
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"{filename}\"\r\n"
+        f"Content-Type: video/mp4\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+
+
+@pytest.mark.anyio
+async def test_upload_and_process_video_stream_registers_streamed_file(monkeypatch, tmp_path):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    reload_settings()
+    registered = {}
+
+    class FakeController:
+        def __init__(self, _use_case):
+            pass
+
+        def register_streamed_video(self, user_id, title, saved_path, timestamp, content_hash=None):
+            registered.update(user_id=user_id, title=title, saved_path=saved_path, content_hash=content_hash)
+            return {"status": "success"}
+
+    monkeypatch.setattr(upload_module, "UploadController", FakeController)
+
+    response = await upload_module.upload_and_process_video_stream(
+        request=FakeStreamRequest(_stream_body()),
+        db=Mock(),
+        processing_gateway=VideoProcessingGateway(base_dir=tmp_path),
+        sqs_producer=Mock(),
+        current_user=AuthenticatedUser(sub="10", claims={"user_id": "10"}),
+    )
+
+    assert response == {"status": "success"}
+    assert registered["user_id"] == 10
+    assert registered["title"] == "Stream"
+    assert registered["saved_path"].read_bytes() == MP4_HEAD + b"\x00" * 84
+    assert registered["content_hash"] == hashlib.sha256(MP4_HEAD + b"\x00" * 84).hexdigest()
+
+
+@pytest.mark.anyio
+async def test_upload_and_process_video_stream_discards_saved_file_when_second_file_follows(monkeypatch, tmp_path):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    reload_settings()
+    content = MP4_HEAD + b"\x00" * 84
+    second_file = (
+        b"--b0undary\r\nContent-Disposition: form-data; name=\"file\"; filename=\"other.mp4\"\r\n"
+        b"Content-Type: video/mp4\r\n\r\n" + content + b"\r\n"
+    )
+    body = _stream_body(content=content).replace(b"--b0undary--\r\n", second_file + b"--b0undary--\r\n")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.upload_and_process_video_stream(
+            request=FakeStreamRequest(body),
+            db=Mock(),
+            processing_gateway=VideoProcessingGateway(base_dir=tmp_path),
+            sqs_producer=Mock(),
+            current_user=AuthenticatedUser(sub="10", claims={"user_id": "10"}),
+        )
+
+    assert exc_info.value.status_code == 400
+    assert list((tmp_path / "uploads").iterdir()) == []
+
+
+@pytest.mark.anyio
+async def test_upload_and_process_video_stream_rejects_invalid_format(monkeypatch, tmp_path):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    reload_settings()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.upload_and_process_video_stream(
+            request=FakeStreamRequest(_stream_body(filename="notes.txt")),
+            db=Mock(),
+            processing_gateway=VideoProcessingGateway(base_dir=tmp_path),
+            sqs_producer=Mock(),
+            current_user=AuthenticatedUser(sub="10", claims={"user_id": "10"}),
+        )
+
+    assert exc_info.value.status_code == 400
+    assert list((tmp_path / "uploads").iterdir()) == []
+
+
+@pytest.mark.anyio
+async def test_upload_and_process_video_stream_rejects_content_that_is_not_video(monkeypatch, tmp_path):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    reload_settings()
+    # Extensão e Content-Type válidos, mas o conteúdo é um PDF.
+    body = _stream_body(content=b"%PDF-1.7\n" + b"\x00" * 5000)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.upload_and_process_video_stream(
+            request=FakeStreamRequest(body),
+            db=Mock(),
+            processing_gateway=VideoProcessingGateway(base_dir=tmp_path),
+            sqs_producer=Mock(),
+            current_user=AuthenticatedUser(sub="10", claims={"user_id": "10"}),
+        )
+
+    assert exc_info.value.status_code == 400
+    assert list((tmp_path / "uploads").iterdir()) == []
+
+
+@pytest.mark.anyio
+async def test_upload_and_process_video_rejects_extension_mismatch():
+    fake_file = Mock()
+    fake_file.filename = "video.avi"
+    fake_file.content_type = "video/x-msvideo"
+    fake_file.file = io.BytesIO(MP4_HEAD)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.upload_and_process_video(
+            user_id=10,
+            title="Teste",
+            file=fake_file,
+            db=Mock(),
+            processing_gateway=Mock(),
+            sqs_producer=Mock(),
+            current_user=AuthenticatedUser(sub="10", claims={"user_id": "10"}),
+        )
+
+    assert exc_info.value.status_code == 400
+    assert fake_file.file.tell() == 0
+
+
+@pytest.mark.anyio
+async def test_upload_and_process_video_stream_rejects_oversized_content_length(monkeypatch, tmp_path):
+    monkeypatch.setenv("MAX_UPLOAD_SIZE_MB", "1")
+    reload_settings()
+    request = FakeStreamRequest(_stream_body())
+    request.headers["content-length"] = str(5 * 1024 * 1024)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_module.upload_and_process_video_stream(
+            request=request,
+            db=Mock(),
+            processing_gateway=VideoProcessingGateway(base_dir=tmp_path),
+            sqs_producer=Mock(),
+            current_user=AuthenticatedUser(sub="10", claims={"user_id": "10"}),
+        )
+
+    assert exc_info.value.status_code == 413
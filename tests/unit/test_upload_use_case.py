@@ -8,7 +8,7 @@ from app.use_cases.upload_use_case import UploadUseCase
 
 def test_upload_use_case_execute():
     mock_processing_gateway = Mock()
-    mock_processing_gateway.save_upload.return_value = Path("/path/to/saved_video.mp4")
+    mock_processing_gateway.store_upload.return_value = (Path("/path/to/saved_video.mp4"), None, None)
 
     mock_video_dao = Mock()
     mock_created_video = SimpleNamespace(
@@ -39,13 +39,13 @@ def test_upload_use_case_execute():
     assert saved_path == "/path/to/saved_video.mp4"
     assert timestamp is not None
     
-    mock_processing_gateway.save_upload.assert_called_once()
+    mock_processing_gateway.store_upload.assert_called_once()
     mock_video_dao.create_video.assert_called_once()
 
 
 def test_upload_use_case_calls_dao_with_correct_dto():
     mock_processing_gateway = Mock()
-    mock_processing_gateway.save_upload.return_value = Path("/path/to/video.mp4")
+    mock_processing_gateway.store_upload.return_value = (Path("/path/to/video.mp4"), None, None)
 
     mock_video_dao = Mock()
     mock_created_video = SimpleNamespace(
@@ -72,3 +72,53 @@ def test_upload_use_case_calls_dao_with_correct_dto():
     assert dto.user_id == 1
     assert dto.title == "Test Video"
     assert dto.status == 0
+
+
+def test_upload_use_case_register_upload_without_outbox_sends_to_sqs():
+    mock_processing_gateway = Mock()
+    mock_video_dao = Mock()
+    mock_video_dao.create_video.return_value = SimpleNamespace(
+        id=7, user_id=3, title="Stream", file_path="/uploads/stream.mp4", status=0
+    )
+    mock_sqs_producer = Mock()
+    mock_sqs_producer.send_message.return_value = True
+
+    use_case = UploadUseCase(
+        processing_gateway=mock_processing_gateway,
+        video_dao=mock_video_dao,
+        sqs_producer=mock_sqs_producer,
+        use_outbox=False,
+    )
+
+    created, saved_path, timestamp = use_case.register_upload(3, "Stream", "/uploads/stream.mp4", "20260218_220000")
+
+    assert created.id == 7
+    assert saved_path == "/uploads/stream.mp4"
+    assert timestamp == "20260218_220000"
+    mock_processing_gateway.store_upload.assert_not_called()
+    mock_sqs_producer.send_message.assert_called_once_with(
+        {"video_id": 7, "video_path": "/uploads/stream.mp4", "timestamp": "20260218_220000", "user_id": 3}
+    )
+
+
+def test_upload_use_case_register_upload_writes_outbox_event_instead_of_sending():
+    mock_video_dao = Mock()
+    created_video = SimpleNamespace(id=7, user_id=3, title="Stream", file_path="/uploads/stream.mp4", status=0)
+    mock_video_dao.create_video.return_value = created_video
+    mock_sqs_producer = Mock()
+
+    use_case = UploadUseCase(
+        processing_gateway=Mock(),
+        video_dao=mock_video_dao,
+        sqs_producer=mock_sqs_producer,
+        use_outbox=True,
+    )
+
+    created, _, _ = use_case.register_upload(3, "Stream", "/uploads/stream.mp4", "20260218_220000")
+
+    assert created is created_video
+    mock_sqs_producer.send_message.assert_not_called()
+    build_event = mock_video_dao.create_video.call_args.kwargs["outbox_event"]
+    assert build_event(created_video) == {
+        "video_id": 7, "video_path": "/uploads/stream.mp4", "timestamp": "20260218_220000", "user_id": 3
+    }
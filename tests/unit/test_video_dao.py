@@ -1,46 +1,65 @@
+import json
+
 import pytest
 from types import SimpleNamespace
+from sqlalchemy import create_engine, event
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
 
 from app.dao.video_dao import VideoDAO
+from app.infrastructure.db.database import Base
+from app.models.outbox import OutboxMessage
+from app.models.video import Video
 
 
-def test_create_video_commits_and_refresh(monkeypatch):
-    class FakeSession:
-        def __init__(self):
-            self.added = None
-            self.committed = False
-            self.refreshed = None
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'videos.db'}")
+    Base.metadata.create_all(bind=engine, tables=[Video.__table__, OutboxMessage.__table__])
+    statements = []
 
-        def add(self, obj):
-            self.added = obj
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement.split()[0].upper())
 
-        def commit(self):
-            self.committed = True
+    session = sessionmaker(bind=engine, autoflush=False)()
+    session.statements = statements
+    yield session
+    session.close()
+    engine.dispose()
 
-        def refresh(self, obj):
-            self.refreshed = obj
 
-    fake_session = FakeSession()
-    dao = VideoDAO(fake_session)
+def _video_dto(**overrides):
+    values = dict(user_id=1, title="Test Video", file_path="/path/to/video.mp4", status=0)
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_create_video_is_a_single_insert_returning(db):
+    dao = VideoDAO(db)
 
-    video_dto = SimpleNamespace(
-        user_id=1,
-        title="Test Video",
-        file_path="/path/to/video.mp4",
-        status=0
-    )
-    
-    result = dao.create_video(video_dto)
+    db.statements.clear()
+    result = dao.create_video(_video_dto())
 
-    assert fake_session.added is not None
-    assert fake_session.committed is True
-    assert result is not None
+    assert db.statements == ["INSERT"]
+    assert result.id is not None
+    assert result.title == "Test Video"
+    assert result.status == 0
+    assert db.statements == ["INSERT"]
+    assert dao.get_video(result.id).file_path == "/path/to/video.mp4"
+
+
+def test_create_video_with_outbox_event_commits_both_rows(db):
+    result = VideoDAO(db).create_video(_video_dto(), outbox_event=lambda video: {"video_id": video.id})
+
+    message = db.query(OutboxMessage).one()
+    assert message.aggregate_id == result.id
+    assert json.loads(message.payload) == {"video_id": result.id}
 
 
 def test_create_video_rollback_on_integrity_error():
     class FakeSession:
-        def add(self, obj):
+        def execute(self, statement):
             raise IntegrityError("Duplicate", "", "")
 
         def rollback(self):
@@ -49,56 +68,48 @@ def test_create_video_rollback_on_integrity_error():
     fake_session = FakeSession()
     dao = VideoDAO(fake_session)
 
-    video_dto = SimpleNamespace(
-        user_id=1,
-        title="Test Video",
-        file_path="/path/to/video.mp4",
-        status=0
-    )
-
     with pytest.raises(Exception) as exc_info:
-        dao.create_video(video_dto)
+        dao.create_video(_video_dto())
 
     assert "Erro de integridade" in str(exc_info.value)
 
 
-def test_update_video_status():
-    class FakeVideo:
-        def __init__(self):
-            self.id = 1
-            self.user_id = 1
-            self.title = "Test"
-            self.file_path = "/old/path.mp4"
-            self.status = 0
+def test_update_video_status_is_a_single_update_returning(db):
+    dao = VideoDAO(db)
+    created = dao.create_video(_video_dto(file_path="/old/path.mp4"))
 
-    class FakeQuery:
-        def filter(self, condition):
-            return self
+    db.statements.clear()
+    result = dao.update_video_status(created.id, status=1, file_path="/new/path.zip")
 
-        def first(self):
-            return FakeVideo()
+    assert db.statements == ["UPDATE"]
+    assert result.id == created.id
+    assert result.user_id == 1
+    assert result.status == 1
+    assert result.file_path == "/new/path.zip"
+    assert db.statements == ["UPDATE"]
 
-    class FakeSession:
-        def __init__(self):
-            self.committed = False
-            self.refreshed = None
 
-        def query(self, model):
-            return FakeQuery()
+def test_update_video_status_keeps_file_path_when_not_given(db):
+    dao = VideoDAO(db)
+    created = dao.create_video(_video_dto())
 
-        def commit(self):
-            self.committed = True
+    assert dao.update_video_status(created.id, status=2).file_path == "/path/to/video.mp4"
 
-        def refresh(self, obj):
-            self.refreshed = obj
 
-    fake_session = FakeSession()
-    dao = VideoDAO(fake_session)
+def test_update_video_status_raises_when_missing(db):
+    with pytest.raises(Exception, match="não encontrado"):
+        VideoDAO(db).update_video_status(999, status=1)
 
-    result = dao.update_video_status(1, status=1, file_path="/new/path.zip")
 
-    assert fake_session.committed is True
-    assert result.status == 1
+def test_transition_status_only_applies_from_the_expected_status(db):
+    dao = VideoDAO(db)
+    created = dao.create_video(_video_dto(status=3))
+
+    db.statements.clear()
+    assert dao.transition_status(created.id, 3, 0).status == 0
+    assert dao.transition_status(created.id, 3, 2) is None
+    assert db.statements == ["UPDATE", "UPDATE"]
+    assert dao.get_video(created.id).status == 0
 
 
 def test_list_videos_by_user():
@@ -121,7 +132,7 @@ def test_list_videos_by_user():
             return [FakeVideo(1), FakeVideo(2), FakeVideo(3)]
 
     class FakeSession:
-        def query(self, model):
+        def query(self, *columns):
             return FakeQuery()
 
     fake_session = FakeSession()
@@ -145,7 +156,7 @@ def test_list_videos_empty():
             return []
 
     class FakeSession:
-        def query(self, model):
+        def query(self, *columns):
             return FakeQuery()
 
     fake_session = FakeSession()
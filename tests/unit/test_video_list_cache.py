@@ -0,0 +1,201 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.cache.backends import InMemoryCacheBackend
+from app.infrastructure.cache.video_list_cache import VideoListCache, get_video_list_cache, reset_video_list_cache
+from app.infrastructure.config.settings import reload_settings
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class BrokenBackend:
+    def get(self, key):
+        raise ConnectionError("down")
+
+    def set(self, key, value, ttl_seconds):
+        raise ConnectionError("down")
+
+    def incr(self, key):
+        raise ConnectionError("down")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_get_or_load_caches_until_ttl_expires():
+    clock = FakeClock()
+    cache = VideoListCache(ttl_seconds=10, clock=clock)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"status": "success", "data": [], "next_cursor": None}
+
+    cache.get_or_load(1, (50, None), loader)
+    cache.get_or_load(1, (50, None), loader)
+    assert len(calls) == 1
+
+    clock.now += 11
+    cache.get_or_load(1, (50, None), loader)
+    assert len(calls) == 2
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-4)
+
+
+def test_invalidate_drops_every_page_of_the_user_only():
+    cache = VideoListCache(ttl_seconds=60)
+    cache.set(1, (50, None), {"page": 1})
+    cache.set(1, (50, 10), {"page": 2})
+    cache.set(2, (50, None), {"other": True})
+
+    cache.invalidate(1)
+
+    assert cache.get(1, (50, None)) is None
+    assert cache.get(1, (50, 10)) is None
+    assert cache.get(2, (50, None)) == {"other": True}
+
+
+def test_invalidate_during_load_does_not_store_stale_value_as_current():
+    cache = VideoListCache(ttl_seconds=60, backend=InMemoryCacheBackend())
+    rows = {"data": ["antigo"]}
+
+    def loader():
+        value = dict(rows)
+        # Upload concorrente grava e invalida enquanto a consulta ainda está em andamento.
+        rows["data"] = ["antigo", "novo"]
+        cache.invalidate(1)
+        return value
+
+    assert cache.get_or_load(1, (50, None), loader) == {"data": ["antigo"]}
+    assert cache.get_or_load(1, (50, None), lambda: dict(rows)) == {"data": ["antigo", "novo"]}
+
+
+@pytest.mark.anyio
+async def test_invalidate_during_async_load_does_not_store_stale_value_as_current():
+    cache = VideoListCache(ttl_seconds=60)
+
+    async def loader():
+        cache.invalidate(1)
+        return '"v1"'
+
+    async def reload():
+        return '"v2"'
+
+    assert await cache.get_or_load_async(1, ("etag", 50, None), loader) == '"v1"'
+    assert await cache.get_or_load_async(1, ("etag", 50, None), reload) == '"v2"'
+
+
+def test_cache_backend_is_abstract():
+    from app.infrastructure.cache.backends import CacheBackend
+
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+def test_lru_evicts_oldest_entry():
+    cache = VideoListCache(ttl_seconds=60, max_entries=2)
+    cache.set(1, None, "a")
+    cache.set(2, None, "b")
+    cache.get(1, None)
+    cache.set(3, None, "c")
+
+    assert cache.get(2, None) is None
+    assert cache.get(1, None) == "a"
+    assert cache.stats()["size"] == 2
+
+
+def test_shared_backend_propagates_values_and_invalidation_across_nodes():
+    backend = InMemoryCacheBackend()
+    node_a = VideoListCache(ttl_seconds=60, backend=backend)
+    node_b = VideoListCache(ttl_seconds=60, backend=backend)
+
+    node_a.set(1, (50, None), {"data": [1]})
+    assert node_b.get(1, (50, None)) == {"data": [1]}
+    assert node_b.stats()["backend_hits"] == 1
+
+    node_a.invalidate(1)
+    assert node_b.get(1, (50, None)) is None
+
+
+def test_backend_failures_fall_back_to_local_cache():
+    cache = VideoListCache(ttl_seconds=60, backend=BrokenBackend())
+
+    cache.set(1, None, {"data": []})
+    cache.invalidate(1)
+    cache.set(1, None, {"data": [1]})
+
+    assert cache.get(1, None) == {"data": [1]}
+    assert cache.stats()["backend_errors"] > 0
+
+
+def test_zero_ttl_disables_cache():
+    cache = VideoListCache(ttl_seconds=0)
+    cache.set(1, None, "a")
+
+    assert cache.get(1, None) is None
+
+
+@pytest.mark.anyio
+async def test_get_or_load_async_awaits_loader_once():
+    cache = VideoListCache(ttl_seconds=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return {"data": []}
+
+    await cache.get_or_load_async(1, None, loader)
+    await cache.get_or_load_async(1, None, loader)
+
+    assert len(calls) == 1
+
+
+def test_get_video_list_cache_uses_settings(monkeypatch):
+    monkeypatch.setenv("VIDEO_LIST_CACHE_TTL_SECONDS", "3")
+    monkeypatch.setenv("VIDEO_LIST_CACHE_MAX_ENTRIES", "7")
+    reload_settings()
+    reset_video_list_cache()
+    cache = get_video_list_cache()
+
+    assert cache is get_video_list_cache()
+    assert cache.ttl_seconds == 3
+    assert cache.max_entries == 7
+    assert cache.backend is None
+
+
+def test_video_dao_writes_invalidate_user_listing():
+    from app.dao.video_dao import VideoDAO
+
+    class FakeResult:
+        def one(self):
+            return SimpleNamespace(_mapping={
+                "id": 1, "user_id": 5, "title": "Novo", "file_path": "/uploads/v.mp4", "status": 0, "content_hash": None,
+            })
+
+    class FakeSession:
+        def execute(self, _statement):
+            return FakeResult()
+
+        def commit(self):
+            pass
+
+    cache = get_video_list_cache()
+    cache.set(5, None, {"data": []})
+
+    VideoDAO(FakeSession()).create_video(
+        SimpleNamespace(user_id=5, title="Novo", file_path="/uploads/v.mp4", status=0)
+    )
+
+    assert cache.get(5, None) is None
@@ -1,3 +1,5 @@
+import hashlib
+import io
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -6,6 +8,7 @@ import shutil
 from fastapi import HTTPException
 
 from app.gateways.video_processing_gateway import VideoProcessingGateway
+from app.infrastructure.config.settings import reload_settings
 
 
 def test_processing_gateway_init():
@@ -19,19 +22,41 @@ def test_processing_gateway_init():
         assert gateway.temp_dir == base_dir / "temp"
 
 
-def test_processing_gateway_save_upload():
+def test_processing_gateway_save_upload(monkeypatch):
+    monkeypatch.setenv("UPLOAD_DEDUP_ENABLED", "true")
+    reload_settings()
     with tempfile.TemporaryDirectory() as tmpdir:
         base_dir = Path(tmpdir)
         gateway = VideoProcessingGateway(base_dir=base_dir)
 
         mock_file = Mock()
-        mock_file.file = Mock()
+        mock_file.filename = "video.mp4"
+        mock_file.file = io.BytesIO(b"video-bytes")
 
-        with patch('shutil.copyfileobj') as mock_copyfileobj:
-            result = gateway.save_upload(mock_file, "20260208_120000")
+        result = gateway.save_upload(mock_file, "20260208_120000")
 
         assert "20260208_120000" in str(result)
-        assert result.exists() or result.parent == gateway.uploads_dir
+        assert result.read_bytes() == b"video-bytes"
+
+
+def test_processing_gateway_store_upload_returns_hash_per_call(monkeypatch):
+    monkeypatch.setenv("UPLOAD_DEDUP_ENABLED", "true")
+    reload_settings()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gateway = VideoProcessingGateway(base_dir=Path(tmpdir))
+
+        first, second = Mock(), Mock()
+        first.filename, first.file = "a.mp4", io.BytesIO(b"first")
+        second.filename, second.file = "b.mp4", io.BytesIO(b"second")
+
+        path_a, hash_a, result_a = gateway.store_upload(first, "20260208_120000")
+        path_b, hash_b, _ = gateway.store_upload(second, "20260208_120000")
+
+        assert hash_a == hashlib.sha256(b"first").hexdigest()
+        assert hash_b == hashlib.sha256(b"second").hexdigest()
+        assert path_a.read_bytes() == b"first"
+        assert result_a is None
+        assert not hasattr(gateway, "last_content_hash")
 
 
 def test_processing_gateway_creates_directories():
@@ -54,6 +79,7 @@ def test_processing_gateway_production_requires_bucket(monkeypatch):
 
         monkeypatch.setenv("APP_ENV", "production")
         monkeypatch.delenv("AWS_S3_BUCKET", raising=False)
+        reload_settings()
 
         with pytest.raises(HTTPException) as exc_info:
             gateway.save_upload(mock_upload, "20260218_220000")
@@ -69,19 +95,25 @@ def test_processing_gateway_production_upload_to_s3(monkeypatch):
         mock_upload = Mock()
         mock_upload.filename = "video.mp4"
         mock_upload.file = Mock()
+        mock_upload.file.read.side_effect = [b"video-bytes", b""]
 
         mock_s3 = Mock()
 
         monkeypatch.setenv("APP_ENV", "production")
         monkeypatch.setenv("AWS_S3_BUCKET", "bucket-test")
+        reload_settings()
 
-        with patch("app.gateways.video_processing_gateway.boto3.client", return_value=mock_s3):
-            result = gateway.save_upload(mock_upload, "20260218_220001")
+        with patch("app.gateways.video_processing_gateway.get_s3_client", return_value=mock_s3):
+            result, content_hash, upload_result = gateway.store_upload(mock_upload, "20260218_220001")
 
         assert result == "s3://bucket-test/uploads/20260218_220001_video.mp4"
         mock_upload.file.seek.assert_called_once_with(0)
-        mock_s3.upload_fileobj.assert_called_once()
+        mock_s3.put_object.assert_called_once_with(
+            Bucket="bucket-test", Key="uploads/20260218_220001_video.mp4", Body=b"video-bytes"
+        )
         mock_upload.file.close.assert_called_once()
+        assert upload_result.size == len(b"video-bytes")
+        assert content_hash == upload_result.sha256
 
 
 def test_processing_gateway_production_upload_to_s3_handles_client_error(monkeypatch):
@@ -90,17 +122,136 @@ def test_processing_gateway_production_upload_to_s3_handles_client_error(monkeyp
         mock_upload = Mock()
         mock_upload.filename = "video.mp4"
         mock_upload.file = Mock()
+        mock_upload.file.read.side_effect = [b"video-bytes", b""]
 
         mock_s3 = Mock()
-        mock_s3.upload_fileobj.side_effect = Exception("upload failed")
+        mock_s3.put_object.side_effect = Exception("upload failed")
 
         monkeypatch.setenv("APP_ENV", "production")
         monkeypatch.setenv("AWS_S3_BUCKET", "bucket-test")
+        reload_settings()
 
-        with patch("app.gateways.video_processing_gateway.boto3.client", return_value=mock_s3):
+        with patch("app.gateways.video_processing_gateway.get_s3_client", return_value=mock_s3):
             with pytest.raises(HTTPException) as exc_info:
                 gateway.save_upload(mock_upload, "20260218_220002")
 
         assert exc_info.value.status_code == 500
         assert "Erro ao enviar arquivo para S3" in exc_info.value.detail
         mock_upload.file.close.assert_called()
+
+
+def test_open_upload_sink_local_writes_and_aborts(monkeypatch):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    reload_settings()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gateway = VideoProcessingGateway(base_dir=Path(tmpdir))
+
+        sink = gateway.open_upload_sink("../video.mp4", "20260218_220003")
+        sink.write(b"abc")
+        sink.write(b"def")
+        result = sink.close()
+
+        assert result == gateway.uploads_dir / "20260218_220003_video.mp4"
+        assert result.read_bytes() == b"abcdef"
+
+        aborted = gateway.open_upload_sink("other.mp4", "20260218_220004")
+        aborted.write(b"partial")
+        aborted.abort()
+
+        assert not (gateway.uploads_dir / "20260218_220004_other.mp4").exists()
+
+
+def test_open_upload_sink_s3_uses_multipart_for_large_files(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gateway = VideoProcessingGateway(base_dir=Path(tmpdir))
+        mock_s3 = Mock()
+        mock_s3.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        mock_s3.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+        monkeypatch.setenv("APP_ENV", "production")
+        monkeypatch.setenv("AWS_S3_BUCKET", "bucket-test")
+        reload_settings()
+
+        with patch("app.gateways.video_processing_gateway.get_s3_client", return_value=mock_s3):
+            sink = gateway.open_upload_sink("video.mp4", "20260218_220005")
+
+        part_size = sink.part_size
+        sink.write(b"a" * part_size)
+        sink.write(b"b" * 10)
+        result = sink.close()
+
+        assert result == "s3://bucket-test/uploads/20260218_220005_video.mp4"
+        assert mock_s3.upload_part.call_count == 2
+        mock_s3.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket-test",
+            Key="uploads/20260218_220005_video.mp4",
+            UploadId="up-1",
+            MultipartUpload={"Parts": [{"PartNumber": 1, "ETag": "etag-1"}, {"PartNumber": 2, "ETag": "etag-2"}]},
+        )
+        mock_s3.put_object.assert_not_called()
+
+
+def test_open_upload_sink_s3_small_file_and_abort(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gateway = VideoProcessingGateway(base_dir=Path(tmpdir))
+        mock_s3 = Mock()
+        mock_s3.create_multipart_upload.return_value = {"UploadId": "up-2"}
+        mock_s3.upload_part.return_value = {"ETag": "etag"}
+
+        monkeypatch.setenv("APP_ENV", "production")
+        monkeypatch.setenv("AWS_S3_BUCKET", "bucket-test")
+        reload_settings()
+
+        with patch("app.gateways.video_processing_gateway.get_s3_client", return_value=mock_s3):
+            small = gateway.open_upload_sink("small.mp4", "20260218_220006")
+            large = gateway.open_upload_sink("large.mp4", "20260218_220007")
+
+        small.write(b"tiny")
+        small.close()
+        mock_s3.put_object.assert_called_once_with(
+            Bucket="bucket-test", Key="uploads/20260218_220006_small.mp4", Body=b"tiny"
+        )
+
+        large.write(b"a" * large.part_size)
+        large.abort()
+        mock_s3.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket-test", Key="uploads/20260218_220007_large.mp4", UploadId="up-2"
+        )
+
+
+def test_open_upload_sink_production_requires_bucket(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gateway = VideoProcessingGateway(base_dir=Path(tmpdir))
+
+        monkeypatch.setenv("APP_ENV", "production")
+        monkeypatch.delenv("AWS_S3_BUCKET", raising=False)
+        reload_settings()
+
+        with pytest.raises(HTTPException) as exc_info:
+            gateway.open_upload_sink("video.mp4", "20260218_220008")
+
+        assert exc_info.value.status_code == 500
+
+
+def test_store_by_hash_moves_file_to_content_path_and_reuses_existing(tmp_path):
+    gateway = VideoProcessingGateway(base_dir=tmp_path)
+    content_hash = hashlib.sha256(b"same").hexdigest()
+    first = gateway.uploads_dir / "1_a.MP4"
+    second = gateway.uploads_dir / "2_b.mp4"
+    first.write_bytes(b"same")
+    second.write_bytes(b"same")
+
+    stored = gateway.store_by_hash(first, 7, content_hash)
+
+    assert stored == str(gateway.uploads_dir / "objects" / "7" / content_hash[:2] / f"{content_hash}.mp4")
+    assert not first.exists()
+    assert gateway.store_by_hash(second, 7, content_hash) == stored
+    assert not second.exists()
+    assert Path(stored).read_bytes() == b"same"
+
+
+def test_store_by_hash_keeps_s3_key(tmp_path):
+    gateway = VideoProcessingGateway(base_dir=tmp_path)
+
+    assert gateway.store_by_hash("s3://bucket/uploads/x.mp4", 7, "ab" * 32) == "s3://bucket/uploads/x.mp4"
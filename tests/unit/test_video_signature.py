@@ -0,0 +1,52 @@
+import pytest
+
+from app.adapters.utils.video_signature import (
+    VideoSignatureError,
+    VideoSignatureValidator,
+    check_video_signature,
+    sniff_video_container,
+)
+
+MP4_HEAD = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00"
+
+
+def test_sniff_video_container_recognizes_supported_headers():
+    assert sniff_video_container(MP4_HEAD) == "mp4"
+    assert sniff_video_container(b"\x00\x00\x00\x08wide\x00\x00\x00\x00mdat") == "mp4"
+    assert sniff_video_container(b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81") == "matroska"
+    assert sniff_video_container(b"RIFF\x00\x00\x00\x00AVI LIST") == "avi"
+    assert sniff_video_container(b"FLV\x01\x05\x00\x00\x00\x09") == "flv"
+    assert sniff_video_container(bytes.fromhex("3026b2758e66cf11a6d900aa0062ce6c")) == "asf"
+    assert sniff_video_container(b"%PDF-1.7\n") is None
+    assert sniff_video_container(b"") is None
+
+
+@pytest.mark.parametrize("filename", ["video.mp4", "clip.MOV"])
+def test_check_video_signature_accepts_matching_extension(filename):
+    assert check_video_signature(MP4_HEAD, filename) == "mp4"
+
+
+def test_check_video_signature_rejects_mismatch_and_junk():
+    with pytest.raises(VideoSignatureError):
+        check_video_signature(MP4_HEAD, "video.mkv")
+
+    with pytest.raises(VideoSignatureError):
+        check_video_signature(b"\x89PNG\r\n\x1a\n" + b"\x00" * 8, "video.mp4")
+
+
+def test_validator_decides_once_head_is_complete():
+    validator = VideoSignatureValidator("video.webm")
+
+    assert validator.feed(b"\x1a\x45") is False
+    assert validator.feed(b"\xdf\xa3" + b"\x00" * 12) is True
+    assert validator.container == "matroska"
+    # Bytes seguintes não são mais inspecionados.
+    assert validator.feed(b"junk") is True
+
+
+def test_validator_finish_checks_short_files():
+    validator = VideoSignatureValidator("video.mp4")
+    validator.feed(b"abc")
+
+    with pytest.raises(VideoSignatureError):
+        validator.finish()